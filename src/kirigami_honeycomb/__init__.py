@@ -4,16 +4,46 @@ from .cross_section import (
     CrossSectionSamples,
     sample_cross_section,
     linearize_cross_section,
+    linearize_cross_sections,
 )
-from .fold_pattern import FoldPattern, compute_fold_pattern
-from .honeycomb import HexGrid, generate_hex_grid
+from .fold_pattern import (
+    FoldPattern,
+    VertexLayout,
+    compute_fold_pattern,
+    compute_fold_patterns,
+    fold_line_gap,
+)
+from .honeycomb import (
+    ClippedHexGrid,
+    HexGrid,
+    HexLattice,
+    HoneycombMesh,
+    build_honeycomb_mesh,
+    generate_envelope_grid,
+    generate_hex_grid,
+    generate_hex_lattice,
+)
+from .segments import SegmentKind, SegmentTable, build_segment_table
 
 __all__ = [
     "CrossSectionSamples",
     "sample_cross_section",
     "linearize_cross_section",
+    "linearize_cross_sections",
     "FoldPattern",
     "compute_fold_pattern",
+    "compute_fold_patterns",
+    "VertexLayout",
+    "fold_line_gap",
     "HexGrid",
     "generate_hex_grid",
+    "HexLattice",
+    "generate_hex_lattice",
+    "ClippedHexGrid",
+    "generate_envelope_grid",
+    "HoneycombMesh",
+    "build_honeycomb_mesh",
+    "SegmentKind",
+    "SegmentTable",
+    "build_segment_table",
 ]
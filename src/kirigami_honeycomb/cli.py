@@ -2,29 +2,18 @@
 from __future__ import annotations
 
 import argparse
-import math
 from pathlib import Path
-from typing import Callable
-
-import numpy as np
 
 from .cross_section import linearize_cross_section, sample_cross_section
+from .expression import CompiledExpression, compile_expression
 from .fold_pattern import compute_fold_pattern
 from .svg import export_fold_diagram
 
-FunctionFactory = Callable[[float], float]
-
-
-def _parse_function(expression: str) -> FunctionFactory:
-    """Create a math-aware lambda from the provided expression."""
-
-    allowed_names = {name: getattr(math, name) for name in dir(math) if not name.startswith("_")}
-    allowed_names.update({"np": np, "numpy": np})
 
-    def func(x: float) -> float:
-        return eval(expression, {"__builtins__": {}}, {**allowed_names, "x": x})
+def _parse_function(expression: str) -> CompiledExpression:
+    """Compile the provided expression into a vectorised, validated function."""
 
-    return func
+    return compile_expression(expression)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,6 +28,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Apply the foldable linear approximation before computing the fold pattern",
     )
+    parser.add_argument(
+        "--conservative",
+        action="store_true",
+        help="Linearise and offset the approximation so it contains the original curves",
+    )
     return parser
 
 
@@ -46,11 +40,19 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    upper = _parse_function(args.upper)
-    lower = _parse_function(args.lower)
-
-    samples = sample_cross_section(upper, lower, domain=tuple(args.domain), cell_size=args.cell_size)
-    if args.linearise:
+    try:
+        upper = _parse_function(args.upper)
+        lower = _parse_function(args.lower)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    try:
+        samples = sample_cross_section(upper, lower, domain=tuple(args.domain), cell_size=args.cell_size)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.conservative:
+        samples = linearize_cross_section(samples, reference=(upper, lower))
+    elif args.linearise:
         samples = linearize_cross_section(samples)
     pattern = compute_fold_pattern(samples)
     output = Path(args.output)
@@ -123,19 +123,150 @@ def sample_cross_section(
     return CrossSectionSamples(x_values, upper_samples, lower_samples, float(cell_size))
 
 
-def linearize_cross_section(samples: CrossSectionSamples) -> CrossSectionSamples:
-    """Apply the foldable linear approximation described by Saito et al."""
+def linearize_cross_section(
+    samples: CrossSectionSamples,
+    *,
+    in_place: bool = False,
+    reference: Tuple[CurveFunction, CurveFunction] | CrossSectionSamples | None = None,
+    oversample: int = 16,
+) -> CrossSectionSamples:
+    """Apply the foldable linear approximation described by Saito et al.
+
+    With ``in_place=True`` the sample arrays of *samples* are overwritten and
+    *samples* itself is returned, avoiding any copies.
+
+    Passing a *reference* enables the conservative mode, in which the result
+    is offset just enough to contain the reference geometry: either the
+    ``(upper, lower)`` curve functions, evaluated ``oversample`` times per
+    half-cell interval, or a densely sampled envelope such as the result of
+    :func:`~kirigami_honeycomb.mesh_io.sample_mesh_cross_section` with a small
+    ``spacing``, compared at its own sample positions. See
+    :func:`_contain_reference` for how the offset is chosen.
+    """
 
     if samples.x.size < 3:
         raise ValueError("At least three samples are required for linearisation.")
+    if reference is not None:
+        dense_x, dense_upper, dense_lower = _reference_envelope(samples.x, reference, oversample)
+
+    if in_place:
+        result = samples
+    else:
+        result = CrossSectionSamples(samples.x.copy(), samples.upper.copy(), samples.lower.copy(), samples.cell_size)
+    _linearize_arrays(result.upper, result.lower)
+    if reference is not None:
+        _contain_reference(result, dense_x, dense_upper, dense_lower)
+        _linearize_arrays(result.upper, result.lower)
+    return result
+
+
+def linearize_cross_sections(
+    upper: ArrayLike,
+    lower: ArrayLike,
+    *,
+    in_place: bool = False,
+) -> Tuple[FloatArray, FloatArray]:
+    """Linearise a ``(n_sections, n_samples)`` stack of cross sections at once.
+
+    Every row is treated like the samples of :func:`linearize_cross_section`.
+    With ``in_place=True`` the provided arrays are overwritten; they must then
+    already be floating-point numpy arrays.
+    """
+
+    if in_place:
+        if not isinstance(upper, np.ndarray) or not isinstance(lower, np.ndarray):
+            raise TypeError("In-place linearisation requires numpy arrays.")
+        if upper.dtype.kind != "f" or lower.dtype.kind != "f":
+            raise TypeError("In-place linearisation requires floating-point arrays.")
+        upper_stack, lower_stack = upper, lower
+    else:
+        upper_stack = np.array(upper, dtype=float)
+        lower_stack = np.array(lower, dtype=float)
+
+    if upper_stack.ndim != 2 or lower_stack.ndim != 2:
+        raise ValueError("upper and lower must be two-dimensional (n_sections, n_samples) arrays.")
+    if upper_stack.shape != lower_stack.shape:
+        raise ValueError("upper and lower stacks must share the same shape.")
+    if upper_stack.shape[1] < 3:
+        raise ValueError("At least three samples are required for linearisation.")
+
+    _linearize_arrays(upper_stack, lower_stack)
+    return upper_stack, lower_stack
+
+
+def _linearize_arrays(upper: np.ndarray, lower: np.ndarray) -> None:
+    """Linearise *upper* and *lower* in place along their last axis.
 
-    upper = samples.upper.copy()
-    lower = samples.lower.copy()
+    Odd upper samples and even interior lower samples are replaced by the mean
+    of their neighbours. The targets and sources never share an index parity,
+    so the strided views can be written directly without temporaries.
+    """
 
-    for index in range(1, upper.size - 1, 2):
-        upper[index] = (samples.upper[index - 1] + samples.upper[index + 1]) / 2.0
+    upper_targets = upper[..., 1:-1:2]
+    np.add(upper[..., :-2:2], upper[..., 2::2], out=upper_targets)
+    upper_targets /= 2.0
 
-    for index in range(2, lower.size - 1, 2):
-        lower[index] = (samples.lower[index - 1] + samples.lower[index + 1]) / 2.0
+    lower_targets = lower[..., 2:-1:2]
+    np.add(lower[..., 1:-2:2], lower[..., 3::2], out=lower_targets)
+    lower_targets /= 2.0
+
+
+def _reference_envelope(
+    x: FloatArray,
+    reference: Tuple[CurveFunction, CurveFunction] | CrossSectionSamples,
+    oversample: int,
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    """Sorted positions within ``x[0]..x[-1]`` and the reference heights there."""
+
+    if isinstance(reference, CrossSectionSamples):
+        inside = (reference.x >= x[0]) & (reference.x <= x[-1])
+        dense_x = np.union1d(x, reference.x[inside])
+        order = np.argsort(reference.x, kind="stable")
+        envelope_x = reference.x[order]
+        return (
+            dense_x,
+            np.interp(dense_x, envelope_x, reference.upper[order]),
+            np.interp(dense_x, envelope_x, reference.lower[order]),
+        )
 
-    return CrossSectionSamples(samples.x.copy(), upper, lower, samples.cell_size)
+    if oversample < 1:
+        raise ValueError("oversample must be at least one.")
+    upper, lower = reference
+    t = np.arange(oversample) / oversample
+    dense_x = np.append((x[:-1, np.newaxis] + t * np.diff(x)[:, np.newaxis]).reshape(-1), x[-1])
+    return dense_x, _evaluate_function(upper, dense_x), _evaluate_function(lower, dense_x)
+
+
+def _contain_reference(
+    samples: CrossSectionSamples,
+    dense_x: FloatArray,
+    dense_upper: FloatArray,
+    dense_lower: FloatArray,
+) -> None:
+    """Lift the defining vertices of linearised *samples* above the reference.
+
+    The linearised upper curve is a polyline through the even samples and
+    the last one, the lower curve through the first, the odd and the last
+    samples; the remaining samples lie on these polylines. For every
+    polyline segment the worst violation over the dense positions inside it
+    is found with one segmented maximum. Raising both defining vertices of
+    each segment by the larger violation of its two neighbouring segments
+    moves every segment by at least its own violation, which contains the
+    reference at all dense positions in a single pass.
+    """
+
+    x = samples.x
+    count = x.size
+    interval = np.clip(np.searchsorted(x, dense_x, side="right") - 1, 0, count - 2)
+    for values, reference, first, direction in (
+        (samples.upper, dense_upper, 0, 1.0),
+        (samples.lower, dense_lower, 1, -1.0),
+    ):
+        defining = np.unique(np.r_[0, np.arange(first, count, 2), count - 1])
+        violation = np.maximum(direction * (reference - np.interp(dense_x, x, values)), 0.0)
+        segment = np.searchsorted(defining, interval, side="right") - 1
+        starts = np.flatnonzero(np.r_[True, segment[1:] != segment[:-1]])
+        worst = np.zeros(defining.size - 1)
+        worst[segment[starts]] = np.maximum.reduceat(violation, starts)
+        lift = np.maximum(np.r_[0.0, worst], np.r_[worst, 0.0])
+        values[defining] += direction * lift
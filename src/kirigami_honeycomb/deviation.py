@@ -0,0 +1,119 @@
+"""Deviation of a honeycomb core from the source mesh it approximates."""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .honeycomb import HoneycombMesh
+from .spatial import SharedTriangleGrid, attach_triangle_grid, build_triangle_grid, share_triangle_grid
+
+
+FloatArray = NDArray[np.float64]
+
+__all__ = ["DeviationReport", "analyse_deviation", "wall_edge_samples"]
+
+
+@dataclass(frozen=True)
+class DeviationReport:
+    """Distances from sample points on the honeycomb walls to the source mesh.
+
+    ``distances[w]`` holds the distances of the samples of wall ``w``;
+    ``wall_max`` and ``wall_rms`` summarise them per wall. ``counts`` and
+    ``bin_edges`` form a histogram over all samples as returned by
+    :func:`numpy.histogram`.
+    """
+
+    distances: FloatArray
+    wall_max: FloatArray
+    wall_rms: FloatArray
+    counts: NDArray[np.int64]
+    bin_edges: FloatArray
+
+    @property
+    def max_error(self) -> float:
+        return float(self.distances.max(initial=0.0))
+
+    @property
+    def rms_error(self) -> float:
+        return float(np.sqrt(np.mean(np.square(self.distances)))) if self.distances.size else 0.0
+
+    def summary(self) -> str:
+        """Short text histogram, one line per bin."""
+
+        lines = [f"max {self.max_error:.4f}  rms {self.rms_error:.4f}  samples {self.distances.size}"]
+        total = max(int(self.counts.sum()), 1)
+        for low, high, count in zip(self.bin_edges[:-1], self.bin_edges[1:], self.counts):
+            lines.append(f"{low:10.4f} - {high:10.4f}  {int(count):9d}  {'#' * int(round(50 * count / total))}")
+        return "\n".join(lines)
+
+
+def wall_edge_samples(mesh: HoneycombMesh, *, samples_per_edge: int = 3) -> FloatArray:
+    """Points spaced evenly along the top and bottom edge of every wall.
+
+    Returns an ``(n_walls, 2 * samples_per_edge, 3)`` array, top edge first.
+    These edges form the outer skin of the core, so they should lie on the
+    source surface.
+    """
+
+    if samples_per_edge < 2:
+        raise ValueError("samples_per_edge must be at least two.")
+    quads = mesh.wall_quads
+    t = np.linspace(0.0, 1.0, samples_per_edge)[np.newaxis, :, np.newaxis]
+    top = quads[:, np.newaxis, 0] + t * (quads[:, np.newaxis, 1] - quads[:, np.newaxis, 0])
+    bottom = quads[:, np.newaxis, 3] + t * (quads[:, np.newaxis, 2] - quads[:, np.newaxis, 3])
+    return np.concatenate((top, bottom), axis=1)
+
+
+def analyse_deviation(
+    triangles: ArrayLike,
+    mesh: HoneycombMesh,
+    *,
+    samples_per_edge: int = 3,
+    bins: int = 20,
+    cell_size: float | None = None,
+    chunk_size: int = 1 << 14,
+    processes: int | None = None,
+) -> DeviationReport:
+    """Measure how far the honeycomb *mesh* deviates from the source *triangles*.
+
+    The top and bottom wall edges are sampled with :func:`wall_edge_samples`
+    and every sample is matched to its closest source point through a
+    :class:`~kirigami_honeycomb.spatial.TriangleGrid`. With ``processes``
+    greater than one the samples are split into blocks queried by a process
+    pool that reads the grid from shared memory.
+    """
+
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be at least one")
+    grid = build_triangle_grid(triangles, cell_size=cell_size)
+    samples = wall_edge_samples(mesh, samples_per_edge=samples_per_edge)
+    points = samples.reshape(-1, 3)
+
+    if processes is None or processes == 1 or points.shape[0] < 2:
+        distances = grid.closest_points(points, chunk_size=chunk_size)[0]
+    else:
+        blocks = np.array_split(points, min(processes, points.shape[0]))
+        with ExitStack() as stack:
+            handle = stack.enter_context(share_triangle_grid(grid))
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=processes))
+            futures = [pool.submit(_distance_worker, handle, block, chunk_size) for block in blocks]
+            distances = np.concatenate([future.result() for future in futures])
+
+    distances = distances.reshape(samples.shape[:2])
+    counts, bin_edges = np.histogram(distances, bins=bins)
+    return DeviationReport(
+        distances,
+        distances.max(axis=1, initial=0.0),
+        np.sqrt(np.mean(np.square(distances), axis=1)),
+        counts,
+        bin_edges,
+    )
+
+
+def _distance_worker(handle: SharedTriangleGrid, points: FloatArray, chunk_size: int) -> FloatArray:
+    with attach_triangle_grid(handle) as grid:
+        return grid.closest_points(points, chunk_size=chunk_size)[0]
@@ -0,0 +1,208 @@
+"""DXF export of fold line diagrams with laser-travel-optimised ordering."""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Set, TextIO, Tuple
+
+import numpy as np
+
+from .segments import PolylineSet, SegmentKind, SegmentTable, chain_segments, merge_collinear_segments
+
+
+__all__ = ["DxfExportReport", "export_dxf", "order_polylines", "travel_distance"]
+
+LAYERS: Mapping[SegmentKind, Tuple[str, int]] = {
+    SegmentKind.CUT: ("CUT", 7),
+    SegmentKind.FOLD: ("FOLD", 3),
+    SegmentKind.PERFORATION: ("PERFORATION", 1),
+    SegmentKind.MARK: ("MARK", 5),
+}
+
+
+@dataclass(frozen=True)
+class DxfExportReport:
+    """Summary of a DXF export, including laser head travel between cuts."""
+
+    segments: int
+    polylines: int
+    travel_before: float
+    travel_after: float
+
+    @property
+    def travel_saved(self) -> float:
+        return self.travel_before - self.travel_after
+
+
+def travel_distance(polylines: PolylineSet, *, origin: Tuple[float, float] = (0.0, 0.0)) -> float:
+    """Non-cutting head travel when the polylines are cut in their stored order."""
+
+    if len(polylines) == 0:
+        return 0.0
+    previous = np.vstack((np.asarray(origin, dtype=float), polylines.last_points[:-1]))
+    return float(np.hypot(*(polylines.first_points - previous).T).sum())
+
+
+def order_polylines(
+    polylines: PolylineSet,
+    *,
+    origin: Tuple[float, float] = (0.0, 0.0),
+) -> PolylineSet:
+    """Reorder and orient polylines to shorten the travel between them.
+
+    A greedy nearest-neighbour tour starts at ``origin`` and repeatedly moves
+    to the closest free polyline end, reversing the polyline when it is
+    entered from its last point. Candidate ends are looked up in a uniform
+    grid, so each step only inspects the cells around the head position.
+    """
+
+    count = len(polylines)
+    if count < 2:
+        return polylines
+
+    ends = np.vstack((polylines.first_points, polylines.last_points))
+    low = ends.min(axis=0)
+    extent = np.maximum(ends.max(axis=0) - low, 1e-12)
+    cell = max(math.sqrt(float(extent[0] * extent[1]) / count), float(extent.max()) / count, 1e-12)
+    cells = np.floor((ends - low) / cell).astype(np.int64)
+    max_ring = int(max(cells.max(axis=0))) + 1
+
+    grid: Dict[Tuple[int, int], Set[int]] = {}
+    for end, key in enumerate(map(tuple, cells.tolist())):
+        grid.setdefault(key, set()).add(end)
+
+    coordinates = ends.tolist()
+    cell_of = [tuple(key) for key in cells.tolist()]
+    position = (float(origin[0]), float(origin[1]))
+    order: List[int] = []
+    reversed_flags: List[bool] = []
+
+    for _ in range(count):
+        column = math.floor((position[0] - low[0]) / cell)
+        row = math.floor((position[1] - low[1]) / cell)
+        best = -1
+        best_distance = math.inf
+        ring = 0
+        # Rings beyond the best distance found so far cannot hold anything closer.
+        while best < 0 or (ring - 1) * cell <= best_distance:
+            for key in _ring(column, row, ring):
+                for end in grid.get(key, ()):
+                    x, y = coordinates[end]
+                    distance = math.hypot(x - position[0], y - position[1])
+                    if distance < best_distance or (distance == best_distance and end < best):
+                        best, best_distance = end, distance
+            ring += 1
+            if ring > max_ring + abs(column) + abs(row) + 1:
+                break
+
+        polyline = best % count
+        entered_from_end = best >= count
+        order.append(polyline)
+        reversed_flags.append(entered_from_end)
+        for end in (polyline, polyline + count):
+            grid[cell_of[end]].discard(end)
+        exit_end = polyline if entered_from_end else polyline + count
+        position = (coordinates[exit_end][0], coordinates[exit_end][1])
+
+    return _reorder(polylines, np.asarray(order), np.asarray(reversed_flags))
+
+
+def export_dxf(
+    table: SegmentTable,
+    output: Path,
+    *,
+    tolerance: float = 1e-6,
+    optimise: bool = True,
+    merge: bool = True,
+    origin: Tuple[float, float] = (0.0, 0.0),
+) -> DxfExportReport:
+    """Write *table* as an ASCII DXF file with one layer per stroke class.
+
+    With ``merge`` enabled, overlapping collinear segments are first combined
+    by :func:`~kirigami_honeycomb.segments.merge_collinear_segments`.
+    Touching segments are chained into polylines with
+    :func:`~kirigami_honeycomb.segments.chain_segments` and, with
+    ``optimise`` enabled, ordered by :func:`order_polylines`. The returned
+    report compares the head travel of the original segment order with the
+    travel of the written file.
+    """
+
+    single_segments = PolylineSet(
+        np.stack((table.start, table.end), axis=1).reshape(-1, 2),
+        np.arange(0, 2 * len(table) + 1, 2),
+        table.kind,
+    )
+    merged = merge_collinear_segments(table, tolerance=tolerance) if merge else table
+    polylines = chain_segments(merged, tolerance=tolerance)
+    if optimise:
+        polylines = order_polylines(polylines, origin=origin)
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="ascii", newline="\r\n") as handle:
+        _write_header(handle, table)
+        handle.write("0\nSECTION\n2\nENTITIES\n")
+        _write_polylines(handle, polylines)
+        handle.write("0\nENDSEC\n0\nEOF\n")
+
+    return DxfExportReport(
+        segments=len(table),
+        polylines=len(polylines),
+        travel_before=travel_distance(single_segments, origin=origin),
+        travel_after=travel_distance(polylines, origin=origin),
+    )
+
+
+def _ring(column: int, row: int, radius: int):
+    """Grid cells at Chebyshev distance *radius* around ``(column, row)``."""
+
+    if radius == 0:
+        yield (column, row)
+        return
+    for offset in range(-radius, radius + 1):
+        yield (column + offset, row - radius)
+        yield (column + offset, row + radius)
+    for offset in range(-radius + 1, radius):
+        yield (column - radius, row + offset)
+        yield (column + radius, row + offset)
+
+
+def _reorder(polylines: PolylineSet, order: np.ndarray, flip: np.ndarray) -> PolylineSet:
+    """Gather polylines in *order*, reversing those flagged in *flip*."""
+
+    starts = polylines.offsets[:-1][order]
+    counts = np.diff(polylines.offsets)[order]
+    local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    local = np.where(np.repeat(flip, counts), np.repeat(counts, counts) - 1 - local, local)
+    points = polylines.points[np.repeat(starts, counts) + local]
+    return PolylineSet(points, np.concatenate(([0], np.cumsum(counts))), polylines.kind[order])
+
+
+def _write_header(handle: TextIO, table: SegmentTable) -> None:
+    min_x, min_y, max_x, max_y = table.bounds
+    handle.write("0\nSECTION\n2\nHEADER\n")
+    handle.write("9\n$ACADVER\n1\nAC1009\n")
+    handle.write("9\n$INSUNITS\n70\n4\n")
+    handle.write(f"9\n$EXTMIN\n10\n{min_x:.6f}\n20\n{min_y:.6f}\n")
+    handle.write(f"9\n$EXTMAX\n10\n{max_x:.6f}\n20\n{max_y:.6f}\n")
+    handle.write("0\nENDSEC\n")
+    handle.write("0\nSECTION\n2\nTABLES\n0\nTABLE\n2\nLAYER\n")
+    handle.write(f"70\n{len(LAYERS)}\n")
+    for name, color in LAYERS.values():
+        handle.write(f"0\nLAYER\n2\n{name}\n70\n0\n62\n{color}\n6\nCONTINUOUS\n")
+    handle.write("0\nENDTAB\n0\nENDSEC\n")
+
+
+def _write_polylines(handle: TextIO, polylines: PolylineSet) -> None:
+    """Stream every polyline as a POLYLINE/VERTEX/SEQEND entity group."""
+
+    offsets = polylines.offsets.tolist()
+    coordinates = polylines.points.ravel().tolist()
+    for index, kind in enumerate(polylines.kind.tolist()):
+        layer = LAYERS[SegmentKind(kind)][0]
+        first, last = offsets[index], offsets[index + 1]
+        vertex = f"0\nVERTEX\n8\n{layer}\n10\n%.6f\n20\n%.6f\n"
+        handle.write(f"0\nPOLYLINE\n8\n{layer}\n66\n1\n70\n0\n")
+        handle.write((vertex * (last - first)) % tuple(coordinates[2 * first : 2 * last]))
+        handle.write(f"0\nSEQEND\n8\n{layer}\n")
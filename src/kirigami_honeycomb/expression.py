@@ -0,0 +1,244 @@
+"""Safe, vectorised evaluation of analytic cross-section expressions."""
+from __future__ import annotations
+
+import ast
+import math
+from dataclasses import dataclass, field
+from types import CodeType, SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+
+def _log(values: ArrayLike, base: Optional[ArrayLike] = None) -> np.ndarray:
+    """Vectorised counterpart of :func:`math.log` including its optional base."""
+
+    if base is None:
+        return np.log(values)
+    return np.log(values) / np.log(base)
+
+
+# ``math`` names mapped onto their NumPy equivalents so that a compiled
+# expression always evaluates a whole sample array in one call.
+_FUNCTIONS: Dict[str, object] = {
+    "abs": np.abs,
+    "fabs": np.fabs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "expm1": np.expm1,
+    "log": _log,
+    "log2": np.log2,
+    "log10": np.log10,
+    "log1p": np.log1p,
+    "pow": np.power,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "atan2": np.arctan2,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "asinh": np.arcsinh,
+    "acosh": np.arccosh,
+    "atanh": np.arctanh,
+    "hypot": np.hypot,
+    "degrees": np.degrees,
+    "radians": np.radians,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "trunc": np.trunc,
+    "copysign": np.copysign,
+    "fmod": np.fmod,
+    "min": np.minimum,
+    "max": np.maximum,
+}
+
+_CONSTANTS: Dict[str, float] = {
+    "pi": math.pi,
+    "e": math.e,
+    "tau": math.tau,
+    "inf": math.inf,
+    "nan": math.nan,
+}
+
+# Attributes reachable through the ``np``/``numpy`` prefix.
+_NUMPY_NAMES = (
+    "abs",
+    "absolute",
+    "sqrt",
+    "cbrt",
+    "exp",
+    "expm1",
+    "log",
+    "log2",
+    "log10",
+    "log1p",
+    "power",
+    "sin",
+    "cos",
+    "tan",
+    "arcsin",
+    "arccos",
+    "arctan",
+    "arctan2",
+    "sinh",
+    "cosh",
+    "tanh",
+    "arcsinh",
+    "arccosh",
+    "arctanh",
+    "hypot",
+    "degrees",
+    "radians",
+    "floor",
+    "ceil",
+    "trunc",
+    "sign",
+    "minimum",
+    "maximum",
+    "clip",
+    "pi",
+    "e",
+)
+_NUMPY_MODULES = ("np", "numpy")
+
+_NAMESPACE: Dict[str, object] = {"__builtins__": {}}
+_NAMESPACE.update(_FUNCTIONS)
+_NAMESPACE.update(_CONSTANTS)
+_NAMESPACE.update(
+    {module: SimpleNamespace(**{name: getattr(np, name) for name in _NUMPY_NAMES}) for module in _NUMPY_MODULES}
+)
+
+# Accepted positional argument counts of the non-ufunc functions; ufuncs take exactly ``nin``.
+_ARITY: Dict[object, Tuple[int, int]] = {_log: (1, 2), np.clip: (3, 3)}
+
+_BINARY_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_UNARY_OPERATORS = (ast.UAdd, ast.USub)
+_VARIABLE = "x"
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """Validated expression of ``x`` that evaluates whole arrays at once."""
+
+    source: str
+    code: CodeType = field(repr=False)
+
+    def __call__(self, x: ArrayLike) -> np.ndarray:
+        # A copy keeps the caller's array safe even if a function writes to its input.
+        values = np.array(x, dtype=float)
+        try:
+            return np.asarray(eval(self.code, _NAMESPACE, {_VARIABLE: values}), dtype=float)
+        except OverflowError as exc:
+            raise ValueError(f"Evaluating {self.source!r} overflowed: {exc}") from exc
+
+
+def compile_expression(expression: str) -> CompiledExpression:
+    """Parse, validate and compile *expression* into a :class:`CompiledExpression`.
+
+    Only arithmetic operators, numeric literals, the variable ``x``, the
+    constants and functions of :mod:`math` (mapped to NumPy ufuncs) and a
+    small whitelist of ``np.``/``numpy.`` functions are accepted. Anything
+    else raises :class:`ValueError`, so user input is never executed as
+    arbitrary Python code.
+    """
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid expression {expression!r}: {exc.msg}") from exc
+
+    _validate_node(tree.body, expression)
+    # Integer literals would be evaluated with unbounded Python integers, so an expression such as
+    # ``9**9**9**9`` could run for hours; as floats it overflows at once.
+    tree = ast.fix_missing_locations(_FloatLiterals().visit(tree))
+
+    return CompiledExpression(expression, compile(tree, "<expression>", "eval"))
+
+
+class _FloatLiterals(ast.NodeTransformer):
+    """Turn every integer literal of a validated expression into a float literal."""
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:
+        if isinstance(node.value, int):
+            try:
+                value = float(node.value)
+            except OverflowError as exc:
+                raise ValueError(f"Integer literal {node.value} is too large") from exc
+            return ast.copy_location(ast.Constant(value), node)
+        return node
+
+
+def _validate_node(node: ast.AST, expression: str) -> None:
+    """Recursively check that *node* only uses the supported expression subset."""
+
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, _BINARY_OPERATORS):
+            raise ValueError(f"Unsupported operator {type(node.op).__name__} in {expression!r}")
+        _validate_node(node.left, expression)
+        _validate_node(node.right, expression)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _UNARY_OPERATORS):
+            raise ValueError(f"Unsupported operator {type(node.op).__name__} in {expression!r}")
+        _validate_node(node.operand, expression)
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Only numeric literals are allowed in {expression!r}")
+    elif isinstance(node, ast.Name):
+        if node.id != _VARIABLE and node.id not in _CONSTANTS:
+            raise ValueError(f"Unknown name {node.id!r} in {expression!r}")
+    elif isinstance(node, ast.Attribute):
+        # Only constants such as ``np.pi`` may be used outside of a call.
+        if _numpy_attribute(node) not in _CONSTANTS:
+            raise ValueError(f"Unsupported attribute access in {expression!r}")
+    elif isinstance(node, ast.Call):
+        if node.keywords:
+            raise ValueError(f"Keyword arguments are not supported in {expression!r}")
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+            if name not in _FUNCTIONS:
+                raise ValueError(f"Unknown function {name!r} in {expression!r}")
+            function = _FUNCTIONS[name]
+        elif isinstance(node.func, ast.Attribute):
+            name = _numpy_attribute(node.func)
+            if name is None or name in _CONSTANTS:
+                raise ValueError(f"Unsupported function call in {expression!r}")
+            function = getattr(np, name)
+        else:
+            raise ValueError(f"Unsupported function call in {expression!r}")
+        low, high = _arity(function)
+        if not low <= len(node.args) <= high:
+            expected = str(low) if low == high else f"{low} to {high}"
+            raise ValueError(
+                f"Function {name!r} takes {expected} argument(s), got {len(node.args)} in {expression!r}"
+            )
+        for argument in node.args:
+            if isinstance(argument, ast.Starred):
+                raise ValueError(f"Argument unpacking is not supported in {expression!r}")
+            _validate_node(argument, expression)
+    else:
+        raise ValueError(f"Unsupported syntax {type(node).__name__} in {expression!r}")
+
+
+def _arity(function: object) -> Tuple[int, int]:
+    """Smallest and largest number of positional arguments accepted by *function*."""
+
+    if isinstance(function, np.ufunc):
+        # Extra positional arguments of a ufunc are output arrays, which must never be reachable.
+        return function.nin, function.nin
+    return _ARITY[function]
+
+
+def _numpy_attribute(node: ast.Attribute) -> Optional[str]:
+    """Return the attribute name of a whitelisted ``np.<name>`` access."""
+
+    if isinstance(node.value, ast.Name) and node.value.id in _NUMPY_MODULES and node.attr in _NUMPY_NAMES:
+        return node.attr
+    return None
@@ -1,10 +1,12 @@
 """Computation of fold line positions for kirigami honeycomb diagrams."""
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from typing import List, Tuple
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from .cross_section import CrossSectionSamples
 
@@ -37,6 +39,65 @@ class FoldPattern:
             return 0.0
         return float(self.a_positions[-1])
 
+    def vertex_layout(self, *, cell_size: float, panel_length: float) -> VertexLayout:
+        """Lay out every FLD vertex for a panel of *panel_length*.
+
+        Slit line ``i`` follows the a series on fold lines ``k % 4 in (0, 1)``
+        and the b series on the remaining ones; the fold lines are spaced by
+        :func:`fold_line_gap`. All vertices are produced with one broadcast
+        selection instead of a per-vertex loop.
+        """
+
+        gap = fold_line_gap(cell_size)
+        if panel_length <= 0:
+            raise ValueError("panel_length must be positive.")
+        num_lines = int(panel_length // gap)
+        if num_lines < 2:
+            raise ValueError("panel_length must span at least two fold lines.")
+
+        num = self.b_positions.size
+        follows_a = np.arange(num_lines) % 4 < 2
+        x = np.where(follows_a, self.a_positions[:num, np.newaxis], self.b_positions[:, np.newaxis])
+        y = np.arange(num_lines, dtype=float) * gap
+        return VertexLayout(x, y, gap)
+
+
+@dataclass(frozen=True)
+class VertexLayout:
+    """FLD vertex coordinates with one row per slit line.
+
+    ``x[i, k]`` is the position of slit line ``i`` on fold line ``k``, which
+    lies at height ``y[k]``. ``gap`` is the spacing of the fold lines.
+    """
+
+    x: FloatArray
+    y: FloatArray
+    gap: float
+
+    def __post_init__(self) -> None:
+        x = np.asarray(self.x, dtype=float)
+        y = np.asarray(self.y, dtype=float).reshape(-1)
+        if x.ndim != 2 or x.shape[1] != y.size:
+            raise ValueError("x must have shape (n_slit_lines, n_fold_lines) matching y.")
+
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "gap", float(self.gap))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Number of slit lines and fold lines."""
+
+        return self.x.shape
+
+
+def fold_line_gap(cell_size: float) -> float:
+    """Spacing of the fold lines for honeycomb cells of *cell_size*."""
+
+    if cell_size <= 0:
+        raise ValueError("cell_size must be positive.")
+    return cell_size / (2.0 * math.cos(math.pi / 6.0))
+
 
 def compute_fold_pattern(samples: CrossSectionSamples) -> FoldPattern:
     """Compute fold line positions for the provided cross-section samples."""
@@ -45,31 +106,62 @@ def compute_fold_pattern(samples: CrossSectionSamples) -> FoldPattern:
     lower = samples.lower
     if upper.size != lower.size:
         raise ValueError("Upper and lower samples must have the same length.")
-    if upper.size < 2:
+
+    a_positions, b_positions, offsets = _fold_positions(upper[np.newaxis, :], lower[np.newaxis, :])
+    return FoldPattern(a_positions[0], b_positions[0], offsets)
+
+
+def compute_fold_patterns(upper: ArrayLike, lower: ArrayLike) -> List[FoldPattern]:
+    """Compute fold patterns for a stack of cross sections in a single pass.
+
+    ``upper`` and ``lower`` are ``(n_sections, n_samples)`` arrays holding one
+    sampled cross section per row, e.g. the spanwise stations of a wing. The
+    result matches calling :func:`compute_fold_pattern` on every row.
+    """
+
+    upper = np.asarray(upper, dtype=float)
+    lower = np.asarray(lower, dtype=float)
+    if upper.ndim != 2 or lower.ndim != 2:
+        raise ValueError("upper and lower must be two-dimensional (n_sections, n_samples) arrays.")
+    if upper.shape != lower.shape:
+        raise ValueError("Upper and lower samples must have the same shape.")
+
+    a_positions, b_positions, offsets = _fold_positions(upper, lower)
+    return [
+        FoldPattern(a_row, b_row, offsets[index : index + 1])
+        for index, (a_row, b_row) in enumerate(zip(a_positions, b_positions))
+    ]
+
+
+def _fold_positions(upper: FloatArray, lower: FloatArray) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    """Vectorised fold line positions for ``(n_sections, n_samples)`` stacks.
+
+    The a series steps by the wall height of the even sample at or below each
+    index, the b series by the odd one. Both are running sums, so they are
+    built from precomputed delta indices and a cumulative sum along the last
+    axis, which adds the terms in the same order as the reference loop.
+    """
+
+    num = upper.shape[-1]
+    if num < 2:
         raise ValueError("At least two sample points are required to compute a fold pattern.")
 
-    num = upper.size
     delta = upper - lower
 
-    a_positions = np.zeros(num + 1, dtype=float)
-    for index in range(1, num + 1):
-        k = index if index % 2 == 0 else index - 1
-        if k >= num:
-            k = num - 1
-        a_positions[index] = a_positions[index - 1] + delta[k]
-
-    b_positions = np.zeros(num, dtype=float)
-    for index in range(1, num):
-        k = index - 1 if index % 2 == 0 else index
-        if k >= num:
-            k = num - 1
-        b_positions[index] = b_positions[index - 1] + delta[k]
-
-    if num >= 2:
-        offset = lower[1] - lower[0]
-        b_positions = b_positions + offset
-        offsets = np.array([offset], dtype=float)
-    else:
-        offsets = np.array([], dtype=float)
-
-    return FoldPattern(a_positions, b_positions, offsets)
+    a_index = np.arange(1, num + 1)
+    a_index -= a_index % 2
+    np.minimum(a_index, num - 1, out=a_index)
+
+    b_index = np.arange(1, num)
+    b_index -= (b_index + 1) % 2
+
+    a_positions = np.zeros((upper.shape[0], num + 1), dtype=float)
+    np.cumsum(delta[:, a_index], axis=1, out=a_positions[:, 1:])
+
+    b_positions = np.zeros((upper.shape[0], num), dtype=float)
+    np.cumsum(delta[:, b_index], axis=1, out=b_positions[:, 1:])
+
+    offsets = lower[:, 1] - lower[:, 0]
+    b_positions += offsets[:, np.newaxis]
+
+    return a_positions, b_positions, offsets
@@ -1,12 +1,18 @@
-"""Generate the underlying hexagonal grid used by the honeycomb core."""
+"""Generate the hexagonal grid and the 3-D walls of the honeycomb core."""
 from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Tuple
+from pathlib import Path
+from typing import Iterator, Tuple
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
+
+from .cross_section import CrossSectionSamples
+from .fold_pattern import fold_line_gap
+from .ply import write_ply
+from .stl import write_stl
 
 
 FloatGrid = NDArray[np.float64]
@@ -38,13 +44,196 @@ class HexGrid:
         return self.x.shape
 
 
-def generate_hex_grid(
+@dataclass(frozen=True)
+class HexLattice:
+    """Implicit hexagonal grid described only by its lattice parameters.
+
+    Vertex ``(row, column)`` lies at ``origin + (column * step_x, row * step_y)``
+    with odd rows shifted by half a column step, as in :class:`HexGrid`.
+    No coordinates are stored: ``y`` is a read-only broadcast view and all
+    other coordinates are computed on demand for the requested region.
+    """
+
+    cell_size: float
+    shape: Tuple[int, int]
+    origin: Tuple[float, float] = (0.0, 0.0)
+
+    def __post_init__(self) -> None:
+        if self.cell_size <= 0:
+            raise ValueError("cell_size must be positive.")
+        rows, columns = (int(value) for value in self.shape)
+        if rows < 0 or columns < 0:
+            raise ValueError("Lattice shape must not be negative.")
+        object.__setattr__(self, "cell_size", float(self.cell_size))
+        object.__setattr__(self, "shape", (rows, columns))
+        object.__setattr__(self, "origin", (float(self.origin[0]), float(self.origin[1])))
+
+    @property
+    def step_x(self) -> float:
+        return self.cell_size / math.sqrt(3.0)
+
+    @property
+    def step_y(self) -> float:
+        return self.cell_size / 2.0
+
+    @property
+    def x(self) -> FloatGrid:
+        """Dense x coordinates; materialises the whole grid."""
+
+        return self.coordinates(np.arange(self.shape[0])[:, np.newaxis], np.arange(self.shape[1]))[0]
+
+    @property
+    def y(self) -> FloatGrid:
+        """Read-only ``shape`` view of the y coordinates backed by one row of values."""
+
+        values = self.origin[1] + np.arange(self.shape[0], dtype=float) * self.step_y
+        return np.broadcast_to(values[:, np.newaxis], self.shape)
+
+    def coordinates(self, rows: ArrayLike, columns: ArrayLike) -> Tuple[FloatGrid, FloatGrid]:
+        """Coordinates of the vertices at broadcastable *rows* and *columns* indices."""
+
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        x = self.origin[0] + columns * self.step_x + (rows % 2) * (self.step_x / 2.0)
+        y = self.origin[1] + rows * self.step_y
+        return np.broadcast_arrays(x, y)
+
+    def tile(self, rows: slice, columns: slice) -> HexGrid:
+        """Materialise the vertices in ``[rows, columns]`` as a dense :class:`HexGrid`."""
+
+        # Resolving the slices directly keeps each tile's cost proportional to its own size.
+        row_indices = np.arange(*rows.indices(self.shape[0]))
+        column_indices = np.arange(*columns.indices(self.shape[1]))
+        x, y = self.coordinates(row_indices[:, np.newaxis], column_indices[np.newaxis, :])
+        return HexGrid(np.array(x), np.array(y), self.cell_size)
+
+    def iter_tiles(self, tile_shape: Tuple[int, int]) -> Iterator[Tuple[Tuple[slice, slice], HexGrid]]:
+        """Yield ``((row_slice, column_slice), grid)`` blocks covering the lattice."""
+
+        tile_rows, tile_columns = tile_shape
+        if tile_rows <= 0 or tile_columns <= 0:
+            raise ValueError("tile_shape must be positive.")
+        for row in range(0, self.shape[0], tile_rows):
+            for column in range(0, self.shape[1], tile_columns):
+                region = (slice(row, row + tile_rows), slice(column, column + tile_columns))
+                yield region, self.tile(*region)
+
+    def to_grid(self) -> HexGrid:
+        """Materialise the full lattice as a dense :class:`HexGrid`."""
+
+        return self.tile(slice(None), slice(None))
+
+    def locate(self, points: ArrayLike) -> LatticeLocation:
+        """Find the cell and enclosing lattice triangle of every point.
+
+        The lattice vertices are the centres of hexagonal cells and form
+        equilateral triangles. Each ``(n, 2)`` point is placed in its row band
+        with one ``floor``, sheared into the band's skew coordinates and
+        assigned to the lower or upper triangle of its skew square; the cell
+        is the triangle corner with the largest barycentric weight, which is
+        the nearest lattice vertex. Points outside the lattice still get
+        indices, flagged by :attr:`LatticeLocation.inside`.
+        """
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        band = (points[:, 1] - self.origin[1]) / self.step_y
+        row = np.floor(band).astype(np.int64)
+        v = band - row
+        odd = row % 2
+        # Shearing by half a step per band turns every band into a strip of
+        # unit skew squares, each split into a lower and an upper triangle.
+        skew = (points[:, 0] - self.origin[0]) / self.step_x - 0.5 * odd - 0.5 * v
+        column = np.floor(skew).astype(np.int64)
+        f = skew - column
+
+        lower = f + v < 1.0
+        row = row[:, np.newaxis]
+        column = column[:, np.newaxis]
+        odd = odd[:, np.newaxis]
+        # Corners in the row above are shifted by one column on odd rows.
+        rows = np.where(lower[:, np.newaxis], row + [0, 0, 1], row + [0, 1, 1])
+        columns = np.where(
+            lower[:, np.newaxis],
+            column + [0, 1, 0] + odd * [0, 0, 1],
+            column + [1, 1, 0] + odd * [0, 1, 1],
+        )
+        weights = np.where(
+            lower[:, np.newaxis],
+            np.column_stack((1.0 - f - v, f, v)),
+            np.column_stack((1.0 - v, f + v - 1.0, 1.0 - f)),
+        )
+
+        nearest = np.argmax(weights, axis=1)[:, np.newaxis]
+        cell_row = np.take_along_axis(rows, nearest, axis=1)[:, 0]
+        cell_column = np.take_along_axis(columns, nearest, axis=1)[:, 0]
+        return LatticeLocation(cell_row, cell_column, rows, columns, weights, self.shape)
+
+    def neighbours(
+        self,
+        rows: ArrayLike,
+        columns: ArrayLike,
+        *,
+        ring: int = 1,
+    ) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Cells at hexagonal distance *ring* around each ``(row, column)``.
+
+        Returns two ``(n, 6 * ring)`` index arrays (``(n, 1)`` for ring 0).
+        Indices are not clipped to the lattice shape.
+        """
+
+        if ring < 0:
+            raise ValueError("ring must not be negative.")
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1, 1)
+        columns = np.asarray(columns, dtype=np.int64).reshape(-1, 1)
+        offsets = _ring_offsets(ring)
+        # Odd rows are shifted right, so offset coordinates map to axial ones by
+        # subtracting half of the even part of the row index.
+        axial_q = columns - (rows - (rows & 1)) // 2 + offsets[:, 0]
+        axial_r = rows + offsets[:, 1]
+        return axial_r, axial_q + (axial_r - (axial_r & 1)) // 2
+
+
+@dataclass(frozen=True)
+class LatticeLocation:
+    """Result of :meth:`HexLattice.locate` for ``n`` query points.
+
+    ``row`` and ``column`` index the cell of every point. ``triangle_rows``,
+    ``triangle_columns`` and ``weights`` are ``(n, 3)`` arrays describing the
+    enclosing lattice triangle and the barycentric position within it.
+    """
+
+    row: NDArray[np.int64]
+    column: NDArray[np.int64]
+    triangle_rows: NDArray[np.int64]
+    triangle_columns: NDArray[np.int64]
+    weights: FloatGrid
+    shape: Tuple[int, int]
+
+    @property
+    def inside(self) -> NDArray[np.bool_]:
+        """Whether each cell lies within the lattice shape."""
+
+        return (self.row >= 0) & (self.row < self.shape[0]) & (self.column >= 0) & (self.column < self.shape[1])
+
+
+def _ring_offsets(ring: int) -> NDArray[np.int64]:
+    """Axial ``(q, r)`` offsets of the ``6 * ring`` cells at distance *ring*."""
+
+    if ring == 0:
+        return np.zeros((1, 2), dtype=np.int64)
+    directions = np.array([[1, 0], [1, -1], [0, -1], [-1, 0], [-1, 1], [0, 1]], dtype=np.int64)
+    start = directions[4] * ring
+    steps = np.repeat(directions, ring, axis=0)
+    return start + np.concatenate((np.zeros((1, 2), dtype=np.int64), np.cumsum(steps, axis=0)[:-1]))
+
+
+def generate_hex_lattice(
     *,
     cell_size: float,
     width: float,
     length: float,
-) -> HexGrid:
-    """Generate a hexagonal grid covering the requested extent."""
+) -> HexLattice:
+    """Describe a hexagonal grid covering the requested extent without storing it."""
 
     if cell_size <= 0:
         raise ValueError("cell_size must be positive.")
@@ -56,13 +245,235 @@ def generate_hex_grid(
 
     num_width = int(math.floor(width / half_step_width)) + 2
     num_length = int(math.floor(length / half_step_length)) + 2
+    return HexLattice(float(cell_size), (num_length, num_width))
+
+
+def generate_hex_grid(
+    *,
+    cell_size: float,
+    width: float,
+    length: float,
+) -> HexGrid:
+    """Generate a hexagonal grid covering the requested extent."""
+
+    return generate_hex_lattice(cell_size=cell_size, width=width, length=length).to_grid()
+
+
+@dataclass(frozen=True)
+class ClippedHexGrid:
+    """Cells of a :class:`HexLattice` restricted to per-row column ranges.
+
+    Row ``r`` holds the columns ``column_start[r] <= c < column_stop[r]``;
+    the cells are numbered row by row, so the cells of row ``r`` have the
+    flat indices ``offsets[r]:offsets[r + 1]`` as in a CSR matrix. Storage
+    grows with the number of rows only.
+    """
+
+    lattice: HexLattice
+    column_start: NDArray[np.int64]
+    column_stop: NDArray[np.int64]
+
+    def __post_init__(self) -> None:
+        start = np.asarray(self.column_start, dtype=np.int64).reshape(-1)
+        stop = np.maximum(np.asarray(self.column_stop, dtype=np.int64).reshape(-1), start)
+        if start.shape != (self.lattice.shape[0],) or stop.shape != start.shape:
+            raise ValueError("Column ranges must be given for every lattice row.")
+        if np.any(start < 0) or np.any(stop > self.lattice.shape[1]):
+            raise ValueError("Column ranges must lie within the lattice.")
+        object.__setattr__(self, "column_start", start)
+        object.__setattr__(self, "column_stop", stop)
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    @property
+    def offsets(self) -> NDArray[np.int64]:
+        return np.concatenate(([0], np.cumsum(self.column_stop - self.column_start)))
+
+    def cells(self) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Row and column index of every cell in flat order."""
+
+        counts = self.column_stop - self.column_start
+        rows = np.repeat(np.arange(counts.size), counts)
+        columns = np.arange(rows.size) - np.repeat(self.offsets[:-1] - self.column_start, counts)
+        return rows, columns
+
+    def coordinates(self) -> Tuple[FloatGrid, FloatGrid]:
+        """Lattice coordinates of every cell in flat order."""
+
+        return self.lattice.coordinates(*self.cells())
+
+    def index(self, rows: ArrayLike, columns: ArrayLike) -> NDArray[np.int64]:
+        """Flat cell index of each ``(row, column)``, or ``-1`` outside the grid."""
+
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        valid = (rows >= 0) & (rows < self.column_start.size)
+        safe_rows = np.where(valid, rows, 0)
+        valid &= (columns >= self.column_start[safe_rows]) & (columns < self.column_stop[safe_rows])
+        flat = self.offsets[safe_rows] + columns - self.column_start[safe_rows]
+        return np.where(valid, flat, -1)
+
+
+def generate_envelope_grid(samples: CrossSectionSamples) -> ClippedHexGrid:
+    """Hex grid cells that lie within the cross-section envelope of *samples*.
+
+    Lattice row ``r`` follows sample ``r``, whose spacing of half a cell size
+    matches the row step, and the lattice x axis runs along the height from
+    the lowest point of the lower curve. Only the columns between the lower
+    and upper curve of each row are kept, so memory and per-cell work grow
+    with the area of the section rather than its bounding box. Samples with
+    any other spacing are rejected.
+    """
+
+    if samples.x.size == 0:
+        raise ValueError("At least one cross-section sample is required.")
+    if not np.allclose(np.diff(samples.x), samples.cell_size / 2.0):
+        raise ValueError("Cross-section samples must be spaced half a cell size apart.")
+    base = float(np.min(samples.lower))
+    lattice_step = samples.cell_size / math.sqrt(3.0)
+    shift = 0.5 * (np.arange(samples.x.size) % 2)
+    start = np.ceil((samples.lower - base) / lattice_step - shift - 1e-9).astype(np.int64)
+    stop = np.floor((samples.upper - base) / lattice_step - shift + 1e-9).astype(np.int64) + 1
+    start = np.maximum(start, 0)
+    stop = np.maximum(stop, start)
+
+    lattice = HexLattice(samples.cell_size, (samples.x.size, int(stop.max())), (base, float(samples.x[0])))
+    return ClippedHexGrid(lattice, start, stop)
+
+
+@dataclass(frozen=True)
+class HoneycombMesh:
+    """Triangulated walls of the folded honeycomb core.
+
+    The first half of ``vertices`` lies on the upper cross-section curve and
+    the second half on the lower one. Every wall is a quad split into two
+    consecutive triangles, so face ``f`` belongs to wall ``f // 2``; wall
+    ``k`` of ribbon ``i`` has index ``i * walls_per_ribbon + k`` and matches
+    band ``k`` between slit lines ``i`` and ``i + 1`` of the fold line
+    diagram.
+    """
+
+    vertices: FloatGrid
+    faces: NDArray[np.int64]
+    walls_per_ribbon: int
+
+    def __post_init__(self) -> None:
+        vertices = np.asarray(self.vertices, dtype=float)
+        faces = np.asarray(self.faces, dtype=np.int64)
+        if vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise ValueError("vertices must have shape (n, 3).")
+        if faces.ndim != 2 or faces.shape[1] != 3:
+            raise ValueError("faces must have shape (m, 3).")
+        object.__setattr__(self, "vertices", vertices)
+        object.__setattr__(self, "faces", faces)
+        object.__setattr__(self, "walls_per_ribbon", int(self.walls_per_ribbon))
+
+    @property
+    def wall_count(self) -> int:
+        return self.faces.shape[0] // 2
+
+    @property
+    def wall_quads(self) -> FloatGrid:
+        """``(n_walls, 4, 3)`` wall corners: both upper corners, then both lower ones reversed.
+
+        The corners of wall ``w`` run from the upper end of its first edge to
+        the upper end of its second edge, down to the lower end of the second
+        edge and back to the lower end of the first one.
+        """
+
+        first = self.faces[0::2]
+        second = self.faces[1::2]
+        return self.vertices[np.column_stack((first[:, 0], first[:, 1], second[:, 1], first[:, 2]))]
+
+    def export(self, path: str | Path, *, chunk_size: int | None = None) -> None:
+        """Write the mesh as binary ``.stl`` or ``.ply`` without trimesh."""
+
+        suffix = Path(path).suffix.lower()
+        if suffix == ".stl":
+            write_stl(path, self.vertices, self.faces, chunk_size=chunk_size)
+        elif suffix == ".ply":
+            write_ply(path, self.vertices, self.faces, chunk_size=chunk_size)
+        else:
+            raise ValueError(f"Unsupported mesh format: {suffix!r}")
+
+    def to_trimesh(self, *, process: bool = False):
+        """Return the mesh as a :class:`trimesh.Trimesh` (requires ``trimesh``)."""
+
+        import trimesh
+
+        return trimesh.Trimesh(vertices=self.vertices, faces=self.faces, process=process)
+
+
+def build_honeycomb_mesh(samples: CrossSectionSamples, *, panel_length: float) -> HoneycombMesh:
+    """Build the honeycomb walls for *samples* over a panel of *panel_length*.
+
+    Sample ``c`` defines the honeycomb column at ``samples.x[c]``. Even
+    columns carry vertices at ``3m`` and ``3m + 1`` fold line gaps along the
+    panel, odd columns at ``3m + 1.5`` and ``3m + 2.5``. Ribbon ``i`` runs
+    between columns ``i`` and ``i + 1``, alternating between them every two
+    vertices, and each of its walls spans from the lower to the upper curve.
+    Vertices and faces are produced with index arithmetic only.
+    """
+
+    gap = fold_line_gap(samples.cell_size)
+    if panel_length <= 0:
+        raise ValueError("panel_length must be positive.")
+    num_lines = int(panel_length // gap)
+    if num_lines < 2:
+        raise ValueError("panel_length must span at least two fold lines.")
+    num_columns = samples.x.size
+    if num_columns < 2:
+        raise ValueError("At least two cross-section samples are required.")
+
+    columns, points = ribbon_plan(num_columns, num_lines)
+
+    # Column c holds points 0..count[c]-1, stored contiguously per column.
+    parity = np.arange(num_columns) % 2
+    even_count = int(points[np.arange(num_lines) % 4 < 2].max()) + 1
+    odd_count = int(points[np.arange(num_lines) % 4 >= 2].max(initial=-1)) + 1
+    counts = np.where(parity == 0, even_count, odd_count)
+    column_start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    total = int(counts.sum())
+
+    owner = np.repeat(np.arange(num_columns), counts)
+    local = np.arange(total) - column_start[owner]
+    y = column_point_y(local, owner, gap)
+    top = np.column_stack((samples.x[owner], y, samples.upper[owner]))
+    bottom = np.column_stack((samples.x[owner], y, samples.lower[owner]))
+
+    ids = column_start[columns] + points
+    first = ids[:, :-1].reshape(-1)
+    second = ids[:, 1:].reshape(-1)
+    faces = np.empty((first.size, 2, 3), dtype=np.int64)
+    faces[:, 0] = np.column_stack((first, second, first + total))
+    faces[:, 1] = np.column_stack((first + total, second + total, second))
+
+    return HoneycombMesh(np.vstack((top, bottom)), faces.reshape(-1, 3), num_lines - 1)
+
+
+def ribbon_plan(num_columns: int, num_lines: int) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Column and per-column point index of every ribbon vertex.
+
+    Returns a ``(num_columns - 1, num_lines)`` array of columns and a
+    ``(num_lines,)`` array of point indices. Ribbon vertex ``k`` sits on the
+    even neighbouring column when ``k % 4 < 2`` and on the odd one otherwise.
+    """
+
+    ribbon = np.arange(num_columns - 1)[:, np.newaxis]
+    vertex = np.arange(num_lines)
+    even_column = ribbon + ribbon % 2
+    odd_column = ribbon + 1 - ribbon % 2
+    columns = np.where(vertex % 4 < 2, even_column, odd_column)
+    points = 2 * (vertex // 4) + vertex % 2
+    return columns, points
 
-    column_indices = np.arange(num_width, dtype=float)
-    row_indices = np.arange(num_length, dtype=float)
 
-    x_coords = np.tile(column_indices * half_step_width, (num_length, 1))
-    x_coords[1::2] += half_step_width / 2.0
+def column_point_y(points: NDArray[np.int64], columns: NDArray[np.int64], gap: float) -> FloatGrid:
+    """Position along the panel of point *points* of honeycomb column *columns*.
 
-    y_coords = np.repeat((row_indices * half_step_length)[:, np.newaxis], num_width, axis=1)
+    Even columns carry their points at ``3m`` and ``3m + 1`` fold line gaps,
+    odd columns at ``3m + 1.5`` and ``3m + 2.5``.
+    """
 
-    return HexGrid(x_coords, y_coords, float(cell_size))
+    return (3 * (points // 2) + points % 2 + 1.5 * (columns % 2)) * gap
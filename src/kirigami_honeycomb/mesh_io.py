@@ -1,18 +1,24 @@
 """Mesh ingestion utilities for kirigami honeycomb workflows."""
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal, Tuple
 
 import numpy as np
 import trimesh
+from numpy.typing import ArrayLike, NDArray
 
 from .cross_section import CrossSectionSamples
+from .parallel import SharedArray, attach_shared_array, share_array
+from .stl import is_binary_stl, iter_stl_triangles, read_stl_triangles
 
 
 AxisName = Literal["x", "y", "z"]
+FloatArray = NDArray[np.float64]
 
-__all__ = ["load_mesh", "sample_mesh_cross_section"]
+__all__ = ["EnvelopeGrid", "load_mesh", "load_triangles", "sample_mesh_cross_section", "sample_mesh_envelope_grid"]
 
 
 def load_mesh(path: str | Path, *, process: bool = True) -> trimesh.Trimesh:
@@ -38,22 +44,50 @@ def load_mesh(path: str | Path, *, process: bool = True) -> trimesh.Trimesh:
     return mesh
 
 
+def load_triangles(mesh_or_path: trimesh.Trimesh | np.ndarray | str | Path) -> np.ndarray:
+    """Return the triangle soup of a mesh, triangle array or mesh file.
+
+    The result is a ``(n_triangles, 3, 3)`` ``float64`` array. Binary STL
+    files are read through :func:`~kirigami_honeycomb.stl.read_stl_triangles`
+    without building a :class:`trimesh.Trimesh`.
+    """
+
+    return _corner_coordinates(_resolve_source(mesh_or_path), (0, 1, 2))
+
+
 def sample_mesh_cross_section(
-    mesh_or_path: trimesh.Trimesh | str | Path,
+    mesh_or_path: trimesh.Trimesh | np.ndarray | str | Path,
     *,
     axis: AxisName = "x",
     height_axis: AxisName = "z",
     spacing: float | None = None,
     cell_size: float = 20.0,
+    chunk_size: int | None = None,
 ) -> CrossSectionSamples:
     """Slice a mesh into a :class:`CrossSectionSamples` representation.
 
     The mesh is sliced by planes orthogonal to ``axis``. For each slice the
     minimum and maximum coordinates along ``height_axis`` are captured to form
-    the lower and upper envelope of the cross section.
+    the lower and upper envelope of the cross section. The slices are never
+    materialised as paths: every triangle edge is intersected with the planes
+    it spans and the heights are reduced per plane directly.
+
+    Besides a :class:`trimesh.Trimesh` or a path understood by
+    :func:`load_mesh`, ``mesh_or_path`` may be a ``(n_triangles, 3, 3)``
+    triangle soup. Binary STL paths are memory-mapped with
+    :func:`~kirigami_honeycomb.stl.read_stl_triangles` instead of being loaded
+    through :mod:`trimesh`, as the envelope never needs merged vertices.
+
+    When ``chunk_size`` is given the faces are processed in chunks of at most
+    that many triangles and the per-chunk envelopes are merged, which keeps
+    peak memory bounded independently of the mesh size. Binary STL paths are
+    then streamed from disk twice (extent, then envelope) instead of being
+    mapped or loaded as a whole.
     """
 
-    mesh = load_mesh(mesh_or_path) if not isinstance(mesh_or_path, trimesh.Trimesh) else mesh_or_path
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    source = _resolve_source(mesh_or_path, streaming=chunk_size is not None)
 
     axis_index = _axis_index(axis)
     height_index = _axis_index(height_axis)
@@ -67,9 +101,11 @@ def sample_mesh_cross_section(
     if spacing <= 0:
         raise ValueError("spacing must be greater than zero")
 
-    bounds = mesh.bounds
-    start = bounds[0, axis_index]
-    end = bounds[1, axis_index]
+    start = np.inf
+    end = -np.inf
+    for axis_values, _ in _iter_corner_values(source, axis_index, height_index, chunk_size):
+        start = min(start, float(np.min(axis_values)))
+        end = max(end, float(np.max(axis_values)))
     if not np.isfinite(start) or not np.isfinite(end):
         raise ValueError("Mesh bounds must be finite")
 
@@ -77,21 +113,11 @@ def sample_mesh_cross_section(
     if coordinates.size < 2:
         raise ValueError("Mesh extent along the selected axis is too small for the requested spacing")
 
-    origin = mesh.centroid
-    normal = np.zeros(3)
-    normal[axis_index] = 1.0
-    heights = coordinates - origin[axis_index]
-    sections = mesh.section_multiplane(plane_origin=origin, plane_normal=normal, heights=heights)
+    lower = np.full(coordinates.shape, np.inf, dtype=float)
+    upper = np.full(coordinates.shape, -np.inf, dtype=float)
 
-    lower = np.full(coordinates.shape, np.nan, dtype=float)
-    upper = np.full(coordinates.shape, np.nan, dtype=float)
-
-    for index, section in enumerate(sections):
-        if section is None or section.vertices.size == 0:
-            continue
-        vertices = _section_vertices_to_3d(section)
-        upper[index] = float(np.max(vertices[:, height_index]))
-        lower[index] = float(np.min(vertices[:, height_index]))
+    for axis_values, height_values in _iter_corner_values(source, axis_index, height_index, chunk_size):
+        _accumulate_envelope(axis_values, height_values, coordinates, lower, upper)
 
     lower = _interpolate_missing(lower, coordinates)
     upper = _interpolate_missing(upper, coordinates)
@@ -102,6 +128,183 @@ def sample_mesh_cross_section(
     return CrossSectionSamples(coordinates, upper, lower, cell_size)
 
 
+@dataclass(frozen=True)
+class EnvelopeGrid:
+    """Upper and lower envelopes sampled at several stations along the span."""
+
+    x: FloatArray
+    span: FloatArray
+    upper: FloatArray
+    lower: FloatArray
+    cell_size: float
+
+    def __post_init__(self) -> None:
+        x = np.asarray(self.x, dtype=float)
+        span = np.asarray(self.span, dtype=float)
+        upper = np.asarray(self.upper, dtype=float)
+        lower = np.asarray(self.lower, dtype=float)
+        if x.ndim != 1 or span.ndim != 1:
+            raise ValueError("x and span must be one-dimensional.")
+        if upper.shape != (span.size, x.size) or lower.shape != upper.shape:
+            raise ValueError("upper and lower must have shape (n_span, n_samples).")
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "span", span)
+        object.__setattr__(self, "upper", upper)
+        object.__setattr__(self, "lower", lower)
+        object.__setattr__(self, "cell_size", float(self.cell_size))
+
+    def section(self, index: int) -> CrossSectionSamples:
+        """Return the cross section at span station *index*."""
+
+        return CrossSectionSamples(self.x, self.upper[index], self.lower[index], self.cell_size)
+
+
+def sample_mesh_envelope_grid(
+    mesh_or_path: trimesh.Trimesh | np.ndarray | str | Path,
+    *,
+    axis: AxisName = "x",
+    span_axis: AxisName = "y",
+    height_axis: AxisName = "z",
+    stations: int | ArrayLike = 50,
+    spacing: float | None = None,
+    cell_size: float = 20.0,
+    processes: int | None = None,
+) -> EnvelopeGrid:
+    """Sample the upper/lower envelope on a dense ``(n_span, n_samples)`` grid.
+
+    Unlike :func:`sample_mesh_cross_section`, which projects the whole mesh
+    onto a single section, the mesh is cut along both ``axis`` and
+    ``span_axis``: for every station along the span and every sample along
+    ``axis`` the extreme ``height_axis`` coordinates of the mesh on that line
+    are recorded. ``stations`` is either the number of stations, placed at
+    the centres of equal bins across the span extent, or an increasing array
+    of span coordinates.
+
+    With ``processes`` greater than one the stations are split into blocks
+    handled by a process pool; the triangle corners are placed in shared
+    memory once instead of being pickled for every worker.
+    """
+
+    axis_index = _axis_index(axis)
+    span_index = _axis_index(span_axis)
+    height_index = _axis_index(height_axis)
+    if len({axis_index, span_index, height_index}) != 3:
+        raise ValueError("axis, span_axis and height_axis must refer to different dimensions")
+
+    if cell_size <= 0:
+        raise ValueError("cell_size must be greater than zero")
+    if spacing is None:
+        spacing = cell_size / 2.0
+    if spacing <= 0:
+        raise ValueError("spacing must be greater than zero")
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be at least one")
+
+    source = _resolve_source(mesh_or_path)
+    corners = _corner_coordinates(source, (axis_index, span_index, height_index))
+    if not np.all(np.isfinite(corners)):
+        raise ValueError("Mesh coordinates must be finite")
+
+    coordinates = _build_coordinates(float(corners[:, :, 0].min()), float(corners[:, :, 0].max()), spacing)
+    if coordinates.size < 2:
+        raise ValueError("Mesh extent along the selected axis is too small for the requested spacing")
+
+    if np.ndim(stations) == 0:
+        if int(stations) < 1:
+            raise ValueError("At least one span station is required")
+        # Stations sit at the centres of equal bins so none lies on the extreme span, where a
+        # curved mesh only touches the cutting line in a point.
+        low, high = float(corners[:, :, 1].min()), float(corners[:, :, 1].max())
+        span = low + (np.arange(int(stations)) + 0.5) * ((high - low) / int(stations))
+    else:
+        span = np.asarray(stations, dtype=float).reshape(-1)
+        if span.size == 0 or np.any(np.diff(span) <= 0):
+            raise ValueError("stations must be a non-empty, strictly increasing sequence")
+
+    if processes is None or processes == 1 or span.size == 1:
+        lower, upper = _grid_envelope(corners, coordinates, span)
+    else:
+        blocks = np.array_split(span, min(processes, span.size))
+        repeat = len(blocks)
+        with share_array(corners) as handle, ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_grid_envelope_worker, [handle] * repeat, [coordinates] * repeat, blocks))
+        lower = np.vstack([result[0] for result in results])
+        upper = np.vstack([result[1] for result in results])
+
+    for row in range(span.size):
+        lower[row] = _interpolate_missing(lower[row], coordinates)
+        upper[row] = _interpolate_missing(upper[row], coordinates)
+
+    if np.any(upper < lower):
+        raise ValueError("Derived upper envelope dips below the lower envelope; check mesh orientation")
+
+    return EnvelopeGrid(coordinates, span, upper, lower, cell_size)
+
+
+def _resolve_source(
+    mesh_or_path: trimesh.Trimesh | np.ndarray | str | Path,
+    *,
+    streaming: bool = False,
+) -> trimesh.Trimesh | np.ndarray | Path:
+    """Return a mesh, triangle soup or streamable STL path for the input."""
+
+    if isinstance(mesh_or_path, trimesh.Trimesh):
+        return mesh_or_path
+    if isinstance(mesh_or_path, np.ndarray):
+        if mesh_or_path.ndim != 3 or mesh_or_path.shape[1:] != (3, 3):
+            raise ValueError("Triangle arrays must have shape (n_triangles, 3, 3)")
+        if mesh_or_path.shape[0] == 0:
+            raise ValueError("Triangle array does not contain any geometry")
+        return mesh_or_path
+    if is_binary_stl(mesh_or_path):
+        if streaming:
+            return Path(mesh_or_path)
+        return read_stl_triangles(mesh_or_path)
+    return load_mesh(mesh_or_path)
+
+
+def _iter_corner_values(
+    source: trimesh.Trimesh | np.ndarray | Path,
+    axis_index: int,
+    height_index: int,
+    chunk_size: int | None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield per-triangle corner coordinates along both axes, chunk by chunk.
+
+    Each item is a pair of ``(k, 3)`` arrays. Without a ``chunk_size`` the
+    whole source is returned as a single chunk.
+    """
+
+    if isinstance(source, Path):
+        for triangles in iter_stl_triangles(source, chunk_size=chunk_size or 1 << 16):
+            yield triangles[:, :, axis_index], triangles[:, :, height_index]
+        return
+
+    if isinstance(source, trimesh.Trimesh):
+        vertices = np.asarray(source.vertices)
+        faces = np.asarray(source.faces)
+        axis_coordinates = vertices[:, axis_index]
+        height_coordinates = vertices[:, height_index]
+        step = chunk_size or max(len(faces), 1)
+        for offset in range(0, len(faces), step):
+            chunk = faces[offset : offset + step]
+            yield axis_coordinates[chunk], height_coordinates[chunk]
+        return
+
+    step = chunk_size or source.shape[0]
+    for offset in range(0, source.shape[0], step):
+        chunk = source[offset : offset + step]
+        yield chunk[:, :, axis_index], chunk[:, :, height_index]
+
+
+def _corner_coordinates(source: trimesh.Trimesh | np.ndarray, indices: Tuple[int, ...]) -> np.ndarray:
+    """Per-triangle corners restricted to *indices* with shape ``(n, 3, k)``."""
+
+    if isinstance(source, trimesh.Trimesh):
+        return np.asarray(source.vertices, dtype=float)[:, list(indices)][np.asarray(source.faces)]
+    return np.asarray(source[:, :, list(indices)], dtype=float)
+
+
 def _axis_index(axis: AxisName) -> int:
     mapping = {"x": 0, "y": 1, "z": 2}
     try:
@@ -117,6 +320,142 @@ def _build_coordinates(start: float, end: float, spacing: float) -> np.ndarray:
     return np.arange(start, end + epsilon, spacing, dtype=float)
 
 
+def _accumulate_envelope(
+    axis_values: np.ndarray,
+    height_values: np.ndarray,
+    coordinates: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> None:
+    """Reduce the edge/plane crossings of a triangle soup into *lower*/*upper*.
+
+    ``axis_values`` and ``height_values`` hold the per-corner coordinates of
+    each triangle with shape ``(n_triangles, 3)``. Every edge is intersected
+    with all slicing planes in ``coordinates`` that it spans and the crossing
+    heights are folded into the running per-plane minimum and maximum.
+    Edges lying inside a plane contribute their start corner, the end corner
+    is covered by the following edge of the same triangle. Only the planes
+    inside the extent of the given triangles are considered, so chunks of a
+    large mesh touch just the part of the envelope they span.
+    """
+
+    if axis_values.size == 0:
+        return
+    first_plane = np.searchsorted(coordinates, np.min(axis_values), side="left")
+    last_plane = np.searchsorted(coordinates, np.max(axis_values), side="right")
+    if first_plane == last_plane:
+        return
+    # Views keep the reductions below writing into the caller's arrays.
+    coordinates = coordinates[first_plane:last_plane]
+    lower = lower[first_plane:last_plane]
+    upper = upper[first_plane:last_plane]
+
+    start = np.asarray(axis_values, dtype=float).reshape(-1)
+    end = np.roll(axis_values, -1, axis=1).astype(float, copy=False).reshape(-1)
+    start_height = np.asarray(height_values, dtype=float).reshape(-1)
+    end_height = np.roll(height_values, -1, axis=1).astype(float, copy=False).reshape(-1)
+
+    first = np.searchsorted(coordinates, np.minimum(start, end), side="left")
+    stop = np.searchsorted(coordinates, np.maximum(start, end), side="right")
+    counts = stop - first
+    crossing = counts > 0
+    if not np.any(crossing):
+        return
+
+    edges = np.flatnonzero(crossing)
+    counts = counts[edges]
+    edge_index = np.repeat(edges, counts)
+    # Enumerate the spanned planes of each edge: first[edge], first[edge] + 1, ...
+    run_starts = np.cumsum(counts) - counts
+    planes = np.arange(edge_index.size) - np.repeat(run_starts - first[edges], counts)
+
+    edge_start = start[edge_index]
+    span = end[edge_index] - edge_start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(span != 0.0, (coordinates[planes] - edge_start) / span, 0.0)
+    base_height = start_height[edge_index]
+    heights = base_height + t * (end_height[edge_index] - base_height)
+
+    np.minimum.at(lower, planes, heights)
+    np.maximum.at(upper, planes, heights)
+
+
+def _grid_envelope(
+    corners: np.ndarray,
+    coordinates: np.ndarray,
+    stations: np.ndarray,
+    *,
+    chunk_size: int = 1 << 15,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasterise triangles onto the ``(stations, coordinates)`` sample grid.
+
+    ``corners`` holds ``(axis, span, height)`` per triangle corner. Every grid
+    point inside a triangle's projection receives the interpolated height and
+    the extremes per grid point form the envelopes. Grid points that no
+    triangle covers are left at ``+inf``/``-inf``.
+    """
+
+    n_samples = coordinates.size
+    lower = np.full(stations.size * n_samples, np.inf, dtype=float)
+    upper = np.full(stations.size * n_samples, -np.inf, dtype=float)
+
+    span_values = corners[:, :, 1]
+    relevant = np.flatnonzero((span_values.max(axis=1) >= stations[0]) & (span_values.min(axis=1) <= stations[-1]))
+    for offset in range(0, relevant.size, chunk_size):
+        chunk = corners[relevant[offset : offset + chunk_size]]
+        a = chunk[:, :, 0]
+        b = chunk[:, :, 1]
+        h = chunk[:, :, 2]
+
+        # Barycentric set-up of the projected triangles; vertical ones are skipped.
+        d1a = a[:, 1] - a[:, 0]
+        d1b = b[:, 1] - b[:, 0]
+        d2a = a[:, 2] - a[:, 0]
+        d2b = b[:, 2] - b[:, 0]
+        determinant = d1a * d2b - d2a * d1b
+        flat = np.abs(determinant) > 1e-12 * (np.abs(d1a * d2b) + np.abs(d2a * d1b))
+
+        first_i = np.searchsorted(coordinates, a.min(axis=1), side="left")
+        count_i = np.searchsorted(coordinates, a.max(axis=1), side="right") - first_i
+        first_j = np.searchsorted(stations, b.min(axis=1), side="left")
+        count_j = np.searchsorted(stations, b.max(axis=1), side="right") - first_j
+        counts = np.where(flat, count_i * count_j, 0)
+        triangles = np.flatnonzero(counts)
+        if triangles.size == 0:
+            continue
+
+        counts = counts[triangles]
+        owner = np.repeat(triangles, counts)
+        local = np.arange(owner.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        i = first_i[owner] + local % count_i[owner]
+        j = first_j[owner] + local // count_i[owner]
+
+        pa = coordinates[i] - a[owner, 0]
+        pb = stations[j] - b[owner, 0]
+        inverse = 1.0 / determinant[owner]
+        w1 = (pa * d2b[owner] - d2a[owner] * pb) * inverse
+        w2 = (d1a[owner] * pb - pa * d1b[owner]) * inverse
+        w0 = 1.0 - w1 - w2
+        tolerance = -1e-9
+        inside = (w0 >= tolerance) & (w1 >= tolerance) & (w2 >= tolerance)
+
+        heights = w0 * h[owner, 0] + w1 * h[owner, 1] + w2 * h[owner, 2]
+        cells = j * n_samples + i
+        np.minimum.at(lower, cells[inside], heights[inside])
+        np.maximum.at(upper, cells[inside], heights[inside])
+
+    return lower.reshape(stations.size, n_samples), upper.reshape(stations.size, n_samples)
+
+
+def _grid_envelope_worker(
+    handle: SharedArray,
+    coordinates: np.ndarray,
+    stations: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    with attach_shared_array(handle) as corners:
+        return _grid_envelope(corners, coordinates, stations)
+
+
 def _interpolate_missing(values: np.ndarray, coordinates: np.ndarray) -> np.ndarray:
     mask = np.isfinite(values)
     if mask.all():
@@ -128,19 +467,3 @@ def _interpolate_missing(values: np.ndarray, coordinates: np.ndarray) -> np.ndar
 
     interpolated = np.interp(coordinates, coordinates[valid_indices], values[valid_indices])
     return interpolated
-
-
-def _section_vertices_to_3d(section: trimesh.path.Path2D | trimesh.path.Path3D) -> np.ndarray:
-    vertices = section.vertices
-    if vertices.ndim != 2:
-        raise ValueError("Unexpected vertex array dimensionality for section output")
-    if vertices.shape[1] == 3:
-        return vertices
-
-    if "to_3D" not in section.metadata:
-        raise ValueError("Section data lacks the transformation to world coordinates")
-
-    zeros = np.zeros((vertices.shape[0], 1), dtype=vertices.dtype)
-    homogenous = np.hstack([vertices, zeros])
-    return trimesh.transform_points(homogenous, section.metadata["to_3D"])
-
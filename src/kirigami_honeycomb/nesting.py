@@ -0,0 +1,214 @@
+"""Nesting of many fold line diagram parts onto stock sheets."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .cross_section import CrossSectionSamples
+from .fold_pattern import FoldPattern
+from .segments import SegmentKind, SegmentTable, build_segment_table
+from .svg import export_segment_table
+
+
+__all__ = ["NestedSheet", "Placement", "export_nested_sheets", "nest_fold_patterns", "pack_rectangles"]
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Position of part ``part`` on sheet ``sheet`` (minimum corner at ``x, y``)."""
+
+    part: int
+    sheet: int
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+@dataclass(frozen=True)
+class NestedSheet:
+    """A stock sheet with its placed parts and their combined segments."""
+
+    index: int
+    width: float
+    height: float
+    placements: Tuple[Placement, ...]
+    segments: SegmentTable
+
+    @property
+    def utilisation(self) -> float:
+        """Fraction of the sheet area covered by part bounding boxes."""
+
+        used = sum(placement.width * placement.height for placement in self.placements)
+        return used / (self.width * self.height)
+
+
+def pack_rectangles(
+    sizes: ArrayLike,
+    *,
+    sheet_width: float,
+    sheet_height: float,
+    spacing: float = 0.0,
+) -> List[Placement]:
+    """Pack ``(n, 2)`` rectangle *sizes* onto as few sheets as possible.
+
+    A bottom-left skyline packer places the rectangles in order of
+    decreasing height. Each sheet keeps its skyline as a list of
+    ``[x, y, width]`` steps; a rectangle goes to the lowest, then leftmost,
+    step of the first sheet it fits on, and a new sheet is opened when it
+    fits nowhere. ``spacing`` is kept free between neighbouring parts.
+    Placements are returned in the order of *sizes*.
+    """
+
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 2)
+    if sheet_width <= 0 or sheet_height <= 0:
+        raise ValueError("Sheet dimensions must be positive.")
+    if spacing < 0:
+        raise ValueError("spacing must not be negative.")
+    if np.any(sizes <= 0):
+        raise ValueError("Part sizes must be positive.")
+    too_large = np.flatnonzero((sizes[:, 0] > sheet_width) | (sizes[:, 1] > sheet_height))
+    if too_large.size:
+        raise ValueError(f"Part {int(too_large[0])} does not fit onto a single sheet.")
+
+    # Every part is packed with ``spacing`` added to its width and height on a sheet enlarged by the
+    # same amount, so inflated rectangles never overlap and real parts keep the gap on all sides.
+    inflated = sizes + spacing
+    packed_width, packed_height = sheet_width + spacing, sheet_height + spacing
+    order = np.lexsort((-sizes[:, 0], -sizes[:, 1]))
+    skylines: List[List[List[float]]] = []
+    placements: List[Placement | None] = [None] * sizes.shape[0]
+
+    for part in order.tolist():
+        width, height = inflated[part].tolist()
+        for sheet, skyline in enumerate(skylines):
+            position = _skyline_position(skyline, width, height, packed_width, packed_height)
+            if position is not None:
+                break
+        else:
+            sheet = len(skylines)
+            skyline = [[0.0, 0.0, packed_width]]
+            skylines.append(skyline)
+            position = _skyline_position(skyline, width, height, packed_width, packed_height)
+        index, y = position
+        x = skyline[index][0]
+        _skyline_insert(skyline, index, x, y + height, width)
+        placements[part] = Placement(part, sheet, x, y, float(sizes[part, 0]), float(sizes[part, 1]))
+
+    return placements  # type: ignore[return-value]
+
+
+def nest_fold_patterns(
+    parts: Sequence[Tuple[CrossSectionSamples, FoldPattern]],
+    *,
+    panel_length: float,
+    sheet_width: float,
+    sheet_height: float,
+    spacing: float = 2.0,
+) -> List[NestedSheet]:
+    """Pack the fold line diagrams of many parts onto stock sheets.
+
+    Every part is the :func:`~kirigami_honeycomb.segments.build_segment_table`
+    diagram of its pattern over ``panel_length``, using the cell size of its
+    samples, moved so its bounding box starts at the origin. That box is the
+    packed rectangle. The returned sheets carry the translated diagrams and
+    the sheet border as marks.
+    """
+
+    drawings = [_part_segments(samples, pattern, panel_length) for samples, pattern in parts]
+    sizes = [(max(table.bounds[2], 1e-9), max(table.bounds[3], 1e-9)) for table in drawings]
+    placements = pack_rectangles(sizes, sheet_width=sheet_width, sheet_height=sheet_height, spacing=spacing)
+
+    sheet_count = max((placement.sheet for placement in placements), default=-1) + 1
+    border = _sheet_border(sheet_width, sheet_height)
+    sheets = []
+    for sheet in range(sheet_count):
+        on_sheet = tuple(placement for placement in placements if placement.sheet == sheet)
+        tables = [border]
+        for placement in on_sheet:
+            table = drawings[placement.part]
+            offset = np.array([placement.x, placement.y])
+            tables.append(SegmentTable(table.start + offset, table.end + offset, table.kind))
+        segments = SegmentTable.concatenate(tables)
+        sheets.append(NestedSheet(sheet, float(sheet_width), float(sheet_height), on_sheet, segments))
+    return sheets
+
+
+def export_nested_sheets(sheets: Sequence[NestedSheet], directory: Path, *, stem: str = "nest") -> List[Path]:
+    """Write one combined SVG cut file per nested sheet."""
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for sheet in sheets:
+        path = directory / f"{stem}_{sheet.index:02d}.svg"
+        export_segment_table(sheet.segments, path)
+        paths.append(path)
+    return paths
+
+
+def _skyline_position(
+    skyline: List[List[float]],
+    width: float,
+    height: float,
+    sheet_width: float,
+    sheet_height: float,
+) -> Tuple[int, float] | None:
+    """Lowest, then leftmost, skyline step that can hold the rectangle."""
+
+    best = None
+    best_y = float("inf")
+    for index, (x, _, _) in enumerate(skyline):
+        if x + width > sheet_width + 1e-9:
+            break
+        y = 0.0
+        remaining = width
+        step = index
+        while remaining > 1e-9 and step < len(skyline):
+            y = max(y, skyline[step][1])
+            remaining -= skyline[step][2]
+            step += 1
+        if y + height <= sheet_height + 1e-9 and y < best_y - 1e-9:
+            best, best_y = index, y
+    return None if best is None else (best, best_y)
+
+
+def _skyline_insert(skyline: List[List[float]], index: int, x: float, top: float, width: float) -> None:
+    """Raise the skyline to *top* over ``[x, x + width)`` and merge equal steps."""
+
+    end = x + width
+    step = index
+    while step < len(skyline) and skyline[step][0] < end - 1e-9:
+        step_end = skyline[step][0] + skyline[step][2]
+        if step_end > end + 1e-9:
+            skyline[step][2] = step_end - end
+            skyline[step][0] = end
+            break
+        del skyline[step]
+    skyline.insert(index, [x, top, width])
+
+    merged = [skyline[0]]
+    for current in skyline[1:]:
+        if abs(current[1] - merged[-1][1]) <= 1e-9:
+            merged[-1][2] += current[2]
+        else:
+            merged.append(current)
+    skyline[:] = merged
+
+
+def _part_segments(samples: CrossSectionSamples, pattern: FoldPattern, panel_length: float) -> SegmentTable:
+    """Fold line diagram of one part, translated so its bounds start at the origin."""
+
+    table = build_segment_table(pattern, cell_size=samples.cell_size, panel_length=panel_length)
+    origin = np.array(table.bounds[:2])
+    return SegmentTable(table.start - origin, table.end - origin, table.kind)
+
+
+def _sheet_border(width: float, height: float) -> SegmentTable:
+    corners = np.array([[0.0, 0.0], [width, 0.0], [width, height], [0.0, height]])
+    kind = np.full(4, SegmentKind.MARK, dtype=np.uint8)
+    return SegmentTable(corners, np.roll(corners, -1, axis=0), kind)
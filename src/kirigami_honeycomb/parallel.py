@@ -0,0 +1,60 @@
+"""Helpers for sharing large numpy arrays with worker processes."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Iterator, Tuple
+
+import numpy as np
+
+
+__all__ = ["SharedArray", "attach_shared_array", "share_array"]
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Picklable description of an array stored in a shared memory block."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@contextmanager
+def share_array(array: np.ndarray) -> Iterator[SharedArray]:
+    """Copy *array* into shared memory for the duration of the context.
+
+    The yielded :class:`SharedArray` can be sent to worker processes, which
+    map the block with :func:`attach_shared_array` instead of receiving a
+    pickled copy of the data. The block is released when the context exits.
+    """
+
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        yield SharedArray(block.name, array.shape, array.dtype.str)
+    finally:
+        block.close()
+        block.unlink()
+
+
+@contextmanager
+def attach_shared_array(handle: SharedArray) -> Iterator[np.ndarray]:
+    """Map the array described by *handle* as a read-only numpy view.
+
+    Intended for processes started by :mod:`multiprocessing`, which share the
+    creator's resource tracker so the block is not unlinked when they exit.
+    The view must not be referenced after the context exits.
+    """
+
+    block = shared_memory.SharedMemory(name=handle.name)
+    try:
+        view = np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=block.buf)
+        view.flags.writeable = False
+        yield view
+        del view
+    finally:
+        block.close()
+
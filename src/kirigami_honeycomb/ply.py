@@ -0,0 +1,66 @@
+"""Binary PLY output for triangle meshes."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+__all__ = ["PLY_FACE_DTYPE", "PLY_VERTEX_DTYPE", "write_ply"]
+
+PLY_VERTEX_DTYPE = np.dtype([("position", "<f4", (3,))])
+# Every face is stored as a list with a one-byte length followed by three indices.
+PLY_FACE_DTYPE = np.dtype([("count", "u1"), ("indices", "<i4", (3,))])
+
+
+def write_ply(
+    path: str | Path,
+    vertices: ArrayLike,
+    faces: ArrayLike,
+    *,
+    chunk_size: int | None = None,
+) -> None:
+    """Write a triangle mesh as binary little-endian PLY.
+
+    Vertices and faces are written as structured arrays with one
+    :meth:`numpy.ndarray.tofile` call each, or in blocks of ``chunk_size``
+    rows to bound the memory used for very large meshes. Unlike STL the
+    vertices are shared between faces, so files are considerably smaller.
+    """
+
+    vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    if faces.size and (faces.min() < 0 or faces.max() >= vertices.shape[0]):
+        raise ValueError("faces reference vertices that do not exist")
+
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        "comment kirigami_honeycomb\n"
+        f"element vertex {vertices.shape[0]}\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        f"element face {faces.shape[0]}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        handle.write(header.encode("ascii"))
+        step = max(vertices.shape[0] if chunk_size is None else chunk_size, 1)
+        for offset in range(0, vertices.shape[0], step):
+            block = np.empty(min(step, vertices.shape[0] - offset), dtype=PLY_VERTEX_DTYPE)
+            block["position"] = vertices[offset : offset + step]
+            block.tofile(handle)
+        step = max(faces.shape[0] if chunk_size is None else chunk_size, 1)
+        for offset in range(0, faces.shape[0], step):
+            block = np.empty(min(step, faces.shape[0] - offset), dtype=PLY_FACE_DTYPE)
+            block["count"] = 3
+            block["indices"] = faces[offset : offset + step]
+            block.tofile(handle)
@@ -0,0 +1,184 @@
+"""Dependency-free anti-aliased rasterisation and PNG output."""
+from __future__ import annotations
+
+import math
+import re
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterable, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+__all__ = ["Stroke", "parse_color", "rasterize_segments", "render_strokes", "write_png"]
+
+RGB = Tuple[float, float, float]
+Stroke = Tuple[ArrayLike, ArrayLike, str, float]
+"""Segment start points, end points, colour and width in pixels."""
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_NAMED_COLORS = {
+    "black": (0.0, 0.0, 0.0),
+    "white": (255.0, 255.0, 255.0),
+    "red": (255.0, 0.0, 0.0),
+    "green": (0.0, 128.0, 0.0),
+    "blue": (0.0, 0.0, 255.0),
+}
+_RGB_PATTERN = re.compile(r"rgb\(\s*([\d.]+)(%?)\s*,\s*([\d.]+)(%?)\s*,\s*([\d.]+)(%?)\s*\)")
+
+# Samples taken per pixel along a segment and the cap on samples per batch.
+_SAMPLES_PER_PIXEL = 2.0
+_BATCH_SAMPLES = 1 << 20
+
+
+def parse_color(color: str) -> RGB:
+    """Convert an SVG colour (``#rgb``, ``#rrggbb``, ``rgb(...)`` or a basic name) to RGB."""
+
+    value = color.strip().lower()
+    if value in _NAMED_COLORS:
+        return _NAMED_COLORS[value]
+    if value.startswith("#") and len(value) in (4, 7):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(channel * 2 for channel in digits)
+        return tuple(float(int(digits[index : index + 2], 16)) for index in (0, 2, 4))  # type: ignore[return-value]
+    match = _RGB_PATTERN.fullmatch(value)
+    if match:
+        channels = []
+        for number, percent in zip(match.group(1, 3, 5), match.group(2, 4, 6)):
+            channels.append(float(number) * 2.55 if percent else float(number))
+        return tuple(channels)  # type: ignore[return-value]
+    raise ValueError(f"Unsupported colour specification: {color!r}")
+
+
+def rasterize_segments(
+    shape: Tuple[int, int],
+    start: ArrayLike,
+    end: ArrayLike,
+    *,
+    width: float = 1.0,
+) -> NDArray[np.float64]:
+    """Return the anti-aliased coverage of line segments on a pixel grid.
+
+    Coordinates are given in pixels with ``(0, 0)`` at the top-left corner of
+    the image. Every segment is sampled about twice per pixel and each sample
+    is splatted bilinearly onto the four surrounding pixel centres; strokes
+    wider than one pixel are drawn as several parallel passes. The returned
+    ``(height, width)`` array holds coverage values clipped to ``[0, 1]``.
+    """
+
+    height, image_width = shape
+    start = np.asarray(start, dtype=float).reshape(-1, 2)
+    end = np.asarray(end, dtype=float).reshape(-1, 2)
+    coverage = np.zeros(height * image_width, dtype=float)
+    if start.shape[0] == 0 or height == 0 or image_width == 0:
+        return coverage.reshape(height, image_width)
+
+    delta = end - start
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    counts = np.maximum(np.ceil(length * _SAMPLES_PER_PIXEL), 1).astype(np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = np.where(length[:, None] > 0, np.column_stack((-delta[:, 1], delta[:, 0])) / length[:, None], 0.0)
+    # Each sample stands for the stroke length it represents; points get one sample.
+    sample_weight = np.maximum(length, 1.0 / _SAMPLES_PER_PIXEL) / counts
+
+    # Parallel passes spread the stroke over its width; together they deposit
+    # ``width`` units of coverage per pixel of length.
+    passes = max(1, math.ceil(width))
+    lateral = (np.arange(passes) - (passes - 1) / 2.0) * (width / passes)
+    pass_weight = width / passes
+
+    cumulative = np.cumsum(counts)
+    batch_edges = np.searchsorted(cumulative, np.arange(_BATCH_SAMPLES, cumulative[-1], _BATCH_SAMPLES))
+    for first, last in zip(np.r_[0, batch_edges], np.r_[batch_edges, counts.size]):
+        if first == last:
+            continue
+        batch_counts = counts[first:last]
+        owner = np.repeat(np.arange(first, last), batch_counts)
+        local = np.arange(owner.size) - np.repeat(np.cumsum(batch_counts) - batch_counts, batch_counts)
+        t = (local + 0.5) / counts[owner]
+        points = start[owner] + t[:, None] * delta[owner]
+        weights = sample_weight[owner] * pass_weight
+        for offset in lateral:
+            _splat(coverage, points + offset * normal[owner], weights, height, image_width)
+
+    np.clip(coverage, 0.0, 1.0, out=coverage)
+    return coverage.reshape(height, image_width)
+
+
+def render_strokes(
+    shape: Tuple[int, int],
+    strokes: Iterable[Stroke],
+    *,
+    background: str = "white",
+) -> NDArray[np.uint8]:
+    """Composite stroke classes onto an RGB image, later strokes on top."""
+
+    height, width = shape
+    image = np.empty((height, width, 3), dtype=float)
+    image[...] = parse_color(background)
+    for start, end, color, stroke_width in strokes:
+        alpha = rasterize_segments(shape, start, end, width=stroke_width)[..., None]
+        image *= 1.0 - alpha
+        image += alpha * np.asarray(parse_color(color))
+    return np.clip(np.rint(image), 0, 255).astype(np.uint8)
+
+
+def write_png(path: str | Path, image: ArrayLike, *, compression: int = 6) -> None:
+    """Write an 8-bit greyscale ``(h, w)`` or RGB ``(h, w, 3)`` image as PNG."""
+
+    pixels = np.asarray(image)
+    if pixels.dtype != np.uint8:
+        raise ValueError("PNG output requires uint8 pixel data")
+    if pixels.ndim == 2:
+        color_type = 0
+        channels = 1
+    elif pixels.ndim == 3 and pixels.shape[2] == 3:
+        color_type = 2
+        channels = 3
+    else:
+        raise ValueError("Images must have shape (h, w) or (h, w, 3)")
+    height, width = pixels.shape[:2]
+    if height == 0 or width == 0:
+        raise ValueError("Images must contain at least one pixel")
+
+    # Every scanline is prefixed with filter type 0 (none).
+    scanlines = np.zeros((height, 1 + width * channels), dtype=np.uint8)
+    scanlines[:, 1:] = pixels.reshape(height, width * channels)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        handle.write(_PNG_SIGNATURE)
+        _write_chunk(handle, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0))
+        _write_chunk(handle, b"IDAT", zlib.compress(scanlines.tobytes(), compression))
+        _write_chunk(handle, b"IEND", b"")
+
+
+def _splat(coverage: np.ndarray, points: np.ndarray, weights: np.ndarray, height: int, width: int) -> None:
+    """Distribute *weights* bilinearly onto the pixel centres around *points*."""
+
+    grid = points - 0.5
+    base = np.floor(grid)
+    fraction = grid - base
+    base = base.astype(np.int64)
+    indices = []
+    shares = []
+    for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        column = base[:, 0] + dx
+        row = base[:, 1] + dy
+        share = (fraction[:, 0] if dx else 1.0 - fraction[:, 0]) * (fraction[:, 1] if dy else 1.0 - fraction[:, 1])
+        valid = (column >= 0) & (column < width) & (row >= 0) & (row < height)
+        indices.append(row[valid] * width + column[valid])
+        shares.append((weights * share)[valid])
+    coverage += np.bincount(np.concatenate(indices), weights=np.concatenate(shares), minlength=coverage.size)
+
+
+def _write_chunk(handle: BinaryIO, kind: bytes, data: bytes) -> None:
+    handle.write(struct.pack(">I", len(data)))
+    handle.write(kind)
+    handle.write(data)
+    handle.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
@@ -0,0 +1,167 @@
+"""Kinematic folding of fold line diagrams for verification."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .cross_section import CrossSectionSamples
+from .fold_pattern import FoldPattern, fold_line_gap
+from .honeycomb import column_point_y, ribbon_plan
+from .unfolding import ribbon_wall_frames
+
+
+FloatArray = NDArray[np.float64]
+
+__all__ = ["FoldedPattern", "FoldingReport", "simulate_folding", "verify_folding"]
+
+
+@dataclass(frozen=True)
+class FoldedPattern:
+    """Folded 3-D positions of the vertices of a fold line diagram.
+
+    ``positions[i, k, side]`` is vertex ``k`` of slit line ``i`` as part of
+    the ribbon to its left (``side == 0``) or right (``side == 1``). The two
+    copies coincide where the ribbons are glued and separate along the
+    cuts; copies without a ribbon, on the outer slit lines, are NaN.
+    """
+
+    positions: FloatArray
+    gap: float
+
+    def __post_init__(self) -> None:
+        positions = np.asarray(self.positions, dtype=float)
+        if positions.ndim != 4 or positions.shape[2:] != (2, 3):
+            raise ValueError("positions must have shape (n_slit_lines, n_fold_lines, 2, 3).")
+        object.__setattr__(self, "positions", positions)
+        object.__setattr__(self, "gap", float(self.gap))
+
+    @property
+    def glued(self) -> NDArray[np.bool_]:
+        """Mask of the ``(slit line, fold line)`` vertices shared by two ribbons."""
+
+        slit, line = np.indices(self.positions.shape[:2])
+        inner = (slit > 0) & (slit < self.positions.shape[0] - 1)
+        return inner & ((line % 4 < 2) == (slit % 2 == 0))
+
+    @property
+    def seam_error(self) -> float:
+        """Largest distance between the two copies of a glued vertex."""
+
+        shared = self.positions[self.glued]
+        if shared.size == 0:
+            return 0.0
+        return float(np.max(np.linalg.norm(shared[:, 0] - shared[:, 1], axis=1)))
+
+
+@dataclass(frozen=True)
+class FoldingReport:
+    """Deviation of a folded diagram from the cross section it was made for.
+
+    ``deviation`` has the shape of ``folded.positions`` without the last
+    axis and holds the distance of every vertex copy from its intended
+    position on the sampled upper or lower curve (NaN for missing copies).
+    """
+
+    folded: FoldedPattern
+    deviation: FloatArray
+
+    @property
+    def max_deviation(self) -> float:
+        return float(np.nanmax(self.deviation, initial=0.0))
+
+
+def simulate_folding(
+    pattern: FoldPattern,
+    *,
+    cell_size: float,
+    panel_length: float,
+    start: float = 0.0,
+    base: float = 0.0,
+) -> FoldedPattern:
+    """Fold the diagram of *pattern* into its honeycomb state.
+
+    Every band between two slit lines and two neighbouring fold lines is a
+    rigid wall strip. Its transform is derived from the diagram alone: the
+    fold lines of the band turn into the horizontal hexagon edges of the
+    honeycomb, whose columns start at ``start`` and are half a cell apart,
+    and the distance across the band becomes the height, running up on
+    even ribbons and down on odd ones. The strips are chained through the
+    a/b folds they share, starting with the first ribbon at height
+    ``base``. All strips are transformed with one batched product.
+    """
+
+    layout = pattern.vertex_layout(cell_size=cell_size, panel_length=panel_length)
+    num_slits, num_lines = layout.shape
+    if num_slits < 2:
+        raise ValueError("At least two slit lines are required.")
+    ribbons = num_slits - 1
+    walls = num_lines - 1
+
+    column_x = start + np.arange(num_slits) * (cell_size / 2.0)
+    sign, level, origin, along = ribbon_wall_frames(pattern, column_x, base, layout.gap, num_lines)
+    band = np.tile(np.arange(walls), ribbons)
+
+    # Wall strip w maps diagram points (u, v) to origin + (v - band * gap) * along at height level + sign * u.
+    matrices = np.zeros((sign.size, 3, 2))
+    matrices[:, :2, 1] = along
+    matrices[:, 2, 0] = sign
+    offsets = np.column_stack((origin - (band * layout.gap)[:, np.newaxis] * along, level))
+
+    # Corners of every strip: both slit lines at its first and second fold line.
+    ribbon = np.repeat(np.arange(ribbons), walls)
+    slit = ribbon[:, np.newaxis] + np.array([0, 1])
+    corners = np.empty((sign.size, 2, 2, 2))
+    for row in (0, 1):
+        corners[:, row, :, 0] = layout.x[slit, (band + row)[:, np.newaxis]]
+        corners[:, row, :, 1] = layout.y[band + row][:, np.newaxis]
+    folded = np.einsum("wij,wrsj->wrsi", matrices, corners) + offsets[:, np.newaxis, np.newaxis]
+
+    # Every fold line is taken from the strip above it, the last one from the strip below.
+    per_ribbon = np.empty((ribbons, num_lines, 2, 3))
+    folded = folded.reshape(ribbons, walls, 2, 2, 3)
+    per_ribbon[:, :-1] = folded[:, :, 0]
+    per_ribbon[:, -1] = folded[:, -1, 1]
+
+    positions = np.full((num_slits, num_lines, 2, 3), np.nan)
+    positions[1:, :, 0] = per_ribbon[:, :, 1]
+    positions[:-1, :, 1] = per_ribbon[:, :, 0]
+    return FoldedPattern(positions, layout.gap)
+
+
+def verify_folding(pattern: FoldPattern, samples: CrossSectionSamples, *, panel_length: float) -> FoldingReport:
+    """Fold *pattern* and measure how far it lands from *samples*.
+
+    Each vertex copy should end up on the honeycomb column of its ribbon
+    vertex, on the lower curve for the slit line a ribbon starts from and on
+    the upper one for the other. For linearised samples the deviation is
+    zero up to rounding.
+    """
+
+    num_slits = samples.x.size
+    if pattern.b_positions.size != num_slits:
+        raise ValueError("pattern and samples describe a different number of slit lines.")
+    folded = simulate_folding(
+        pattern,
+        cell_size=samples.cell_size,
+        panel_length=panel_length,
+        start=float(samples.x[0]),
+        base=float(samples.lower[0]),
+    )
+    num_lines = folded.positions.shape[1]
+    gap = fold_line_gap(samples.cell_size)
+
+    columns, points = ribbon_plan(num_slits, num_lines)
+    even = (np.arange(num_slits - 1) % 2 == 0)[:, np.newaxis]
+    target = np.empty((num_slits - 1, num_lines, 2, 3))
+    target[..., 0] = samples.x[columns][..., np.newaxis]
+    target[..., 1] = column_point_y(points[np.newaxis, :], columns, gap)[..., np.newaxis]
+    target[..., 0, 2] = np.where(even, samples.lower[columns], samples.upper[columns])
+    target[..., 1, 2] = np.where(even, samples.upper[columns], samples.lower[columns])
+
+    expected = np.full_like(folded.positions, np.nan)
+    expected[1:, :, 0] = target[:, :, 1]
+    expected[:-1, :, 1] = target[:, :, 0]
+    deviation = np.linalg.norm(folded.positions - expected, axis=-1)
+    return FoldingReport(folded, deviation)
@@ -0,0 +1,515 @@
+"""Uniform-grid spatial index and source mesh / honeycomb wall intersection."""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .honeycomb import HoneycombMesh
+from .parallel import SharedArray, attach_shared_array, share_array
+from .segments import SegmentTable, chain_segments
+
+
+FloatArray = NDArray[np.float64]
+IndexArray = NDArray[np.int64]
+
+__all__ = [
+    "SharedTriangleGrid",
+    "TriangleGrid",
+    "WallIntersections",
+    "attach_triangle_grid",
+    "build_triangle_grid",
+    "intersect_walls",
+    "share_triangle_grid",
+]
+
+# Target number of grid cells per triangle when no cell size is given.
+_CELLS_PER_TRIANGLE = 2.0
+
+
+@dataclass(frozen=True)
+class TriangleGrid:
+    """Triangles bucketed into a uniform 3-D grid of cubic cells.
+
+    The triangles overlapping flat cell ``c`` are
+    ``triangle_ids[offsets[c]:offsets[c + 1]]``; a triangle is listed in
+    every cell touched by its bounding box.
+    """
+
+    triangles: FloatArray
+    origin: FloatArray
+    cell_size: float
+    shape: Tuple[int, int, int]
+    offsets: IndexArray
+    triangle_ids: IndexArray
+
+    def candidate_pairs(self, low: ArrayLike, high: ArrayLike) -> Tuple[IndexArray, IndexArray]:
+        """Return ``(box, triangle)`` pairs whose bounding boxes overlap.
+
+        *low* and *high* are ``(n, 3)`` box corners. Every box is expanded to
+        the grid cells it touches, the cells to their triangles, and the
+        pairs are deduplicated and filtered by an exact bounding-box test.
+        """
+
+        low = np.asarray(low, dtype=float).reshape(-1, 3)
+        high = np.asarray(high, dtype=float).reshape(-1, 3)
+        box, cell = _expand_cells(low, high, self.origin, self.cell_size, self.shape)
+        counts = self.offsets[cell + 1] - self.offsets[cell]
+        box = np.repeat(box, counts)
+        local = np.arange(box.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        triangle = self.triangle_ids[np.repeat(self.offsets[cell], counts) + local]
+
+        count = self.triangles.shape[0]
+        pairs = np.unique(box * count + triangle)
+        box, triangle = pairs // count, pairs % count
+        corners = self.triangles[triangle]
+        overlap = np.all((corners.min(axis=1) <= high[box]) & (corners.max(axis=1) >= low[box]), axis=1)
+        return box[overlap], triangle[overlap]
+
+    def closest_points(
+        self, points: ArrayLike, *, chunk_size: int = 1 << 14
+    ) -> Tuple[FloatArray, IndexArray, FloatArray]:
+        """Return the distance, triangle and closest point for every query point.
+
+        Each point starts in its (clamped) grid cell and searches growing
+        shells of cells around it. A point is finished once its best distance
+        does not exceed the distance to the boundary of the searched block,
+        beyond which no closer triangle can lie. Shell cells farther away than
+        the best triangle found so far are skipped, and all active points of
+        a chunk advance one shell per step.
+        """
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than zero")
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        distance = np.empty(points.shape[0])
+        triangle = np.empty(points.shape[0], dtype=np.int64)
+        closest = np.empty_like(points)
+        for offset in range(0, points.shape[0], chunk_size):
+            block = slice(offset, offset + chunk_size)
+            distance[block], triangle[block], closest[block] = self._closest_block(points[block])
+        return distance, triangle, closest
+
+    def _closest_block(self, points: FloatArray) -> Tuple[FloatArray, IndexArray, FloatArray]:
+        shape = np.asarray(self.shape)
+        home = np.clip(np.floor((points - self.origin) / self.cell_size).astype(np.int64), 0, shape - 1)
+        best = np.full(points.shape[0], np.inf)
+        best_triangle = np.full(points.shape[0], -1, dtype=np.int64)
+        best_point = np.full_like(points, np.nan)
+        active = np.arange(points.shape[0])
+
+        for ring in range(int(shape.max()) + 1):
+            # Nearer cells of the shell go first so that their hits prune the farther ones.
+            for offsets in _shell_offsets(ring):
+                cells = home[active, np.newaxis, :] + offsets
+                self._search_cells(points, active, cells, best, best_triangle, best_point)
+
+            # Distance from each point to the faces of its searched block; faces on the grid border never bind.
+            low = self.origin + (home[active] - ring) * self.cell_size
+            high = self.origin + (home[active] + ring + 1) * self.cell_size
+            below = np.where(home[active] - ring > 0, points[active] - low, np.inf)
+            above = np.where(home[active] + ring + 1 < shape, high - points[active], np.inf)
+            certain = np.minimum(below, above).min(axis=1)
+            active = active[best[active] > certain]
+            if active.size == 0:
+                break
+        return best, best_triangle, best_point
+
+    def _search_cells(
+        self,
+        points: FloatArray,
+        active: IndexArray,
+        cells: IndexArray,
+        best: FloatArray,
+        best_triangle: IndexArray,
+        best_point: FloatArray,
+    ) -> None:
+        """Update the best triangles of the *active* points from their ``(n, k, 3)`` *cells*."""
+
+        shape = np.asarray(self.shape)
+        inside = np.all((cells >= 0) & (cells < shape), axis=2)
+        owner = np.broadcast_to(active[:, np.newaxis], inside.shape)[inside]
+        cells = cells[inside]
+        # Cells farther away than the best triangle so far cannot improve it.
+        low = self.origin + cells * self.cell_size
+        outside = np.maximum(np.maximum(low - points[owner], points[owner] - low - self.cell_size), 0.0)
+        near = np.einsum("ij,ij->i", outside, outside) < best[owner] ** 2
+        owner, cells = owner[near], cells[near]
+        flat = (cells[:, 0] * shape[1] + cells[:, 1]) * shape[2] + cells[:, 2]
+        counts = self.offsets[flat + 1] - self.offsets[flat]
+        owner = np.repeat(owner, counts)
+        if owner.size == 0:
+            return
+        local = np.arange(owner.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidate = self.triangle_ids[np.repeat(self.offsets[flat], counts) + local]
+
+        # Owners are sorted, so per-point minima are segment reductions. Pairs whose bounding
+        # box is farther than some candidate vertex of the same point are dropped unevaluated.
+        corners = self.triangles[candidate]
+        query = points[owner]
+        a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+        outside = np.maximum(
+            np.maximum(np.minimum(np.minimum(a, b), c) - query, query - np.maximum(np.maximum(a, b), c)), 0.0
+        )
+        lower = np.einsum("ij,ij->i", outside, outside)
+        upper = np.einsum("ij,ij->i", a - query, a - query)
+        starts = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+        bound = np.minimum(np.minimum.reduceat(upper, starts), best[owner[starts]] ** 2)
+        keep = lower <= np.repeat(bound, np.diff(np.r_[starts, owner.size]))
+        owner, candidate, corners, query = owner[keep], candidate[keep], corners[keep], query[keep]
+        if not keep.any():
+            return
+
+        point = _closest_on_triangles(query, corners)
+        squared = np.einsum("ij,ij->i", point - query, point - query)
+        order = np.lexsort((squared, owner))
+        first = order[np.flatnonzero(np.r_[True, owner[order][1:] != owner[order][:-1]])]
+        found = owner[first]
+        better = squared[first] < best[found] ** 2
+        found, first = found[better], first[better]
+        best[found] = np.sqrt(squared[first])
+        best_triangle[found] = candidate[first]
+        best_point[found] = point[first]
+
+
+@dataclass(frozen=True)
+class WallIntersections:
+    """Intersection segments of a source mesh with honeycomb walls.
+
+    Segment ``j`` lies on wall ``wall[j]`` and runs from ``start[j]`` to
+    ``end[j]`` in 3-D; segments are sorted by wall, so the segments of wall
+    ``w`` are ``offsets[w]:offsets[w + 1]``. ``local_start`` and
+    ``local_end`` hold the same points as ``(s, z)`` coordinates within the
+    wall, where ``s`` runs from ``wall_origin`` along the unit horizontal
+    ``wall_direction`` of the wall.
+    """
+
+    wall: IndexArray
+    start: FloatArray
+    end: FloatArray
+    local_start: FloatArray
+    local_end: FloatArray
+    wall_origin: FloatArray
+    wall_direction: FloatArray
+
+    def __len__(self) -> int:
+        return int(self.wall.size)
+
+    @property
+    def wall_count(self) -> int:
+        return int(self.wall_origin.shape[0])
+
+    @property
+    def offsets(self) -> IndexArray:
+        return np.searchsorted(self.wall, np.arange(self.wall_count + 1))
+
+    def polylines(self, wall: int, *, tolerance: float = 1e-6) -> List[FloatArray]:
+        """Chain the segments of *wall* into 3-D polylines."""
+
+        first, last = self.offsets[wall : wall + 2]
+        if first == last:
+            return []
+        local = SegmentTable(
+            self.local_start[first:last],
+            self.local_end[first:last],
+            np.zeros(last - first, dtype=np.uint8),
+        )
+        chained = chain_segments(local, tolerance=tolerance)
+        xy = self.wall_origin[wall] + chained.points[:, :1] * self.wall_direction[wall]
+        points = np.column_stack((xy, chained.points[:, 1]))
+        return [points[chained.offsets[index] : chained.offsets[index + 1]] for index in range(len(chained))]
+
+
+def build_triangle_grid(triangles: ArrayLike, *, cell_size: float | None = None) -> TriangleGrid:
+    """Bucket ``(n, 3, 3)`` *triangles* into a :class:`TriangleGrid`.
+
+    Without a ``cell_size`` the cells are sized like the median triangle
+    bounding box, enlarged if that would create more than a few cells per
+    triangle, so building and querying stay linear in the mesh size.
+    """
+
+    triangles = np.ascontiguousarray(triangles, dtype=float).reshape(-1, 3, 3)
+    if triangles.shape[0] == 0:
+        raise ValueError("Triangle array does not contain any geometry")
+    low = triangles.min(axis=1)
+    high = triangles.max(axis=1)
+    origin = low.min(axis=0)
+    extent = np.maximum(high.max(axis=0) - origin, 1e-12)
+
+    if cell_size is None:
+        cell_size = max(float(np.median(np.max(high - low, axis=1))), float(extent.max()) * 1e-6)
+        cells = np.prod(np.ceil(extent / cell_size))
+        budget = _CELLS_PER_TRIANGLE * triangles.shape[0]
+        if cells > budget:
+            cell_size *= float((cells / budget) ** (1.0 / 3.0))
+    if cell_size <= 0:
+        raise ValueError("cell_size must be positive.")
+    shape = tuple(int(value) for value in np.maximum(np.ceil(extent / cell_size), 1))
+
+    triangle, cell = _expand_cells(low, high, origin, cell_size, shape)
+    order = np.argsort(cell, kind="stable")
+    counts = np.bincount(cell, minlength=int(np.prod(shape)))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    return TriangleGrid(triangles, origin, float(cell_size), shape, offsets, triangle[order])
+
+
+@dataclass(frozen=True)
+class SharedTriangleGrid:
+    """Picklable description of a :class:`TriangleGrid` in shared memory."""
+
+    triangles: SharedArray
+    offsets: SharedArray
+    triangle_ids: SharedArray
+    origin: FloatArray
+    cell_size: float
+    shape: Tuple[int, int, int]
+
+
+@contextmanager
+def share_triangle_grid(grid: TriangleGrid) -> Iterator[SharedTriangleGrid]:
+    """Copy the arrays of *grid* into shared memory for the duration of the context.
+
+    Worker processes rebuild the grid from the yielded handle with
+    :func:`attach_triangle_grid`.
+    """
+
+    with ExitStack() as stack:
+        triangles, offsets, triangle_ids = (
+            stack.enter_context(share_array(array)) for array in (grid.triangles, grid.offsets, grid.triangle_ids)
+        )
+        yield SharedTriangleGrid(triangles, offsets, triangle_ids, grid.origin, grid.cell_size, grid.shape)
+
+
+@contextmanager
+def attach_triangle_grid(handle: SharedTriangleGrid) -> Iterator[TriangleGrid]:
+    """Map the grid described by *handle* without copying its arrays."""
+
+    with ExitStack() as stack:
+        triangles, offsets, triangle_ids = (
+            stack.enter_context(attach_shared_array(array))
+            for array in (handle.triangles, handle.offsets, handle.triangle_ids)
+        )
+        yield TriangleGrid(triangles, handle.origin, handle.cell_size, handle.shape, offsets, triangle_ids)
+
+
+def intersect_walls(
+    triangles: ArrayLike,
+    mesh: HoneycombMesh,
+    *,
+    cell_size: float | None = None,
+    chunk_size: int = 1 << 14,
+    processes: int | None = None,
+) -> WallIntersections:
+    """Intersect source *triangles* with every wall of the honeycomb *mesh*.
+
+    *triangles* is a ``(n, 3, 3)`` triangle soup such as the result of
+    :func:`~kirigami_honeycomb.mesh_io.load_triangles`. The walls are
+    queried in chunks against a :class:`TriangleGrid`; each candidate
+    triangle is cut with the vertical plane of its wall and the cut is
+    clipped to the wall quad. With ``processes`` greater than one the walls
+    are split into blocks handled by a process pool that reads the triangles
+    and grid from shared memory.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be at least one")
+    grid = build_triangle_grid(triangles, cell_size=cell_size)
+    quads = mesh.wall_quads
+
+    if processes is None or processes == 1 or quads.shape[0] < 2:
+        parts = [_intersect_block(grid, quads, 0, chunk_size)]
+    else:
+        blocks = np.array_split(np.arange(quads.shape[0]), min(processes, quads.shape[0]))
+        with ExitStack() as stack:
+            handle = stack.enter_context(share_triangle_grid(grid))
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=processes))
+            futures = [
+                pool.submit(_intersect_worker, handle, quads[block], int(block[0]), chunk_size) for block in blocks
+            ]
+            parts = [future.result() for future in futures]
+
+    wall, start, end, local_start, local_end = (np.concatenate(values) for values in zip(*parts))
+    origin, direction, _ = _wall_frames(quads)
+    return WallIntersections(wall, start, end, local_start, local_end, origin, direction)
+
+
+def _intersect_worker(handle: SharedTriangleGrid, quads: FloatArray, first_wall: int, chunk_size: int):
+    with attach_triangle_grid(handle) as grid:
+        return _intersect_block(grid, quads, first_wall, chunk_size)
+
+
+def _intersect_block(grid: TriangleGrid, quads: FloatArray, first_wall: int, chunk_size: int):
+    parts = []
+    for offset in range(0, quads.shape[0], chunk_size):
+        block = quads[offset : offset + chunk_size]
+        wall, triangle = grid.candidate_pairs(block.min(axis=1), block.max(axis=1))
+        segments = _clip_to_walls(block[wall], grid.triangles[triangle])
+        keep, start, end, local_start, local_end = segments
+        parts.append((wall[keep] + offset + first_wall, start, end, local_start, local_end))
+    if not parts:
+        empty = np.empty((0, 3))
+        return np.empty(0, dtype=np.int64), empty, empty, np.empty((0, 2)), np.empty((0, 2))
+    return tuple(np.concatenate(values) for values in zip(*parts))
+
+
+def _clip_to_walls(quads: FloatArray, triangles: FloatArray):
+    """Cut each triangle with the plane of its wall and clip the cut to the quad.
+
+    Returns the mask of pairs that produced a segment and the segment end
+    points in 3-D and in wall coordinates ``(s, z)``.
+    """
+
+    origin, along, length = _wall_frames(quads)
+    normal = np.column_stack((-along[:, 1], along[:, 0]))
+
+    relative = triangles[:, :, :2] - origin[:, np.newaxis, :]
+    distance = np.einsum("nvk,nk->nv", relative, normal)
+    s = np.einsum("nvk,nk->nv", relative, along)
+    z = triangles[:, :, 2]
+
+    # A triangle crosses the plane along exactly two edges whose end points
+    # lie on different sides, counting points on the plane as below it.
+    above = distance > 0
+    points = []
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        crosses = above[:, i] != above[:, j]
+        denominator = np.where(crosses, distance[:, i] - distance[:, j], 1.0)
+        t = np.where(crosses, distance[:, i] / denominator, np.nan)
+        points.append((crosses, s[:, i] + t * (s[:, j] - s[:, i]), z[:, i] + t * (z[:, j] - z[:, i])))
+    crossings = np.column_stack([crosses for crosses, _, _ in points])
+    hit = crossings.sum(axis=1) == 2
+    first_edge = np.argmax(crossings, axis=1)
+    second_edge = 2 - np.argmax(crossings[:, ::-1], axis=1)
+    s_values = np.column_stack([values for _, values, _ in points])
+    z_values = np.column_stack([values for _, _, values in points])
+    rows = np.arange(quads.shape[0])
+    a = np.column_stack((s_values[rows, first_edge], z_values[rows, first_edge]))
+    b = np.column_stack((s_values[rows, second_edge], z_values[rows, second_edge]))
+
+    # Clip against s >= 0, s <= length and the sloped lower and upper edges.
+    top0, top1, bottom1, bottom0 = (quads[:, index, 2] for index in range(4))
+    safe_length = np.where(length > 0, length, 1.0)
+    top_slope = (top1 - top0) / safe_length
+    bottom_slope = (bottom1 - bottom0) / safe_length
+    t_enter = np.zeros(quads.shape[0])
+    t_exit = np.ones(quads.shape[0])
+    for coefficient_s, coefficient_z, constant in (
+        (-np.ones_like(length), np.zeros_like(length), np.zeros_like(length)),
+        (np.ones_like(length), np.zeros_like(length), -length),
+        (bottom_slope, -np.ones_like(length), bottom0),
+        (-top_slope, np.ones_like(length), -top0),
+    ):
+        value_a = coefficient_s * a[:, 0] + coefficient_z * a[:, 1] + constant
+        value_b = coefficient_s * b[:, 0] + coefficient_z * b[:, 1] + constant
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = value_a / (value_a - value_b)
+        t_enter = np.where((value_a > 0) & (value_b <= 0), np.maximum(t_enter, t), t_enter)
+        t_exit = np.where((value_b > 0) & (value_a <= 0), np.minimum(t_exit, t), t_exit)
+        t_exit = np.where((value_a > 0) & (value_b > 0), -1.0, t_exit)
+
+    keep = hit & (length > 0) & (t_enter < t_exit)
+    a, b = a[keep], b[keep]
+    t_enter, t_exit = t_enter[keep, np.newaxis], t_exit[keep, np.newaxis]
+    local_start = a + t_enter * (b - a)
+    local_end = a + t_exit * (b - a)
+
+    def _to_world(local: FloatArray) -> FloatArray:
+        xy = origin[keep] + local[:, :1] * along[keep]
+        return np.column_stack((xy, local[:, 1]))
+
+    return keep, _to_world(local_start), _to_world(local_end), local_start, local_end
+
+
+def _expand_cells(
+    low: FloatArray,
+    high: FloatArray,
+    origin: FloatArray,
+    cell_size: float,
+    shape: Tuple[int, int, int],
+) -> Tuple[IndexArray, IndexArray]:
+    """Pair every box with the flat indices of the grid cells it touches."""
+
+    limit = np.asarray(shape) - 1
+    first = np.clip(np.floor((low - origin) / cell_size).astype(np.int64), 0, limit)
+    last = np.clip(np.floor((high - origin) / cell_size).astype(np.int64), 0, limit)
+    outside = np.any((high < origin) | (low > origin + np.asarray(shape) * cell_size), axis=1)
+    span = np.where(outside[:, np.newaxis], 0, last - first + 1)
+    counts = span.prod(axis=1)
+
+    box = np.repeat(np.arange(low.shape[0]), counts)
+    local = np.arange(box.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    span = span[box]
+    k = local % span[:, 2]
+    j = (local // span[:, 2]) % span[:, 1]
+    i = local // (span[:, 2] * span[:, 1])
+    start = first[box]
+    cell = ((start[:, 0] + i) * shape[1] + start[:, 1] + j) * shape[2] + start[:, 2] + k
+    return box, cell
+
+
+def _wall_frames(quads: FloatArray) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    """Horizontal origin, unit direction and length of every wall."""
+
+    origin = quads[:, 0, :2]
+    along = quads[:, 1, :2] - origin
+    length = np.hypot(along[:, 0], along[:, 1])
+    return origin, along / np.where(length > 0, length, 1.0)[:, np.newaxis], length
+
+
+def _shell_offsets(ring: int) -> List[IndexArray]:
+    """Cell offsets at Chebyshev distance *ring*, grouped by increasing length."""
+
+    axis = np.arange(-ring, ring + 1)
+    offsets = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+    offsets = offsets[np.abs(offsets).max(axis=1) == ring]
+    length = np.einsum("ij,ij->i", offsets, offsets)
+    order = np.argsort(length, kind="stable")
+    splits = np.flatnonzero(np.diff(length[order])) + 1
+    return np.split(offsets[order], splits)
+
+
+def _closest_on_triangles(points: FloatArray, triangles: FloatArray) -> FloatArray:
+    """Closest point on each triangle to the matching point.
+
+    Vectorised form of the Voronoi region classification from Ericson's
+    Real-Time Collision Detection; regions are resolved with masks, the
+    vertex regions taking precedence over the edge regions over the face.
+    """
+
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, ac = b - a, c - a
+
+    def _dot(u: FloatArray, v: FloatArray) -> FloatArray:
+        return np.einsum("ij,ij->i", u, v)
+
+    ap, bp, cp = points - a, points - b, points - c
+    d1, d2 = _dot(ab, ap), _dot(ac, ap)
+    d3, d4 = _dot(ab, bp), _dot(ac, bp)
+    d5, d6 = _dot(ab, cp), _dot(ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = va + vb + vc
+        v = np.where(total != 0, vb / total, 0.0)
+        w = np.where(total != 0, vc / total, 0.0)
+        result = a + v[:, np.newaxis] * ab + w[:, np.newaxis] * ac
+        regions = (
+            ((va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0), b, c - b, (d4 - d3) / ((d4 - d3) + (d5 - d6))),
+            ((vb <= 0) & (d2 >= 0) & (d6 <= 0), a, ac, d2 / (d2 - d6)),
+            ((d6 >= 0) & (d5 <= d6), c, ab, np.zeros_like(d1)),
+            ((vc <= 0) & (d1 >= 0) & (d3 <= 0), a, ab, d1 / (d1 - d3)),
+            ((d3 >= 0) & (d4 <= d3), b, ab, np.zeros_like(d1)),
+            ((d1 <= 0) & (d2 <= 0), a, ab, np.zeros_like(d1)),
+        )
+        for mask, start, edge, t in regions:
+            t = np.nan_to_num(t)[:, np.newaxis]
+            result = np.where(mask[:, np.newaxis], start + t * edge, result)
+    return result
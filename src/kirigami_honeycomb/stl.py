@@ -0,0 +1,135 @@
+"""Lightweight binary STL reading and writing without building a full mesh object."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+__all__ = ["STL_RECORD_DTYPE", "is_binary_stl", "iter_stl_triangles", "read_stl_triangles", "write_stl"]
+
+STL_HEADER_SIZE = 80
+STL_PREAMBLE_SIZE = STL_HEADER_SIZE + 4
+
+# One binary STL facet: normal, three corners and the attribute byte count.
+STL_RECORD_DTYPE = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attribute", "<u2"),
+    ]
+)
+
+
+def is_binary_stl(path: str | Path) -> bool:
+    """Return ``True`` if *path* is a well-formed binary STL file.
+
+    The check relies on the facet count stored in the preamble matching the
+    file size, which distinguishes binary files from ASCII ones even when the
+    binary header happens to start with ``solid``.
+    """
+
+    path = Path(path)
+    if path.suffix.lower() != ".stl" or not path.is_file():
+        return False
+    size = path.stat().st_size
+    if size < STL_PREAMBLE_SIZE:
+        return False
+    return size == STL_PREAMBLE_SIZE + _facet_count(path) * STL_RECORD_DTYPE.itemsize
+
+
+def read_stl_triangles(path: str | Path) -> np.ndarray:
+    """Memory-map the triangle corners of a binary STL file.
+
+    Returns a read-only ``(n_triangles, 3, 3)`` ``float32`` view into the file.
+    No data is copied up front; pages are read by the operating system as the
+    coordinates are accessed, so the triangle soup can be streamed into the
+    slicing routines without building vertex or adjacency tables.
+    """
+
+    path = Path(path)
+    if not is_binary_stl(path):
+        raise ValueError(f"{path} is not a binary STL file")
+    count = _facet_count(path)
+    if count == 0:
+        raise ValueError("STL file does not contain any triangles")
+
+    records = np.memmap(path, dtype=STL_RECORD_DTYPE, mode="r", offset=STL_PREAMBLE_SIZE, shape=(count,))
+    return records["vertices"]
+
+
+def iter_stl_triangles(path: str | Path, *, chunk_size: int = 1 << 16) -> Iterator[np.ndarray]:
+    """Yield the triangle corners of a binary STL file in fixed-size chunks.
+
+    Each chunk is a ``(k, 3, 3)`` ``float32`` array with ``k <= chunk_size``
+    read with a single buffered call, so memory use is bounded by the chunk
+    size rather than the file size.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    path = Path(path)
+    if not is_binary_stl(path):
+        raise ValueError(f"{path} is not a binary STL file")
+
+    remaining = _facet_count(path)
+    with path.open("rb") as handle:
+        handle.seek(STL_PREAMBLE_SIZE)
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            records = np.fromfile(handle, dtype=STL_RECORD_DTYPE, count=count)
+            if records.size != count:
+                raise ValueError(f"{path} ended unexpectedly")
+            remaining -= count
+            yield records["vertices"]
+
+
+def write_stl(
+    path: str | Path,
+    vertices: ArrayLike,
+    faces: ArrayLike,
+    *,
+    chunk_size: int | None = None,
+    header: bytes = b"kirigami_honeycomb",
+) -> None:
+    """Write a triangle mesh as binary STL.
+
+    Facet normals are computed from the corner order. The facets are
+    assembled in a structured array of :data:`STL_RECORD_DTYPE` and written
+    with a single :meth:`numpy.ndarray.tofile` call, or one call per
+    ``chunk_size`` faces to bound the memory used for very large meshes.
+    """
+
+    vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    if len(header) > STL_HEADER_SIZE:
+        raise ValueError(f"STL headers are limited to {STL_HEADER_SIZE} bytes")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    step = faces.shape[0] if chunk_size is None else chunk_size
+    with path.open("wb") as handle:
+        handle.write(header.ljust(STL_HEADER_SIZE, b"\0"))
+        handle.write(np.array([faces.shape[0]], dtype="<u4").tobytes())
+        for offset in range(0, faces.shape[0], max(step, 1)):
+            corners = vertices[faces[offset : offset + step]]
+            records = np.zeros(corners.shape[0], dtype=STL_RECORD_DTYPE)
+            records["vertices"] = corners
+            records["normal"] = _facet_normals(corners)
+            records.tofile(handle)
+
+
+def _facet_normals(corners: np.ndarray) -> np.ndarray:
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+
+def _facet_count(path: Path) -> int:
+    with path.open("rb") as handle:
+        handle.seek(STL_HEADER_SIZE)
+        return int(np.frombuffer(handle.read(4), dtype="<u4")[0])
@@ -1,16 +1,38 @@
 """SVG export helpers for fold line diagrams."""
 from __future__ import annotations
 
+import math
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable, Mapping
 
+import numpy as np
 import svgwrite
 
 from .cross_section import CrossSectionSamples
 from .fold_pattern import FoldPattern
+from .raster import render_strokes, write_png
+from .segments import SegmentKind, SegmentTable, merge_collinear_segments
 
 
 DEFAULT_STROKE = svgwrite.rgb(10, 10, 16, "%")
+UPPER_STROKE = "#0a6"
+LOWER_STROKE = "#c41"
+SEGMENT_STROKES: Mapping[SegmentKind, str] = {
+    SegmentKind.CUT: "black",
+    SegmentKind.FOLD: "green",
+    SegmentKind.PERFORATION: "red",
+    SegmentKind.MARK: "blue",
+}
+
+# Segments formatted per write call by the streaming exporters.
+_WRITE_CHUNK = 1 << 15
+
+_SVG_HEADER = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg baseProfile="full" height="{height}" version="1.1" width="{width}"{extra} '
+    'xmlns="http://www.w3.org/2000/svg">'
+)
 
 
 def _line(dwg: svgwrite.Drawing, start: tuple[float, float], end: tuple[float, float]) -> svgwrite.shapes.Line:
@@ -27,7 +49,16 @@ def _polyline(
 
 
 def export_fold_diagram(samples: CrossSectionSamples, pattern: FoldPattern, output: Path) -> None:
-    """Write a simple SVG visualisation of the fold pattern."""
+    """Write a simple SVG visualisation of the fold pattern.
+
+    Paths ending in ``.png`` receive a raster preview rendered by
+    :func:`render_fold_diagram` instead.
+    """
+
+    output = Path(output)
+    if output.suffix.lower() == ".png":
+        write_png(output, render_fold_diagram(samples, pattern))
+        return
 
     x, upper, lower = samples.as_tuple()
     width = pattern.length
@@ -43,18 +74,191 @@ def export_fold_diagram(samples: CrossSectionSamples, pattern: FoldPattern, outp
 
     upper_points = [_transform(xi, yi) for xi, yi in zip(x, upper)]
     lower_points = [_transform(xi, yi) for xi, yi in zip(x, lower)]
-    dwg.add(_polyline(dwg, upper_points, stroke="#0a6"))
-    dwg.add(_polyline(dwg, lower_points, stroke="#c41"))
-
-    for position in pattern.a_positions:
-        start = (padding + position, padding)
-        end = (padding + position, padding + height)
-        dwg.add(_line(dwg, start=start, end=end))
+    dwg.add(_polyline(dwg, upper_points, stroke=UPPER_STROKE))
+    dwg.add(_polyline(dwg, lower_points, stroke=LOWER_STROKE))
 
-    for position in pattern.b_positions:
-        start = (padding + position, padding)
-        end = (padding + position, padding + height)
-        dwg.add(_line(dwg, start=start, end=end))
+    lines = _fold_lines(pattern, padding=padding, height=height)
+    for start, end in zip(lines.start.tolist(), lines.end.tolist()):
+        dwg.add(_line(dwg, start=tuple(start), end=tuple(end)))
 
     output.parent.mkdir(parents=True, exist_ok=True)
     dwg.saveas(str(output))
+
+
+@dataclass(frozen=True)
+class _DiagramGeometry:
+    """Drawing-space geometry of :func:`export_fold_diagram` as arrays."""
+
+    width: float
+    height: float
+    upper: np.ndarray
+    lower: np.ndarray
+    line_start: np.ndarray
+    line_end: np.ndarray
+
+
+def _diagram_geometry(samples: CrossSectionSamples, pattern: FoldPattern) -> _DiagramGeometry:
+    min_lower = float(np.min(samples.lower))
+    height = float(np.max(samples.upper)) - min_lower
+    padding = samples.cell_size
+
+    def _transform(values: np.ndarray) -> np.ndarray:
+        return np.column_stack((padding + samples.x, padding + height - (values - min_lower)))
+
+    lines = _fold_lines(pattern, padding=padding, height=height)
+
+    return _DiagramGeometry(
+        width=pattern.length + padding * 2,
+        height=height + padding * 2,
+        upper=_transform(samples.upper),
+        lower=_transform(samples.lower),
+        line_start=lines.start,
+        line_end=lines.end,
+    )
+
+
+def _fold_lines(pattern: FoldPattern, *, padding: float, height: float) -> SegmentTable:
+    """Vertical fold lines at the a and b positions, with coinciding lines merged."""
+
+    positions = padding + np.concatenate((pattern.a_positions, pattern.b_positions))
+    lines = SegmentTable(
+        np.column_stack((positions, np.full_like(positions, padding))),
+        np.column_stack((positions, np.full_like(positions, padding + height))),
+        np.full(positions.size, SegmentKind.FOLD, dtype=np.uint8),
+    )
+    return merge_collinear_segments(lines)
+
+
+def render_fold_diagram(
+    samples: CrossSectionSamples,
+    pattern: FoldPattern,
+    *,
+    pixels_per_unit: float = 4.0,
+    max_size: int = 1024,
+) -> np.ndarray:
+    """Rasterise the :func:`export_fold_diagram` drawing into an RGB array.
+
+    The drawing is scaled by ``pixels_per_unit`` but never exceeds
+    ``max_size`` pixels along its longer side, which keeps previews of very
+    large panels cheap.
+    """
+
+    if pixels_per_unit <= 0 or max_size <= 0:
+        raise ValueError("pixels_per_unit and max_size must be positive.")
+    geometry = _diagram_geometry(samples, pattern)
+    scale = min(pixels_per_unit, max_size / max(geometry.width, geometry.height))
+    shape = (max(1, math.ceil(geometry.height * scale)), max(1, math.ceil(geometry.width * scale)))
+
+    def _stroke(points: np.ndarray, color: str, width: float):
+        return points[:-1] * scale, points[1:] * scale, color, width * scale
+
+    strokes = [
+        _stroke(geometry.upper, UPPER_STROKE, 0.6),
+        _stroke(geometry.lower, LOWER_STROKE, 0.6),
+        (geometry.line_start * scale, geometry.line_end * scale, DEFAULT_STROKE, 0.5 * scale),
+    ]
+    return render_strokes(shape, strokes)
+
+
+def export_fold_diagram_fast(
+    samples: CrossSectionSamples,
+    pattern: FoldPattern,
+    output: Path,
+    *,
+    precision: int = 3,
+) -> None:
+    """Stream the :func:`export_fold_diagram` drawing without svgwrite objects.
+
+    The coordinates are formatted in bulk and all fold lines are merged into
+    a single ``<path>`` element, which keeps export time and file size low
+    for diagrams with a very large number of lines.
+    """
+
+    geometry = _diagram_geometry(samples, pattern)
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as handle:
+        handle.write(_SVG_HEADER.format(height=geometry.height, width=geometry.width, extra=""))
+        _write_polyline(handle, geometry.upper, stroke=UPPER_STROKE, stroke_width=0.6, precision=precision)
+        _write_polyline(handle, geometry.lower, stroke=LOWER_STROKE, stroke_width=0.6, precision=precision)
+        _write_path(
+            handle,
+            geometry.line_start,
+            geometry.line_end,
+            stroke=DEFAULT_STROKE,
+            stroke_width=0.5,
+            precision=precision,
+        )
+        handle.write("</svg>\n")
+
+
+def export_segment_table(
+    table: SegmentTable,
+    output: Path,
+    *,
+    stroke_width: float = 0.2,
+    precision: int = 3,
+    strokes: Mapping[SegmentKind, str] = SEGMENT_STROKES,
+) -> None:
+    """Stream a :class:`SegmentTable` to SVG with one ``<path>`` per stroke class.
+
+    Coordinates are written in millimetres with the view box fitted to the
+    segment bounds.
+    """
+
+    min_x, min_y, max_x, max_y = table.bounds
+    width = max_x - min_x + stroke_width
+    height = max_y - min_y + stroke_width
+    view_box = f' viewBox="{min_x - stroke_width / 2} {min_y - stroke_width / 2} {width} {height}"'
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as handle:
+        handle.write(_SVG_HEADER.format(height=f"{height}mm", width=f"{width}mm", extra=view_box))
+        for kind in SegmentKind:
+            mask = table.kind == kind
+            if np.any(mask):
+                _write_path(
+                    handle,
+                    table.start[mask],
+                    table.end[mask],
+                    stroke=strokes[kind],
+                    stroke_width=stroke_width,
+                    precision=precision,
+                )
+        handle.write("</svg>\n")
+
+
+def _write_path(
+    handle: IO[str],
+    start: np.ndarray,
+    end: np.ndarray,
+    *,
+    stroke: str,
+    stroke_width: float,
+    precision: int,
+) -> None:
+    """Write all segments as the move/line commands of one ``<path>``."""
+
+    template = "M{0} {0}L{0} {0}".format(f"%.{precision}f")
+    handle.write(f'<path fill="none" stroke="{stroke}" stroke-width="{stroke_width}" d="')
+    for offset in range(0, len(start), _WRITE_CHUNK):
+        values = np.column_stack((start[offset : offset + _WRITE_CHUNK], end[offset : offset + _WRITE_CHUNK]))
+        handle.write((template * values.shape[0]) % tuple(values.ravel().tolist()))
+    handle.write('" />')
+
+
+def _write_polyline(
+    handle: IO[str],
+    points: np.ndarray,
+    *,
+    stroke: str,
+    stroke_width: float,
+    precision: int,
+) -> None:
+    template = "{0},{0} ".format(f"%.{precision}f")
+    handle.write(f'<polyline fill="none" stroke="{stroke}" stroke-width="{stroke_width}" points="')
+    for offset in range(0, len(points), _WRITE_CHUNK):
+        chunk = points[offset : offset + _WRITE_CHUNK]
+        handle.write((template * chunk.shape[0]) % tuple(chunk.ravel().tolist()))
+    handle.write('" />')
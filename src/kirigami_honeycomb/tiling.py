@@ -0,0 +1,208 @@
+"""Split fold line diagrams into sheets that fit the laser cutter."""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .fold_pattern import FoldPattern
+from .segments import SegmentKind, SegmentTable, build_segment_table
+from .svg import export_segment_table
+
+
+FloatArray = NDArray[np.float64]
+
+__all__ = ["Sheet", "choose_sheet_boundaries", "clip_segments", "export_sheets", "tile_fold_pattern"]
+
+
+@dataclass(frozen=True)
+class Sheet:
+    """One sheet of a tiled fold line diagram.
+
+    ``bounds`` is the ``(min_x, min_y, max_x, max_y)`` region covered by the
+    sheet including its overlap with neighbouring sheets, ``column`` and
+    ``row`` locate it in the tiling and ``segments`` holds the clipped
+    diagram lines plus registration marks.
+    """
+
+    column: int
+    row: int
+    bounds: Tuple[float, float, float, float]
+    segments: SegmentTable
+
+    @property
+    def name(self) -> str:
+        return f"r{self.row:02d}_c{self.column:02d}"
+
+
+def choose_sheet_boundaries(
+    positions: Sequence[float],
+    *,
+    low: float,
+    high: float,
+    max_size: float,
+    overlap: float = 0.0,
+) -> FloatArray:
+    """Pick cut positions from *positions* so every piece fits into *max_size*.
+
+    Starting at *low*, each boundary is the furthest candidate position that
+    keeps the piece, widened by ``overlap`` on both sides, within
+    ``max_size``. The returned array starts with *low* and ends with *high*.
+    """
+
+    if max_size <= 2 * overlap:
+        raise ValueError("max_size must exceed twice the overlap.")
+    reach = max_size - 2 * overlap
+    candidates = np.unique(np.asarray(positions, dtype=float))
+    candidates = candidates[(candidates > low) & (candidates < high)]
+
+    boundaries = [float(low)]
+    while high - boundaries[-1] > reach:
+        index = np.searchsorted(candidates, boundaries[-1] + reach, side="right") - 1
+        if index < 0 or candidates[index] <= boundaries[-1]:
+            raise ValueError(
+                f"No fold line between {boundaries[-1]:.3f} and {boundaries[-1] + reach:.3f}; "
+                "increase the sheet size."
+            )
+        boundaries.append(float(candidates[index]))
+    boundaries.append(float(high))
+    return np.asarray(boundaries)
+
+
+def clip_segments(
+    table: SegmentTable,
+    bounds: Tuple[float, float, float, float],
+    *,
+    tolerance: float = 1e-9,
+) -> SegmentTable:
+    """Clip every segment of *table* to the axis-aligned rectangle *bounds*.
+
+    Uses the Liang-Barsky parametrisation on all segments at once. Segments
+    entirely outside the rectangle are dropped, as are clipped pieces no
+    longer than ``tolerance``, such as segments that only touch the
+    boundary, which cutters would burn in as dots.
+    """
+
+    min_x, min_y, max_x, max_y = bounds
+    delta = table.end - table.start
+    t_enter = np.zeros(len(table))
+    t_exit = np.ones(len(table))
+    for axis, low, high in ((0, min_x, max_x), (1, min_y, max_y)):
+        direction = delta[:, axis]
+        origin = table.start[:, axis]
+        parallel = direction == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_low = (low - origin) / direction
+            t_high = (high - origin) / direction
+        t_near = np.where(parallel, -np.inf, np.minimum(t_low, t_high))
+        t_far = np.where(parallel, np.inf, np.maximum(t_low, t_high))
+        outside = parallel & ((origin < low) | (origin > high))
+        t_enter = np.maximum(t_enter, t_near)
+        t_exit = np.where(outside, -1.0, np.minimum(t_exit, t_far))
+
+    keep = (t_exit - t_enter) * np.hypot(delta[:, 0], delta[:, 1]) > tolerance
+    start = table.start[keep] + t_enter[keep, np.newaxis] * delta[keep]
+    end = table.start[keep] + t_exit[keep, np.newaxis] * delta[keep]
+    return SegmentTable(start, end, table.kind[keep])
+
+
+def tile_fold_pattern(
+    pattern: FoldPattern,
+    *,
+    cell_size: float,
+    panel_length: float,
+    max_width: float,
+    max_height: float,
+    overlap: float = 0.0,
+    mark_size: float = 2.0,
+) -> List[Sheet]:
+    """Split the fold line diagram of *pattern* into sheets of bounded size.
+
+    Vertical sheet boundaries are placed on the a/b fold positions and
+    horizontal ones on the fold lines running across the panel, so sheets
+    meet along lines that are folded anyway. Every sheet extends ``overlap``
+    beyond its boundaries and carries registration crosses of ``mark_size``
+    at the boundary corners, which line up between neighbouring sheets.
+    Boundaries are chosen so the drawn sheet, crosses included, stays within
+    ``max_width`` by ``max_height``.
+    """
+
+    table = build_segment_table(pattern, cell_size=cell_size, panel_length=panel_length)
+    layout = pattern.vertex_layout(cell_size=cell_size, panel_length=panel_length)
+    min_x, min_y, max_x, max_y = table.bounds
+    # The registration crosses reach half their size past the boundaries, like the overlap does.
+    margin = max(overlap, mark_size / 2)
+
+    columns = choose_sheet_boundaries(
+        np.concatenate((pattern.a_positions, pattern.b_positions)),
+        low=min_x,
+        high=max_x,
+        max_size=max_width,
+        overlap=margin,
+    )
+    rows = choose_sheet_boundaries(layout.y, low=min_y, high=max_y, max_size=max_height, overlap=margin)
+
+    # Sorting by the left end lets each sheet column query a contiguous range.
+    left = np.minimum(table.start[:, 0], table.end[:, 0])
+    order = np.argsort(left, kind="stable")
+    sorted_left = left[order]
+    widest = float(np.max(np.abs(table.end[:, 0] - table.start[:, 0]), initial=0.0))
+
+    sheets = []
+    for column, (x_low, x_high) in enumerate(zip(columns[:-1].tolist(), columns[1:].tolist())):
+        x_bounds = (max(x_low - overlap, min_x), min(x_high + overlap, max_x))
+        first, last = np.searchsorted(sorted_left, (x_bounds[0] - widest, x_bounds[1]), side="right")
+        candidates = order[first:last]
+        column_table = SegmentTable(table.start[candidates], table.end[candidates], table.kind[candidates])
+        for row, (y_low, y_high) in enumerate(zip(rows[:-1].tolist(), rows[1:].tolist())):
+            bounds = (x_bounds[0], max(y_low - overlap, min_y), x_bounds[1], min(y_high + overlap, max_y))
+            clipped = clip_segments(column_table, bounds)
+            marks = _registration_marks((x_low, y_low, x_high, y_high), mark_size)
+            sheets.append(Sheet(column, row, bounds, SegmentTable.concatenate((clipped, marks))))
+    return sheets
+
+
+def export_sheets(
+    sheets: Sequence[Sheet],
+    directory: Path,
+    *,
+    stem: str = "sheet",
+    processes: int | None = None,
+) -> List[Path]:
+    """Write every sheet to ``<directory>/<stem>_<name>.svg``.
+
+    With ``processes`` greater than one the sheets are exported concurrently
+    by a process pool. Returns the written paths in sheet order.
+    """
+
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be at least one")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = [directory / f"{stem}_{sheet.name}.svg" for sheet in sheets]
+    tables = [sheet.segments for sheet in sheets]
+
+    if processes is None or processes == 1 or len(sheets) < 2:
+        for table, path in zip(tables, paths):
+            export_segment_table(table, path)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            list(pool.map(export_segment_table, tables, paths))
+    return paths
+
+
+def _registration_marks(bounds: Tuple[float, float, float, float], size: float) -> SegmentTable:
+    """Crosses centred on the four corners of *bounds*."""
+
+    min_x, min_y, max_x, max_y = bounds
+    corners = np.array([[min_x, min_y], [max_x, min_y], [min_x, max_y], [max_x, max_y]])
+    half = size / 2
+    arms = np.array([[half, 0.0], [0.0, half]])
+    centres = np.repeat(corners, 2, axis=0)
+    offsets = np.tile(arms, (4, 1))
+    kind = np.full(centres.shape[0], SegmentKind.MARK, dtype=np.uint8)
+    return SegmentTable(centres - offsets, centres + offsets, kind)
@@ -0,0 +1,134 @@
+"""Mapping of points on the folded honeycomb walls back onto the flat diagram."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .cross_section import CrossSectionSamples
+from .fold_pattern import FoldPattern, fold_line_gap
+from .honeycomb import column_point_y, ribbon_plan
+from .segments import SegmentKind, SegmentTable
+from .spatial import WallIntersections
+
+
+FloatArray = NDArray[np.float64]
+
+__all__ = ["UnfoldingMap", "build_unfolding_map", "ribbon_wall_frames", "unfold_intersections"]
+
+
+@dataclass(frozen=True)
+class UnfoldingMap:
+    """Per-wall affine maps from 3-D wall points to fold line diagram coordinates.
+
+    A point ``p`` on wall ``w`` unfolds to ``matrices[w] @ p + offsets[w]``.
+    Walls are numbered as in :class:`~kirigami_honeycomb.honeycomb.HoneycombMesh`,
+    ribbon by ribbon with ``walls_per_ribbon`` walls each.
+    """
+
+    matrices: FloatArray
+    offsets: FloatArray
+    walls_per_ribbon: int
+
+    def __post_init__(self) -> None:
+        matrices = np.ascontiguousarray(self.matrices, dtype=float)
+        offsets = np.ascontiguousarray(self.offsets, dtype=float)
+        if matrices.ndim != 3 or matrices.shape[1:] != (2, 3) or offsets.shape != (matrices.shape[0], 2):
+            raise ValueError("matrices must have shape (n, 2, 3) and offsets shape (n, 2).")
+        object.__setattr__(self, "matrices", matrices)
+        object.__setattr__(self, "offsets", offsets)
+        object.__setattr__(self, "walls_per_ribbon", int(self.walls_per_ribbon))
+
+    def __len__(self) -> int:
+        return self.matrices.shape[0]
+
+    def apply(self, wall: ArrayLike, points: ArrayLike) -> FloatArray:
+        """Unfold ``(n, 3)`` *points* lying on the walls ``wall`` to ``(n, 2)``."""
+
+        wall = np.asarray(wall, dtype=np.int64).reshape(-1)
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        return np.einsum("nij,nj->ni", self.matrices[wall], points) + self.offsets[wall]
+
+
+def build_unfolding_map(pattern: FoldPattern, samples: CrossSectionSamples, *, panel_length: float) -> UnfoldingMap:
+    """Precompute the unfolding of every honeycomb wall of *samples*.
+
+    Band ``k`` between slit lines ``i`` and ``i + 1`` of the diagram folds
+    into wall ``k`` of ribbon ``i``. Along the panel the diagram coordinate
+    is ``k`` fold line gaps plus the horizontal distance from the wall's
+    first edge. Across the panel the height ``z`` maps to
+    ``x = sign_i * (z - level_i)``: even ribbons run upwards from their left
+    slit line and odd ones downwards. The levels are chained from the lower
+    curve at the first slit line through the fold shared by neighbouring
+    ribbons, which lies on the a series for even slit lines and on the
+    b series for odd ones.
+    """
+
+    gap = fold_line_gap(samples.cell_size)
+    layout = pattern.vertex_layout(cell_size=samples.cell_size, panel_length=panel_length)
+    num_columns = samples.x.size
+    if pattern.b_positions.size != num_columns:
+        raise ValueError("pattern and samples describe a different number of slit lines.")
+    num_lines = layout.shape[1]
+
+    sign, level, origin, along = ribbon_wall_frames(pattern, samples.x, float(samples.lower[0]), gap, num_lines)
+    walls = num_lines - 1
+    band = np.tile(np.arange(walls), num_columns - 1) * gap
+
+    matrices = np.zeros((sign.size, 2, 3))
+    matrices[:, 0, 2] = sign
+    matrices[:, 1, :2] = along
+    offsets = np.column_stack((-sign * level, band - np.einsum("ij,ij->i", along, origin)))
+    return UnfoldingMap(matrices, offsets, walls)
+
+
+def unfold_intersections(
+    intersections: WallIntersections,
+    unfolding: UnfoldingMap,
+    *,
+    kind: SegmentKind = SegmentKind.PERFORATION,
+) -> SegmentTable:
+    """Unfold wall intersection segments into diagram segments of *kind*."""
+
+    if intersections.wall_count != len(unfolding):
+        raise ValueError("intersections and unfolding map describe different walls.")
+    start = unfolding.apply(intersections.wall, intersections.start)
+    end = unfolding.apply(intersections.wall, intersections.end)
+    return SegmentTable(start, end, np.full(len(intersections), kind, dtype=np.uint8))
+
+
+def ribbon_wall_frames(
+    pattern: FoldPattern,
+    column_x: FloatArray,
+    base: float,
+    gap: float,
+    num_lines: int,
+) -> Tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    """Frames of the walls that the bands of *pattern* fold into.
+
+    ``column_x`` holds the position of every honeycomb column and ``base``
+    the lower end of the first ribbon at the first slit line. Returns, per
+    wall in :class:`~kirigami_honeycomb.honeycomb.HoneycombMesh` order, the
+    sign with which height grows across its band, the height level of the
+    band's left slit line and the horizontal origin and unit direction of
+    the wall. Shared by the unfolding map and the folding simulation.
+    """
+
+    ribbons = column_x.size - 1
+    columns, points = ribbon_plan(column_x.size, num_lines)
+    xy = np.stack((column_x[columns], column_point_y(points[np.newaxis, :], columns, gap)), axis=-1)
+    origin = xy[:, :-1].reshape(-1, 2)
+    along = (xy[:, 1:] - xy[:, :-1]).reshape(-1, 2)
+    along /= np.hypot(along[:, 0], along[:, 1])[:, np.newaxis]
+
+    index = np.arange(ribbons)
+    sign = np.where(index % 2 == 0, 1.0, -1.0)
+    fold = np.where(index % 2 == 0, pattern.a_positions[:ribbons], pattern.b_positions[:ribbons])
+    level = np.empty(ribbons)
+    level[0] = base
+    level[1:] = base + np.cumsum((sign[:-1] - sign[1:]) * fold[1:])
+
+    walls = num_lines - 1
+    return np.repeat(sign, walls), np.repeat(level, walls), origin, along
@@ -2,7 +2,12 @@ import pytest
 
 np = pytest.importorskip("numpy")
 
-from kirigami_honeycomb.cross_section import linearize_cross_section, sample_cross_section
+from kirigami_honeycomb.cross_section import (
+    CrossSectionSamples,
+    linearize_cross_section,
+    linearize_cross_sections,
+    sample_cross_section,
+)
 
 
 def test_sample_cross_section_includes_domain_end():
@@ -37,3 +42,63 @@ def test_linearize_cross_section_matches_manual_result():
 
     np.testing.assert_allclose(linear.upper, expected_upper)
     np.testing.assert_allclose(linear.lower, expected_lower)
+
+
+def test_linearize_cross_section_in_place_reuses_arrays():
+    samples = sample_cross_section(lambda x: x**2, np.sin, domain=(0.0, 10.0), cell_size=2.0)
+    expected = linearize_cross_section(samples)
+    upper = samples.upper
+
+    result = linearize_cross_section(samples, in_place=True)
+
+    assert result is samples
+    assert result.upper is upper
+    np.testing.assert_array_equal(result.upper, expected.upper)
+    np.testing.assert_array_equal(result.lower, expected.lower)
+
+
+def test_conservative_linearisation_contains_curves():
+    upper = lambda x: 40 + 3 * np.sin(np.asarray(x) / 3)
+    lower = lambda x: 10 * np.sin(2 * np.pi * np.asarray(x) / 200)
+    samples = sample_cross_section(upper, lower, domain=(0.0, 190.0), cell_size=20.0)
+
+    plain = linearize_cross_section(samples)
+    linear = linearize_cross_section(samples, reference=(upper, lower), oversample=32)
+
+    x = np.linspace(0.0, 190.0, 32 * (samples.x.size - 1) + 1)
+    assert np.max(upper(x) - np.interp(x, plain.x, plain.upper)) > 1.0
+    assert np.all(np.interp(x, linear.x, linear.upper) >= upper(x) - 1e-9)
+    assert np.all(np.interp(x, linear.x, linear.lower) <= lower(x) + 1e-9)
+    # The offset result is still a valid linearisation.
+    relinear = linearize_cross_section(linear)
+    np.testing.assert_allclose(relinear.upper, linear.upper)
+    np.testing.assert_allclose(relinear.lower, linear.lower)
+
+
+def test_conservative_linearisation_contains_dense_envelope():
+    upper = lambda x: 20 + 5 * np.cos(np.asarray(x) / 4)
+    lower = lambda x: -np.abs(np.sin(np.asarray(x) / 5))
+    samples = sample_cross_section(upper, lower, domain=(0.0, 100.0), cell_size=10.0)
+    envelope = sample_cross_section(upper, lower, domain=(-5.0, 105.0), cell_size=0.5)
+
+    linear = linearize_cross_section(samples, reference=envelope)
+
+    inside = (envelope.x >= 0.0) & (envelope.x <= 100.0)
+    x = envelope.x[inside]
+    assert np.all(np.interp(x, linear.x, linear.upper) >= envelope.upper[inside] - 1e-9)
+    assert np.all(np.interp(x, linear.x, linear.lower) <= envelope.lower[inside] + 1e-9)
+
+
+def test_linearize_cross_sections_matches_row_by_row_results():
+    x = np.linspace(0.0, 12.0, 8)
+    upper = np.stack([x**2, 3.0 * x + 1.0, np.cos(x) + 5.0])
+    lower = np.stack([np.sin(x), -x, np.zeros_like(x)])
+
+    linear_upper, linear_lower = linearize_cross_sections(upper, lower)
+
+    for row in range(upper.shape[0]):
+        reference = linearize_cross_section(CrossSectionSamples(x, upper[row], lower[row], cell_size=4.0))
+        np.testing.assert_array_equal(linear_upper[row], reference.upper)
+        np.testing.assert_array_equal(linear_lower[row], reference.lower)
+    # The inputs are left untouched unless in-place mode is requested.
+    np.testing.assert_array_equal(upper[0], x**2)
@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+trimesh = pytest.importorskip("trimesh")
+
+from kirigami_honeycomb.cross_section import sample_cross_section
+from kirigami_honeycomb.deviation import analyse_deviation, wall_edge_samples
+from kirigami_honeycomb.honeycomb import build_honeycomb_mesh
+
+
+def _slab():
+    samples = sample_cross_section(lambda x: 10 + 0 * x, lambda x: 0 * x, domain=(0.0, 40.0), cell_size=8.0)
+    mesh = build_honeycomb_mesh(samples, panel_length=30.0)
+    low = mesh.vertices.min(axis=0)
+    high = mesh.vertices.max(axis=0)
+    box = trimesh.creation.box(bounds=[low - [1.0, 1.0, 0.0], high + [1.0, 1.0, 0.0]])
+    return mesh, box
+
+
+def test_wall_edge_samples_lie_on_wall_edges():
+    mesh, _ = _slab()
+    samples = wall_edge_samples(mesh, samples_per_edge=4)
+
+    assert samples.shape == (mesh.wall_count, 8, 3)
+    np.testing.assert_allclose(samples[:, :4, 2], 10.0)
+    np.testing.assert_allclose(samples[:, 4:, 2], 0.0)
+    np.testing.assert_allclose(samples[:, 0], mesh.wall_quads[:, 0])
+
+
+def test_deviation_of_matching_and_shifted_source():
+    mesh, box = _slab()
+
+    report = analyse_deviation(box.triangles, mesh, bins=5)
+    assert report.max_error < 1e-9
+
+    box.apply_translation([0.0, 0.0, 0.5])
+    report = analyse_deviation(box.triangles, mesh, bins=5)
+    np.testing.assert_allclose(report.wall_max, 0.5)
+    np.testing.assert_allclose(report.wall_rms, 0.5)
+    assert report.counts.sum() == report.distances.size
+    assert "max 0.5000" in report.summary()
@@ -0,0 +1,44 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.cross_section import sample_cross_section
+from kirigami_honeycomb.dxf import export_dxf, order_polylines, travel_distance
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.segments import PolylineSet, build_segment_table
+
+
+def test_order_polylines_visits_nearest_ends_and_reverses():
+    polylines = PolylineSet(
+        points=[[10.0, 0.0], [11.0, 0.0], [3.0, 0.0], [2.0, 0.0], [5.0, 0.0], [6.0, 0.0]],
+        offsets=[0, 2, 4, 6],
+        kind=[0, 0, 0],
+    )
+
+    ordered = order_polylines(polylines)
+
+    np.testing.assert_allclose(ordered.first_points, [[2.0, 0.0], [5.0, 0.0], [10.0, 0.0]])
+    np.testing.assert_allclose(ordered.last_points, [[3.0, 0.0], [6.0, 0.0], [11.0, 0.0]])
+    assert travel_distance(ordered) == pytest.approx(8.0)
+    assert travel_distance(polylines) > travel_distance(ordered)
+
+
+def test_export_dxf_reports_reduced_travel(tmp_path):
+    samples = sample_cross_section(
+        lambda x: 0.1 * x + 20,
+        lambda x: -0.05 * x,
+        domain=(0.0, 100.0),
+        cell_size=10.0,
+    )
+    table = build_segment_table(compute_fold_pattern(samples), cell_size=10.0, panel_length=60.0)
+    output = tmp_path / "diagram.dxf"
+
+    report = export_dxf(table, output)
+
+    text = output.read_text()
+    assert text.count("POLYLINE") == report.polylines
+    assert "CUT" in text and "FOLD" in text
+    assert text.rstrip().endswith("EOF")
+    assert report.segments == len(table)
+    assert report.polylines < report.segments
+    assert report.travel_after < report.travel_before
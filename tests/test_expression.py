@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.expression import compile_expression
+
+
+def test_compiled_expression_matches_math_semantics_on_arrays():
+    expression = compile_expression("0.002*x**2 - 0.4*x + 40 + 10*sin(2*pi*x/200) + log(x + 1, 2) + np.sqrt(x)")
+    x = np.linspace(0.0, 200.0, 41)
+
+    result = expression(x)
+
+    expected = [
+        0.002 * v**2 - 0.4 * v + 40 + 10 * math.sin(2 * math.pi * v / 200) + math.log(v + 1, 2) + math.sqrt(v)
+        for v in x
+    ]
+    assert result.shape == x.shape
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "__import__('os').system('true')",
+        "x.__class__",
+        "open('secret')",
+        "np.save",
+        "[x for x in ()]",
+        "sin",
+        "sin(x, out=x)",
+        "sin(x, x)",
+        "min(x, 1, 2)",
+        "np.clip(x, 0)",
+        "log(x, 2, 3)",
+        "'text'",
+    ],
+)
+def test_compile_expression_rejects_unsafe_input(source):
+    with pytest.raises(ValueError):
+        compile_expression(source)
+
+
+def test_compiled_expression_never_writes_to_its_input():
+    x = np.linspace(0.0, 10.0, 11)
+    original = x.copy()
+
+    compile_expression("np.sin(x) + max(x, 2) + np.clip(x, 1, 3)")(x)
+
+    np.testing.assert_array_equal(x, original)
+
+
+def test_huge_powers_overflow_immediately():
+    x = np.linspace(0.0, 1.0, 3)
+
+    with pytest.raises(ValueError):
+        compile_expression("9**9**9**9")(x)
+    with pytest.raises(ValueError):
+        compile_expression("1" + "0" * 400)
+    np.testing.assert_allclose(compile_expression("7 // 2 + x**2")(x), 3.0 + x**2)
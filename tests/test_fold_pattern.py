@@ -3,7 +3,7 @@ import pytest
 np = pytest.importorskip("numpy")
 
 from kirigami_honeycomb.cross_section import CrossSectionSamples
-from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern, compute_fold_patterns, fold_line_gap
 
 
 def test_fold_pattern_reproduces_reference_values():
@@ -20,3 +20,71 @@ def test_fold_pattern_reproduces_reference_values():
     np.testing.assert_allclose(pattern.a_positions, expected_a)
     np.testing.assert_allclose(pattern.b_positions, expected_b)
     np.testing.assert_allclose(pattern.offsets, np.array([1.0]))
+
+
+def _legacy_fold_positions(upper, lower):
+    """Literal copy of the original per-index loops of ``compute_fold_pattern``."""
+
+    num = upper.size
+    delta = upper - lower
+
+    a_positions = np.zeros(num + 1, dtype=float)
+    for index in range(1, num + 1):
+        k = index if index % 2 == 0 else index - 1
+        if k >= num:
+            k = num - 1
+        a_positions[index] = a_positions[index - 1] + delta[k]
+
+    b_positions = np.zeros(num, dtype=float)
+    for index in range(1, num):
+        k = index - 1 if index % 2 == 0 else index
+        if k >= num:
+            k = num - 1
+        b_positions[index] = b_positions[index - 1] + delta[k]
+
+    offset = lower[1] - lower[0]
+    return a_positions, b_positions + offset, np.array([offset])
+
+
+@pytest.mark.parametrize("num", [2, 3, 8, 9, 64, 101])
+def test_fold_patterns_match_legacy_loops(num):
+    rng = np.random.default_rng(num)
+    x = np.linspace(0.0, 10.0 * (num - 1), num)
+    lower = rng.uniform(-5.0, 0.0, size=(4, num))
+    upper = lower + rng.uniform(1.0, 10.0, size=(4, num))
+
+    patterns = compute_fold_patterns(upper, lower)
+
+    assert len(patterns) == 4
+    for row, pattern in enumerate(patterns):
+        expected_a, expected_b, expected_offsets = _legacy_fold_positions(upper[row], lower[row])
+        single = compute_fold_pattern(CrossSectionSamples(x, upper[row], lower[row], cell_size=10.0))
+        for result in (pattern, single):
+            np.testing.assert_allclose(result.a_positions, expected_a, rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(result.b_positions, expected_b, rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(result.offsets, expected_offsets, rtol=1e-12, atol=1e-12)
+
+
+def test_vertex_layout_matches_legacy_loop():
+    x = np.linspace(0.0, 40.0, 9)
+    upper = 20.0 + np.sin(x / 7.0)
+    lower = np.cos(x / 5.0)
+    pattern = compute_fold_pattern(CrossSectionSamples(x, upper, lower, cell_size=10.0))
+    cell_size = 20.0
+    panel_length = 100.0
+
+    layout = pattern.vertex_layout(cell_size=cell_size, panel_length=panel_length)
+
+    c_gap = cell_size / (2 * np.cos(np.pi / 6))
+    num = x.size
+    num_lines = int(panel_length // c_gap)
+    vx = np.zeros(num * num_lines)
+    vy = np.zeros(num * num_lines)
+    for i in range(num):
+        for k in range(num_lines):
+            vx[i * num_lines + k] = pattern.a_positions[i] if k % 4 < 2 else pattern.b_positions[i]
+            vy[i * num_lines + k] = k * c_gap
+    assert layout.shape == (num, num_lines)
+    assert layout.gap == pytest.approx(fold_line_gap(cell_size))
+    np.testing.assert_array_equal(layout.x.reshape(-1), vx)
+    np.testing.assert_allclose(np.broadcast_to(layout.y, layout.shape).reshape(-1), vy)
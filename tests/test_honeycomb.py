@@ -4,7 +4,15 @@ import pytest
 
 np = pytest.importorskip("numpy")
 
-from kirigami_honeycomb.honeycomb import generate_hex_grid
+from kirigami_honeycomb.cross_section import CrossSectionSamples, sample_cross_section
+from kirigami_honeycomb.fold_pattern import fold_line_gap
+from kirigami_honeycomb.honeycomb import (
+    HexLattice,
+    build_honeycomb_mesh,
+    generate_envelope_grid,
+    generate_hex_grid,
+    generate_hex_lattice,
+)
 
 
 def test_generate_hex_grid_returns_expected_shape():
@@ -27,3 +35,135 @@ def test_generate_hex_grid_spacing():
 
     np.testing.assert_allclose(first_row_diffs, np.full_like(first_row_diffs, hs_w))
     np.testing.assert_allclose(first_col_diffs, np.full_like(first_col_diffs, hs_l))
+
+
+def test_build_honeycomb_mesh_walls_match_fold_line_gap():
+    samples = sample_cross_section(
+        lambda x: 40 + 0.1 * x,
+        lambda x: 5 * np.sin(x / 30),
+        domain=(0.0, 200.0),
+        cell_size=20.0,
+    )
+
+    mesh = build_honeycomb_mesh(samples, panel_length=100.0)
+
+    num_lines = int(100.0 // fold_line_gap(20.0))
+    assert mesh.walls_per_ribbon == num_lines - 1
+    assert mesh.wall_count == (samples.x.size - 1) * (num_lines - 1)
+    assert mesh.faces.shape == (2 * mesh.wall_count, 3)
+    assert np.unique(mesh.faces).size == mesh.vertices.shape[0]
+
+    top, bottom = np.split(mesh.vertices, 2)
+    np.testing.assert_allclose(top[:, :2], bottom[:, :2])
+    columns = np.searchsorted(samples.x, top[:, 0])
+    np.testing.assert_allclose(top[:, 2], samples.upper[columns])
+    np.testing.assert_allclose(bottom[:, 2], samples.lower[columns])
+
+    walls = mesh.faces[::2]
+    widths = np.hypot(*(mesh.vertices[walls[:, 1], :2] - mesh.vertices[walls[:, 0], :2]).T)
+    np.testing.assert_allclose(widths, fold_line_gap(20.0))
+
+
+def test_honeycomb_mesh_export_formats(tmp_path):
+    samples = sample_cross_section(lambda x: 30 + 0 * x, lambda x: 0 * x, domain=(0.0, 60.0), cell_size=20.0)
+    mesh = build_honeycomb_mesh(samples, panel_length=60.0)
+
+    mesh.export(tmp_path / "core.stl")
+    mesh.export(tmp_path / "core.ply")
+
+    assert (tmp_path / "core.stl").stat().st_size == 84 + 50 * mesh.faces.shape[0]
+    assert (tmp_path / "core.ply").read_bytes().startswith(b"ply\n")
+    with pytest.raises(ValueError):
+        mesh.export(tmp_path / "core.obj")
+
+
+def test_hex_lattice_matches_dense_grid_without_storing_it():
+    lattice = generate_hex_lattice(cell_size=7.5, width=400.0, length=300.0)
+    grid = generate_hex_grid(cell_size=7.5, width=400.0, length=300.0)
+
+    assert lattice.shape == grid.shape
+    assert lattice.y.strides[1] == 0 and not lattice.y.flags.writeable
+    np.testing.assert_array_equal(lattice.y, grid.y)
+
+    tiles = list(lattice.iter_tiles((16, 25)))
+    for (rows, columns), tile in tiles:
+        np.testing.assert_array_equal(tile.x, grid.x[rows, columns])
+        np.testing.assert_array_equal(tile.y, grid.y[rows, columns])
+    assert sum(tile.x.size for _, tile in tiles) == grid.x.size
+    tile = lattice.tile(slice(-5, None, 2), slice(3, 40, 4))
+    np.testing.assert_array_equal(tile.x, grid.x[-5::2, 3:40:4])
+
+
+def test_hex_lattice_tile_does_not_touch_the_full_lattice():
+    # Far too large to enumerate; a tile must only cost its own size.
+    lattice = HexLattice(cell_size=10.0, shape=(10**12, 10**12))
+
+    tile = lattice.tile(slice(10**11, 10**11 + 3), slice(-4, None))
+
+    assert tile.x.shape == (3, 4)
+    expected_x, expected_y = lattice.coordinates(np.array([[10**11]]), np.array([[10**12 - 4]]))
+    assert tile.x[0, 0] == expected_x[0, 0] and tile.y[0, 0] == expected_y[0, 0]
+
+
+def test_hex_lattice_locate_finds_nearest_cell_and_barycentric_position():
+    lattice = generate_hex_lattice(cell_size=10.0, width=120.0, length=80.0)
+    grid = lattice.to_grid()
+    points = np.random.default_rng(7).uniform((0.0, 0.0), (120.0, 80.0), size=(500, 2))
+
+    location = lattice.locate(points)
+
+    distances = np.hypot(grid.x.reshape(-1)[None] - points[:, :1], grid.y.reshape(-1)[None] - points[:, 1:])
+    rows, columns = np.unravel_index(np.argmin(distances, axis=1), grid.shape)
+    np.testing.assert_array_equal(location.row, rows)
+    np.testing.assert_array_equal(location.column, columns)
+    assert location.inside.all()
+
+    corner_x, corner_y = lattice.coordinates(location.triangle_rows, location.triangle_columns)
+    assert location.weights.min() >= -1e-12
+    np.testing.assert_allclose(location.weights.sum(axis=1), 1.0)
+    reconstructed = np.column_stack(
+        ((corner_x * location.weights).sum(axis=1), (corner_y * location.weights).sum(axis=1))
+    )
+    np.testing.assert_allclose(reconstructed, points)
+
+
+def test_hex_lattice_neighbour_rings():
+    lattice = generate_hex_lattice(cell_size=10.0, width=120.0, length=80.0)
+    rows, columns = np.array([4, 5]), np.array([6, 6])
+    centre_x, centre_y = lattice.coordinates(rows[:, None], columns[:, None])
+
+    for ring, expected in ((1, {1.0}), (2, {2.0, math.sqrt(3.0)})):
+        ring_rows, ring_columns = lattice.neighbours(rows, columns, ring=ring)
+        x, y = lattice.coordinates(ring_rows, ring_columns)
+        assert ring_rows.shape == (2, 6 * ring)
+        distances = np.round(np.hypot(x - centre_x, y - centre_y) / lattice.step_x, 9)
+        assert set(distances.ravel().tolist()) == {round(value, 9) for value in expected}
+        assert len({(r, c) for r, c in zip(ring_rows[0], ring_columns[0])}) == 6 * ring
+
+
+def test_generate_envelope_grid_keeps_only_cells_inside_the_section():
+    samples = sample_cross_section(lambda x: 60 - 0.4 * x, lambda x: 0.1 * x, domain=(0.0, 100.0), cell_size=4.0)
+
+    grid = generate_envelope_grid(samples)
+
+    rows, columns = grid.cells()
+    x, y = grid.coordinates()
+    assert np.all(x >= samples.lower[rows] - 1e-9) and np.all(x <= samples.upper[rows] + 1e-9)
+    np.testing.assert_allclose(y, samples.x[rows])
+
+    dense_x = grid.lattice.x
+    row_index = np.arange(grid.lattice.shape[0])[:, None]
+    inside = (dense_x >= samples.lower[row_index] - 1e-9) & (dense_x <= samples.upper[row_index] + 1e-9)
+    assert len(grid) == inside.sum() < inside.size
+    np.testing.assert_array_equal(grid.offsets[1:] - grid.offsets[:-1], inside.sum(axis=1))
+
+    np.testing.assert_array_equal(grid.index(rows, columns), np.arange(len(grid)))
+    np.testing.assert_array_equal(grid.index([0, -1, 3], [grid.lattice.shape[1], 0, -1]), [-1, -1, -1])
+
+
+def test_generate_envelope_grid_rejects_samples_off_the_row_step():
+    x = np.arange(0.0, 20.0, 2.0)
+    samples = CrossSectionSamples(x, np.full_like(x, 30.0), np.zeros_like(x), cell_size=10.0)
+
+    with pytest.raises(ValueError, match="half a cell size"):
+        generate_envelope_grid(samples)
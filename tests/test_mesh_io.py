@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 import trimesh
 
-from kirigami_honeycomb.mesh_io import sample_mesh_cross_section
+from kirigami_honeycomb.mesh_io import load_triangles, sample_mesh_cross_section, sample_mesh_envelope_grid
 
 
 def test_sample_mesh_cross_section_box_returns_constant_envelope() -> None:
@@ -43,3 +43,69 @@ def test_sample_mesh_cross_section_from_path(tmp_path: Path) -> None:
     # The rotation should create a gradient in the height envelope along the slicing axis.
     assert samples.upper.max() > samples.upper.min()
     assert samples.lower.max() > samples.lower.min()
+
+
+def test_sample_mesh_cross_section_sphere_follows_circle() -> None:
+    mesh = trimesh.creation.icosphere(subdivisions=5, radius=25.0)
+
+    samples = sample_mesh_cross_section(mesh, axis="x", height_axis="z", spacing=2.5, cell_size=5.0)
+
+    expected = np.sqrt(np.clip(25.0**2 - samples.x**2, 0.0, None))
+    interior = np.abs(samples.x) < 20.0
+    np.testing.assert_allclose(samples.upper[interior], expected[interior], atol=0.2)
+    np.testing.assert_allclose(samples.lower[interior], -expected[interior], atol=0.2)
+
+
+def test_sample_mesh_cross_section_chunked_matches_in_memory(tmp_path: Path) -> None:
+    mesh = trimesh.creation.icosphere(subdivisions=3, radius=12.0)
+    mesh.apply_translation((3.0, -1.0, 2.0))
+    mesh_path = tmp_path / "sphere.stl"
+    mesh.export(mesh_path)
+
+    reference = sample_mesh_cross_section(mesh, spacing=1.5, cell_size=3.0)
+    for source in (mesh, mesh_path):
+        streamed = sample_mesh_cross_section(source, spacing=1.5, cell_size=3.0, chunk_size=97)
+        np.testing.assert_allclose(streamed.x, reference.x, atol=1e-5)
+        np.testing.assert_allclose(streamed.upper, reference.upper, atol=1e-5)
+        np.testing.assert_allclose(streamed.lower, reference.lower, atol=1e-5)
+
+
+def test_sample_mesh_envelope_grid_tracks_spanwise_shape() -> None:
+    mesh = trimesh.creation.icosphere(subdivisions=4, radius=20.0)
+    stations = np.linspace(-15.0, 15.0, 7)
+
+    grid = sample_mesh_envelope_grid(mesh, stations=stations, spacing=2.0, cell_size=4.0)
+    parallel = sample_mesh_envelope_grid(mesh, stations=stations, spacing=2.0, cell_size=4.0, processes=2)
+
+    assert grid.upper.shape == (stations.size, grid.x.size)
+    radius = np.sqrt(np.clip(20.0**2 - grid.span[:, None] ** 2 - grid.x[None, :] ** 2, 0.0, None))
+    inside = radius > 5.0
+    np.testing.assert_allclose(grid.upper[inside], radius[inside], atol=0.3)
+    np.testing.assert_allclose(grid.lower[inside], -radius[inside], atol=0.3)
+    np.testing.assert_array_equal(parallel.upper, grid.upper)
+    np.testing.assert_array_equal(parallel.lower, grid.lower)
+    assert grid.section(3).upper.max() > grid.section(0).upper.max()
+
+
+def test_sample_mesh_envelope_grid_default_stations_on_curved_mesh() -> None:
+    rng = np.random.default_rng(5)
+    for _ in range(3):
+        mesh = trimesh.creation.icosphere(subdivisions=3, radius=20.0)
+        mesh.apply_transform(trimesh.transformations.random_rotation_matrix(rng.random(3)))
+
+        grid = sample_mesh_envelope_grid(mesh, stations=7, spacing=2.0, cell_size=4.0)
+
+        assert grid.span.size == 7
+        assert grid.span[0] > mesh.bounds[0, 1] and grid.span[-1] < mesh.bounds[1, 1]
+        assert np.all(np.isfinite(grid.upper)) and np.all(grid.upper >= grid.lower)
+
+
+def test_load_triangles_from_mesh_and_binary_stl(tmp_path: Path) -> None:
+    mesh = trimesh.creation.box(extents=(4.0, 2.0, 1.0))
+    path = tmp_path / "box.stl"
+    mesh.export(path)
+
+    np.testing.assert_allclose(load_triangles(mesh), mesh.triangles)
+    triangles = load_triangles(path)
+    assert triangles.dtype == np.float64
+    np.testing.assert_allclose(triangles, mesh.triangles, atol=1e-6)
@@ -0,0 +1,100 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.cross_section import sample_cross_section
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.nesting import export_nested_sheets, nest_fold_patterns, pack_rectangles
+from kirigami_honeycomb.segments import SegmentKind, build_segment_table
+
+
+def _overlaps(first, second, spacing=0.0):
+    gap = spacing - 1e-9
+    return not (
+        first.x + first.width + gap <= second.x
+        or second.x + second.width + gap <= first.x
+        or first.y + first.height + gap <= second.y
+        or second.y + second.height + gap <= first.y
+    )
+
+
+def test_pack_rectangles_places_parts_without_overlap():
+    sizes = np.random.default_rng(3).uniform(10.0, 120.0, size=(200, 2))
+
+    placements = pack_rectangles(sizes, sheet_width=500.0, sheet_height=300.0, spacing=1.0)
+
+    assert [placement.part for placement in placements] == list(range(200))
+    sheets = {placement.sheet for placement in placements}
+    assert len(sheets) <= int(np.ceil(sizes.prod(axis=1).sum() / (500.0 * 300.0) * 1.4))
+    for sheet in sheets:
+        placed = [placement for placement in placements if placement.sheet == sheet]
+        for index, first in enumerate(placed):
+            assert first.x + first.width <= 500.0 + 1e-9 and first.y + first.height <= 300.0 + 1e-9
+            assert not any(_overlaps(first, second) for second in placed[index + 1 :])
+
+    with pytest.raises(ValueError):
+        pack_rectangles([[600.0, 10.0]], sheet_width=500.0, sheet_height=300.0)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_pack_rectangles_keeps_spacing_between_parts(seed):
+    rng = np.random.default_rng(seed)
+    spacing = rng.uniform(0.5, 15.0)
+    sizes = rng.uniform(5.0, 60.0, size=(40, 2))
+
+    placements = pack_rectangles(sizes, sheet_width=100.0, sheet_height=100.0, spacing=spacing)
+
+    for index, first in enumerate(placements):
+        assert first.x >= 0.0 and first.y >= 0.0
+        assert first.x + first.width <= 100.0 + 1e-9 and first.y + first.height <= 100.0 + 1e-9
+        for second in placements[index + 1 :]:
+            assert first.sheet != second.sheet or not _overlaps(first, second, spacing)
+
+
+def test_nest_fold_patterns_writes_one_file_per_sheet(tmp_path):
+    parts = []
+    for offset in (10.0, 20.0, 30.0, 40.0):
+        samples = sample_cross_section(
+            lambda x, offset=offset: offset + 0.1 * x,
+            lambda x: 0 * x,
+            domain=(0.0, 30.0),
+            cell_size=10.0,
+        )
+        parts.append((samples, compute_fold_pattern(samples)))
+
+    sheets = nest_fold_patterns(parts, panel_length=60.0, sheet_width=500.0, sheet_height=100.0)
+    paths = export_nested_sheets(sheets, tmp_path)
+
+    assert sum(len(sheet.placements) for sheet in sheets) == len(parts)
+    assert len(paths) == len(sheets) and all(path.exists() for path in paths)
+    for sheet in sheets:
+        assert sheet.segments.bounds[2:] == pytest.approx((500.0, 100.0))
+        assert 0.0 < sheet.utilisation <= 1.0
+
+
+def test_nested_diagrams_stay_inside_their_placements():
+    parts = []
+    for amplitude in (5.0, 10.0, 15.0, 20.0, 25.0, 30.0):
+        samples = sample_cross_section(
+            lambda x, amplitude=amplitude: 40 + amplitude * np.sin(np.asarray(x) / 30),
+            lambda x: 0 * x,
+            domain=(0.0, 200.0),
+            cell_size=20.0,
+        )
+        parts.append((samples, compute_fold_pattern(samples)))
+
+    sheets = nest_fold_patterns(parts, panel_length=100.0, sheet_width=1000.0, sheet_height=200.0)
+
+    for sheet in sheets:
+        # The border comes first, then every placed diagram in placement order.
+        offset = 4
+        for placement in sheet.placements:
+            count = len(build_segment_table(parts[placement.part][1], cell_size=20.0, panel_length=100.0))
+            part = slice(offset, offset + count)
+            offset += count
+            points = np.concatenate((sheet.segments.start[part], sheet.segments.end[part]))
+            assert np.all(points >= [placement.x - 1e-9, placement.y - 1e-9])
+            assert np.all(points <= [placement.x + placement.width + 1e-9, placement.y + placement.height + 1e-9])
+            assert np.all(points <= [sheet.width + 1e-9, sheet.height + 1e-9])
+            assert set(np.unique(sheet.segments.kind[part]).tolist()) <= {SegmentKind.CUT, SegmentKind.FOLD}
+        assert offset == len(sheet.segments)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+from kirigami_honeycomb.ply import write_ply
+
+
+def test_write_ply_is_readable_by_trimesh(tmp_path: Path) -> None:
+    mesh = trimesh.creation.box(extents=(4.0, 2.0, 1.0))
+    path = tmp_path / "box.ply"
+
+    write_ply(path, mesh.vertices, mesh.faces, chunk_size=5)
+
+    loaded = trimesh.load_mesh(path, process=False)
+    np.testing.assert_allclose(loaded.vertices, mesh.vertices, atol=1e-6)
+    np.testing.assert_array_equal(loaded.faces, mesh.faces)
@@ -0,0 +1,35 @@
+import struct
+import zlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.raster import parse_color, rasterize_segments, render_strokes, write_png
+
+
+def test_rasterize_segments_covers_line_pixels_only():
+    coverage = rasterize_segments((20, 30), [[2.0, 10.5]], [[28.0, 10.5]], width=1.0)
+
+    assert coverage.shape == (20, 30)
+    np.testing.assert_allclose(coverage[10, 4:26], 1.0, atol=0.05)
+    assert coverage[5].max() == 0.0
+    assert coverage[:, 0].max() == 0.0
+
+
+def test_write_png_round_trips_pixel_data(tmp_path):
+    image = render_strokes((8, 12), [([[0.0, 4.0]], [[12.0, 4.0]], "#c41", 2.0)])
+    path = tmp_path / "preview.png"
+
+    write_png(path, image)
+
+    data = path.read_bytes()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", data[16:24])
+    assert (width, height) == (12, 8)
+    length = struct.unpack(">I", data[33:37])[0]
+    assert data[37:41] == b"IDAT"
+    scanlines = np.frombuffer(zlib.decompress(data[41 : 41 + length]), dtype=np.uint8).reshape(8, 1 + 12 * 3)
+    np.testing.assert_array_equal(scanlines[:, 1:].reshape(8, 12, 3), image)
+    np.testing.assert_array_equal(image[0, 0], [255, 255, 255])
+    np.testing.assert_allclose(image[3, 6], parse_color("#c41"), atol=2)
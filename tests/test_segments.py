@@ -0,0 +1,109 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.cross_section import sample_cross_section
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.segments import (
+    SegmentKind,
+    SegmentTable,
+    build_segment_table,
+    chain_segments,
+    merge_collinear_segments,
+)
+
+
+def test_build_segment_table_matches_legacy_classification():
+    samples = sample_cross_section(
+        lambda x: 0.002 * x**2 - 0.4 * x + 40,
+        lambda x: 10 * np.sin(2 * np.pi * x / 200),
+        domain=(0.0, 200.0),
+        cell_size=20.0,
+    )
+    pattern = compute_fold_pattern(samples)
+    layout = pattern.vertex_layout(cell_size=20.0, panel_length=100.0)
+
+    table = build_segment_table(pattern, cell_size=20.0, panel_length=100.0)
+
+    vx, vy = layout.x, layout.y
+    num, num_lines = layout.shape
+    expected = []
+    for k in range(num_lines):
+        kind = SegmentKind.CUT if k in (0, num_lines - 1) else SegmentKind.FOLD
+        expected.append((vx[0, k], vy[k], vx[-1, k], vy[k], kind))
+    for i in range(num):
+        for k in range(num_lines - 1):
+            if i in (0, num - 1):
+                kind = SegmentKind.CUT
+            else:
+                sel = (k + ((i + 1) % 2) * 2) % 4
+                kind = SegmentKind.FOLD if sel == 2 else SegmentKind.CUT
+            expected.append((vx[i, k], vy[k], vx[i, k + 1], vy[k + 1], kind))
+    expected = np.asarray(expected)
+
+    assert len(table) == expected.shape[0]
+    assert table.kind.dtype == np.uint8
+    np.testing.assert_allclose(table.start, expected[:, 0:2])
+    np.testing.assert_allclose(table.end, expected[:, 2:4])
+    np.testing.assert_array_equal(table.kind, expected[:, 4])
+
+
+def test_segment_table_select_and_concatenate():
+    table = SegmentTable(
+        start=[[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]],
+        end=[[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]],
+        kind=[SegmentKind.CUT, SegmentKind.FOLD, SegmentKind.CUT],
+    )
+
+    cuts = table.select(SegmentKind.CUT)
+    joined = SegmentTable.concatenate([cuts, table.select(SegmentKind.FOLD)])
+
+    assert len(cuts) == 2
+    np.testing.assert_allclose(cuts.lengths, [1.0, 3.0])
+    assert joined.bounds == (0.0, 0.0, 2.0, 3.0)
+    np.testing.assert_array_equal(joined.kind, [0, 0, 1])
+
+
+def test_chain_segments_joins_touching_segments_per_kind():
+    table = SegmentTable(
+        start=[[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [2.0, 1.0], [5.0, 5.0]],
+        end=[[1.0, 0.0], [2.0, 0.0], [2.0, 1.0], [3.0, 1.0], [6.0, 5.0]],
+        kind=[SegmentKind.CUT, SegmentKind.CUT, SegmentKind.CUT, SegmentKind.FOLD, SegmentKind.CUT],
+    )
+
+    polylines = chain_segments(table)
+
+    assert len(polylines) == 3
+    lengths = polylines.to_segments().lengths.sum()
+    assert lengths == pytest.approx(table.lengths.sum())
+    corners = [polylines.polyline(index).tolist() for index in range(len(polylines))]
+    assert [[0.0, 0.0], [2.0, 0.0], [2.0, 1.0]] in corners or [[2.0, 1.0], [2.0, 0.0], [0.0, 0.0]] in corners
+
+
+def test_merge_collinear_segments_joins_runs_and_drops_duplicates():
+    table = SegmentTable(
+        start=[[0.0, 0.0], [2.5, 0.0], [1.0, 0.0], [1.0, 0.0], [3.0, 0.0], [0.0, 0.0], [4.0, 4.0]],
+        end=[[1.0, 0.0], [1.0, 0.0], [2.0, 0.0], [2.0, 0.0], [4.0, 0.0], [1.0, 0.0], [4.0, 4.0]],
+        kind=[SegmentKind.CUT] * 5 + [SegmentKind.FOLD, SegmentKind.CUT],
+    )
+
+    merged = merge_collinear_segments(table)
+
+    spans = sorted(zip(merged.kind.tolist(), merged.start.tolist(), merged.end.tolist()))
+    assert spans == [
+        (SegmentKind.CUT, [0.0, 0.0], [2.5, 0.0]),
+        (SegmentKind.CUT, [3.0, 0.0], [4.0, 0.0]),
+        (SegmentKind.FOLD, [0.0, 0.0], [1.0, 0.0]),
+    ]
+
+
+def test_merge_collinear_segments_keeps_diagram_length():
+    samples = sample_cross_section(lambda x: 30 + 0 * x, lambda x: 0 * x, domain=(0.0, 100.0), cell_size=10.0)
+    table = build_segment_table(compute_fold_pattern(samples), cell_size=10.0, panel_length=60.0)
+
+    merged = merge_collinear_segments(table)
+
+    assert len(merged) < len(table)
+    for kind in (SegmentKind.CUT, SegmentKind.FOLD):
+        assert merged.select(kind).lengths.sum() <= table.select(kind).lengths.sum() + 1e-9
+    assert merged.bounds == pytest.approx(table.bounds)
@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.cross_section import linearize_cross_section, sample_cross_section
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.simulation import simulate_folding, verify_folding
+
+
+def _samples():
+    return sample_cross_section(
+        lambda x: 0.002 * x**2 - 0.4 * x + 40,
+        lambda x: 10 * np.sin(2 * np.pi * x / 200),
+        domain=(0.0, 200.0),
+        cell_size=20.0,
+    )
+
+
+def test_linearised_pattern_folds_onto_cross_section():
+    samples = linearize_cross_section(_samples())
+    report = verify_folding(compute_fold_pattern(samples), samples, panel_length=100.0)
+
+    assert report.max_deviation < 1e-9
+    assert report.folded.seam_error < 1e-9
+    # Only the outer sides of the first and last slit lines have no ribbon.
+    assert np.isnan(report.deviation).sum() == 2 * report.deviation.shape[1]
+
+
+def test_raw_samples_report_a_deviation():
+    samples = _samples()
+    report = verify_folding(compute_fold_pattern(samples), samples, panel_length=100.0)
+
+    assert report.max_deviation > 1.0
+
+
+def test_simulated_strips_keep_their_shape():
+    samples = linearize_cross_section(_samples())
+    pattern = compute_fold_pattern(samples)
+    folded = simulate_folding(pattern, cell_size=20.0, panel_length=100.0)
+    layout = pattern.vertex_layout(cell_size=20.0, panel_length=100.0)
+
+    # Folding is rigid: distances within the first ribbon match those in the diagram.
+    left = folded.positions[0, :, 1]
+    right = folded.positions[1, :, 0]
+    flat_left = np.column_stack((layout.x[0], layout.y))
+    flat_right = np.column_stack((layout.x[1], layout.y))
+    np.testing.assert_allclose(np.linalg.norm(right - left, axis=1), np.linalg.norm(flat_right - flat_left, axis=1))
+    np.testing.assert_allclose(
+        np.linalg.norm(np.diff(left, axis=0), axis=1), np.linalg.norm(np.diff(flat_left, axis=0), axis=1)
+    )
@@ -0,0 +1,92 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+trimesh = pytest.importorskip("trimesh")
+
+from kirigami_honeycomb.cross_section import sample_cross_section
+from kirigami_honeycomb.honeycomb import build_honeycomb_mesh
+from kirigami_honeycomb.spatial import attach_triangle_grid, build_triangle_grid, intersect_walls, share_triangle_grid
+
+
+def _honeycomb():
+    samples = sample_cross_section(lambda x: 60 + 0 * x, lambda x: 0 * x, domain=(0.0, 200.0), cell_size=10.0)
+    return build_honeycomb_mesh(samples, panel_length=150.0)
+
+
+def test_triangle_grid_candidates_match_brute_force():
+    sphere = trimesh.creation.icosphere(subdivisions=3, radius=10.0)
+    grid = build_triangle_grid(sphere.triangles)
+    rng = np.random.default_rng(2)
+    low = rng.uniform(-12.0, 10.0, size=(50, 3))
+    high = low + rng.uniform(0.0, 4.0, size=(50, 3))
+
+    boxes, triangles = grid.candidate_pairs(low, high)
+
+    tri_low = sphere.triangles.min(axis=1)
+    tri_high = sphere.triangles.max(axis=1)
+    overlap = np.all((tri_low[None] <= high[:, None]) & (tri_high[None] >= low[:, None]), axis=2)
+    expected_boxes, expected_triangles = np.nonzero(overlap)
+    np.testing.assert_array_equal(boxes, expected_boxes)
+    np.testing.assert_array_equal(triangles, expected_triangles)
+
+
+def test_closest_points_match_brute_force():
+    sphere = trimesh.creation.icosphere(subdivisions=2, radius=10.0)
+    grid = build_triangle_grid(sphere.triangles)
+    points = np.random.default_rng(3).uniform(-20.0, 20.0, size=(300, 3))
+
+    distance, triangle, closest = grid.closest_points(points, chunk_size=64)
+
+    _, expected, _ = trimesh.proximity.closest_point_naive(sphere, points)
+    np.testing.assert_allclose(distance, expected, atol=1e-9)
+    np.testing.assert_allclose(np.linalg.norm(closest - points, axis=1), distance, atol=1e-9)
+    assert np.all((triangle >= 0) & (triangle < len(sphere.faces)))
+
+
+def test_intersect_walls_returns_sphere_cuts_inside_walls():
+    mesh = _honeycomb()
+    sphere = trimesh.creation.icosphere(subdivisions=4, radius=40.0)
+    sphere.apply_translation([100.0, 75.0, 30.0])
+
+    result = intersect_walls(sphere.triangles, mesh)
+
+    assert len(result) > 0
+    assert np.all(np.diff(result.wall) >= 0)
+    radius = np.linalg.norm(np.vstack((result.start, result.end)) - [100.0, 75.0, 30.0], axis=1)
+    assert radius.max() <= 40.0 + 1e-9 and radius.min() > 39.5
+    assert np.all((result.local_start[:, 1] >= -1e-9) & (result.local_start[:, 1] <= 60.0 + 1e-9))
+
+    quads = mesh.wall_quads[result.wall]
+    direction = result.wall_direction[result.wall]
+    normal = np.column_stack((-direction[:, 1], direction[:, 0]))
+    offset = np.einsum("ij,ij->i", result.start[:, :2] - quads[:, 0, :2], normal)
+    np.testing.assert_allclose(offset, 0.0, atol=1e-9)
+
+    wall = int(np.bincount(result.wall).argmax())
+    polylines = result.polylines(wall)
+    first, last = result.offsets[wall : wall + 2]
+    chained = sum(np.linalg.norm(np.diff(line, axis=0), axis=1).sum() for line in polylines)
+    assert chained == pytest.approx(np.linalg.norm(result.end[first:last] - result.start[first:last], axis=1).sum())
+
+
+def test_intersect_walls_with_processes_matches_serial():
+    mesh = _honeycomb()
+    sphere = trimesh.creation.icosphere(subdivisions=3, radius=30.0)
+    sphere.apply_translation([80.0, 60.0, 20.0])
+
+    serial = intersect_walls(sphere.triangles, mesh, chunk_size=100)
+    pooled = intersect_walls(sphere.triangles, mesh, processes=2)
+
+    np.testing.assert_array_equal(serial.wall, pooled.wall)
+    np.testing.assert_allclose(serial.start, pooled.start)
+
+
+def test_shared_triangle_grid_round_trips():
+    sphere = trimesh.creation.icosphere(subdivisions=2, radius=10.0)
+    grid = build_triangle_grid(sphere.triangles)
+    points = np.random.default_rng(4).uniform(-15.0, 15.0, size=(40, 3))
+
+    with share_triangle_grid(grid) as handle, attach_triangle_grid(handle) as attached:
+        assert attached.shape == grid.shape and attached.cell_size == grid.cell_size
+        np.testing.assert_array_equal(attached.triangle_ids, grid.triangle_ids)
+        np.testing.assert_allclose(attached.closest_points(points)[0], grid.closest_points(points)[0])
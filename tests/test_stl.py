@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import trimesh
+
+from kirigami_honeycomb.stl import is_binary_stl, read_stl_triangles, write_stl
+
+
+def test_read_stl_triangles_maps_binary_file(tmp_path: Path) -> None:
+    mesh = trimesh.creation.box(extents=(4.0, 2.0, 1.0))
+    path = tmp_path / "box.stl"
+    mesh.export(path)
+
+    triangles = read_stl_triangles(path)
+
+    assert is_binary_stl(path)
+    assert triangles.shape == (len(mesh.faces), 3, 3)
+    assert triangles.dtype == np.float32
+    assert not triangles.flags.writeable
+    np.testing.assert_allclose(triangles, mesh.triangles, atol=1e-6)
+
+
+def test_read_stl_triangles_rejects_ascii_files(tmp_path: Path) -> None:
+    path = tmp_path / "ascii.stl"
+    path.write_text(trimesh.exchange.stl.export_stl_ascii(trimesh.creation.box()))
+
+    assert not is_binary_stl(path)
+    with pytest.raises(ValueError):
+        read_stl_triangles(path)
+
+
+def test_write_stl_round_trips_through_trimesh(tmp_path: Path) -> None:
+    mesh = trimesh.creation.icosphere(subdivisions=2)
+    whole = tmp_path / "whole.stl"
+    chunked = tmp_path / "chunked.stl"
+
+    write_stl(whole, mesh.vertices, mesh.faces)
+    write_stl(chunked, mesh.vertices, mesh.faces, chunk_size=7)
+
+    assert whole.read_bytes() == chunked.read_bytes()
+    np.testing.assert_allclose(read_stl_triangles(whole), mesh.triangles, atol=1e-6)
+    loaded = trimesh.load_mesh(whole)
+    np.testing.assert_allclose(loaded.face_normals, mesh.face_normals, atol=1e-5)
@@ -1,6 +1,11 @@
+import xml.etree.ElementTree as ElementTree
+
+import numpy as np
+
 from kirigami_honeycomb.cross_section import sample_cross_section
 from kirigami_honeycomb.fold_pattern import compute_fold_pattern
-from kirigami_honeycomb.svg import export_fold_diagram
+from kirigami_honeycomb.segments import build_segment_table
+from kirigami_honeycomb.svg import export_fold_diagram, export_fold_diagram_fast, export_segment_table
 
 
 def test_export_fold_diagram_png(tmp_path) -> None:
@@ -17,3 +22,38 @@ def test_export_fold_diagram_png(tmp_path) -> None:
 
     assert output.exists()
     assert output.stat().st_size > 0
+    assert output.read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+
+
+def test_export_fold_diagram_fast_merges_lines_into_one_path(tmp_path) -> None:
+    samples = sample_cross_section(
+        lambda x: 0.1 * x + 20,
+        lambda x: -0.05 * x,
+        domain=(0.0, 40.0),
+        cell_size=10.0,
+    )
+    pattern = compute_fold_pattern(samples)
+    output = tmp_path / "diagram.svg"
+
+    export_fold_diagram_fast(samples, pattern, output)
+
+    root = ElementTree.parse(output).getroot()
+    namespace = "{http://www.w3.org/2000/svg}"
+    paths = root.findall(f"{namespace}path")
+    assert len(paths) == 1
+    positions = np.unique(np.concatenate((pattern.a_positions, pattern.b_positions)))
+    assert paths[0].get("d").count("M") == positions.size
+    assert len(root.findall(f"{namespace}polyline")) == 2
+    assert float(root.get("width")) == pattern.length + 2 * samples.cell_size
+
+
+def test_export_segment_table_writes_one_path_per_kind(tmp_path) -> None:
+    samples = sample_cross_section(lambda x: 20 + 0 * x, lambda x: 0 * x, domain=(0.0, 40.0), cell_size=10.0)
+    table = build_segment_table(compute_fold_pattern(samples), cell_size=10.0, panel_length=50.0)
+    output = tmp_path / "segments.svg"
+
+    export_segment_table(table, output)
+
+    paths = ElementTree.parse(output).getroot().findall("{http://www.w3.org/2000/svg}path")
+    assert [path.get("stroke") for path in paths] == ["black", "green"]
+    assert sum(path.get("d").count("M") for path in paths) == len(table)
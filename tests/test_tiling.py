@@ -0,0 +1,84 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.cross_section import sample_cross_section
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.segments import SegmentKind, SegmentTable, build_segment_table
+from kirigami_honeycomb.tiling import choose_sheet_boundaries, clip_segments, export_sheets, tile_fold_pattern
+
+
+def test_clip_segments_to_rectangle():
+    table = SegmentTable(
+        start=[[-1.0, 0.5], [0.2, 0.2], [2.0, 2.0], [0.5, -1.0]],
+        end=[[2.0, 0.5], [0.8, 0.8], [3.0, 3.0], [0.5, 0.5]],
+        kind=[0, 1, 0, 0],
+    )
+
+    clipped = clip_segments(table, (0.0, 0.0, 1.0, 1.0))
+
+    np.testing.assert_allclose(clipped.start, [[0.0, 0.5], [0.2, 0.2], [0.5, 0.0]])
+    np.testing.assert_allclose(clipped.end, [[1.0, 0.5], [0.8, 0.8], [0.5, 0.5]])
+    np.testing.assert_array_equal(clipped.kind, [0, 1, 0])
+
+
+def test_clip_segments_drops_segments_touching_the_boundary():
+    table = SegmentTable(
+        start=[[0.5, -0.5], [1.0, 0.25], [0.5, 0.5]],
+        end=[[1.5, 0.5], [2.0, 0.25], [1.5, 0.5]],
+        kind=[0, 0, 1],
+    )
+
+    clipped = clip_segments(table, (0.0, 0.0, 1.0, 1.0))
+
+    np.testing.assert_allclose(clipped.start, [[0.5, 0.5]])
+    np.testing.assert_allclose(clipped.end, [[1.0, 0.5]])
+    np.testing.assert_array_equal(clipped.kind, [1])
+
+
+def test_choose_sheet_boundaries_uses_candidate_positions():
+    boundaries = choose_sheet_boundaries([1.0, 2.0, 3.5, 5.0, 6.0], low=0.0, high=7.0, max_size=3.0)
+
+    np.testing.assert_allclose(boundaries, [0.0, 2.0, 5.0, 7.0])
+    with pytest.raises(ValueError):
+        choose_sheet_boundaries([5.0], low=0.0, high=7.0, max_size=3.0)
+
+
+def test_tile_fold_pattern_covers_diagram(tmp_path):
+    samples = sample_cross_section(lambda x: 30 + 0.1 * x, lambda x: 0 * x, domain=(0.0, 200.0), cell_size=10.0)
+    pattern = compute_fold_pattern(samples)
+    table = build_segment_table(pattern, cell_size=10.0, panel_length=100.0)
+
+    sheets = tile_fold_pattern(pattern, cell_size=10.0, panel_length=100.0, max_width=400.0, max_height=60.0)
+
+    assert len(sheets) > 2
+    for sheet in sheets:
+        min_x, min_y, max_x, max_y = sheet.segments.bounds
+        assert max_x - min_x <= 400.0 + 1e-9 and max_y - min_y <= 60.0 + 1e-9
+        lines = sheet.segments.select(SegmentKind.CUT), sheet.segments.select(SegmentKind.FOLD)
+        lines = SegmentTable.concatenate(lines)
+        assert np.all(lines.start >= np.subtract(sheet.bounds[:2], 1e-9))
+        assert np.all(lines.end <= np.add(sheet.bounds[2:], 1e-9))
+    # Lines on shared sheet boundaries appear on both sheets.
+    kinds = (SegmentKind.CUT, SegmentKind.FOLD)
+    diagram = sum(sheet.segments.select(kind).lengths.sum() for sheet in sheets for kind in kinds)
+    assert diagram >= table.lengths.sum() - 1e-6
+    assert all(np.any(sheet.segments.kind == SegmentKind.MARK) for sheet in sheets)
+
+    paths = export_sheets(sheets, tmp_path)
+    assert [path.name for path in paths][:1] == ["sheet_r00_c00.svg"]
+    assert all(path.exists() for path in paths)
+
+
+@pytest.mark.parametrize("max_width, max_height", [(396.0, 57.8), (250.0, 30.0)])
+def test_tiled_sheets_with_marks_fit_the_cutter(max_width, max_height):
+    samples = sample_cross_section(lambda x: 30 + 0.1 * x, lambda x: 0 * x, domain=(0.0, 200.0), cell_size=10.0)
+    pattern = compute_fold_pattern(samples)
+
+    sheets = tile_fold_pattern(
+        pattern, cell_size=10.0, panel_length=100.0, max_width=max_width, max_height=max_height, mark_size=2.0
+    )
+
+    for sheet in sheets:
+        min_x, min_y, max_x, max_y = sheet.segments.bounds
+        assert max_x - min_x <= max_width + 1e-9 and max_y - min_y <= max_height + 1e-9
@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kirigami_honeycomb.cross_section import linearize_cross_section, sample_cross_section
+from kirigami_honeycomb.fold_pattern import compute_fold_pattern
+from kirigami_honeycomb.honeycomb import build_honeycomb_mesh
+from kirigami_honeycomb.segments import SegmentKind
+from kirigami_honeycomb.spatial import WallIntersections
+from kirigami_honeycomb.unfolding import build_unfolding_map, unfold_intersections
+
+
+def _setup():
+    samples = linearize_cross_section(
+        sample_cross_section(
+            lambda x: 0.002 * x**2 - 0.4 * x + 40,
+            lambda x: 10 * np.sin(2 * np.pi * x / 200),
+            domain=(0.0, 200.0),
+            cell_size=20.0,
+        )
+    )
+    return samples, compute_fold_pattern(samples)
+
+
+def test_unfolding_maps_wall_corners_onto_diagram_bands():
+    samples, pattern = _setup()
+    mesh = build_honeycomb_mesh(samples, panel_length=100.0)
+    unfolding = build_unfolding_map(pattern, samples, panel_length=100.0)
+    layout = pattern.vertex_layout(cell_size=20.0, panel_length=100.0)
+    assert len(unfolding) == mesh.wall_count
+
+    quads = mesh.wall_quads
+    walls = np.arange(len(unfolding))
+    ribbon, band = np.divmod(walls, unfolding.walls_per_ribbon)
+    top = unfolding.apply(walls, quads[:, 0])
+    bottom = unfolding.apply(walls, quads[:, 3])
+
+    even = ribbon % 2 == 0
+    left = layout.x[ribbon, band]
+    right = layout.x[ribbon + 1, band]
+    np.testing.assert_allclose(top[:, 0], np.where(even, right, left), atol=1e-9)
+    np.testing.assert_allclose(bottom[:, 0], np.where(even, left, right), atol=1e-9)
+    np.testing.assert_allclose(top[:, 1], layout.y[band], atol=1e-9)
+
+
+def test_unfold_intersections_emits_perforations():
+    samples, pattern = _setup()
+    mesh = build_honeycomb_mesh(samples, panel_length=100.0)
+    unfolding = build_unfolding_map(pattern, samples, panel_length=100.0)
+    quads = mesh.wall_quads[:3]
+    middle = (quads[:, 0] + quads[:, 3]) / 2
+    intersections = WallIntersections(
+        wall=np.arange(3),
+        start=middle,
+        end=(quads[:, 1] + quads[:, 2]) / 2,
+        local_start=np.zeros((3, 2)),
+        local_end=np.zeros((3, 2)),
+        wall_origin=np.zeros((mesh.wall_count, 3)),
+        wall_direction=np.zeros((mesh.wall_count, 3)),
+    )
+
+    table = unfold_intersections(intersections, unfolding)
+
+    assert np.all(table.kind == SegmentKind.PERFORATION)
+    np.testing.assert_allclose(table.start, unfolding.apply(np.arange(3), middle))